@@ -0,0 +1,52 @@
+"""
+Benchmark for bulk reads against a latency-injecting local stub.
+
+Reads `user_base_coin` of many users one blocking call after another, then
+through ApiClient.bulk_read on a thread pool and AsyncApiClient.bulk_read.
+
+Run with `python -m benchmarks.bench_bulk_read`.
+"""
+import asyncio
+import time
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.async_api_client import AsyncApiClient
+from sdk.session import PoolConfig
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+USERS = 200
+LATENCY = 0.02
+CONCURRENCY = 32
+
+
+def report(label, elapsed):
+    print(f"{label:22s}: {elapsed:6.2f} s, {USERS / elapsed:8.1f} reads/s")
+
+
+def main():
+    user_ids = [f"user-{index}" for index in range(USERS)]
+    auth = ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator())
+    pool_config = PoolConfig(max_connections_per_host=CONCURRENCY)
+    with StubServer(latency=LATENCY) as server:
+        api_client = ApiClient(base_url=server.base_url, auth=auth, pool_config=pool_config)
+
+        started = time.perf_counter()
+        for user_id in user_ids:
+            api_client.user_base_coin(user_id)
+        report("serial", time.perf_counter() - started)
+
+        started = time.perf_counter()
+        api_client.bulk_read("user_base_coin", user_ids, max_workers=CONCURRENCY)
+        report("bulk_read (threads)", time.perf_counter() - started)
+
+        async def read_async():
+            async with AsyncApiClient(base_url=server.base_url, auth=auth, pool_config=pool_config) as async_api_client:
+                started = time.perf_counter()
+                await async_api_client.bulk_read("user_base_coin", user_ids, max_workers=CONCURRENCY)
+                report("bulk_read (asyncio)", time.perf_counter() - started)
+
+        asyncio.run(read_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark for flattening large list-of-object request bodies.
+
+Flattens multi-mint bodies carrying 10, 100 and 1000 `mintList` entries and
+reports the cost per entry, which should stay flat as the list grows. When
+the native extension is built, the pure-Python path is measured as well.
+
+Run with `python -m benchmarks.bench_flattener`.
+"""
+import timeit
+from unittest import mock
+from sdk import request_flattener
+from sdk.request_flattener import RequestBodyFlattener
+
+EXPECTED_MULTI_MINT = "mintList.meta=,New nft 2 meta information&mintList.name=NewNFT,NewNFT2&mintList.tokenType=10000001,10000003&ownerAddress=tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq&ownerSecret=uhbdnNvIqQFnnIFDDG8EuVxtqkwsLtDR/owKInQIYmo=&toAddress=tlink18zxqds28mmg8mwduk32csx5xt6urw93ycf8jwp"
+
+
+def multi_mint_body(size):
+    mint_list = []
+    for index in range(size):
+        item = {'tokenType': '10000001', 'name': f'NewNFT{index}'}
+        if index % 2:
+            item['meta'] = f'New nft {index} meta information'
+        mint_list.append(item)
+    return {
+        'ownerAddress': 'tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq',
+        'ownerSecret': 'uhbdnNvIqQFnnIFDDG8EuVxtqkwsLtDR/owKInQIYmo=',
+        'toAddress': 'tlink18zxqds28mmg8mwduk32csx5xt6urw93ycf8jwp',
+        'mintList': mint_list
+    }
+
+
+def run(flattener, label):
+    for size in (10, 100, 1000):
+        body = multi_mint_body(size)
+        number = max(1, 100000 // size)
+        elapsed = min(timeit.repeat(lambda: flattener.flatten(body), number=number, repeat=5)) / number
+        print(f"{label:6s} {size:5d} entries: {elapsed * 1e6:10.2f} us/flatten {elapsed * 1e9 / size:8.1f} ns/entry")
+
+
+
+def main():
+    flattener = RequestBodyFlattener()
+    reference = {
+        'ownerAddress': 'tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq',
+        'ownerSecret': 'uhbdnNvIqQFnnIFDDG8EuVxtqkwsLtDR/owKInQIYmo=',
+        'toAddress': 'tlink18zxqds28mmg8mwduk32csx5xt6urw93ycf8jwp',
+        'mintList': [
+            {'tokenType': '10000001', 'name': 'NewNFT'},
+            {'tokenType': '10000003', 'name': 'NewNFT2', 'meta': 'New nft 2 meta information'}
+        ]
+    }
+    assert flattener.flatten(reference) == EXPECTED_MULTI_MINT
+
+    run(flattener, "native" if request_flattener._speedups is not None else "python")
+    if request_flattener._speedups is not None:
+        with mock.patch.object(request_flattener, "_speedups", None):
+            assert flattener.flatten(reference) == EXPECTED_MULTI_MINT
+            run(flattener, "python")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark for the cold start cost of importing sdk.api_client.
+
+Runs `python -X importtime -c "import sdk.api_client"` in fresh interpreters
+and reports the median time of the import, split into uplink (and the http
+clients it imports) and the modules of this sdk. Bytecode is compiled first,
+as it is in an installed package.
+
+Run with `python -m benchmarks.bench_import`.
+"""
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 15
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times():
+    """Return dict of module name to (self, cumulative) microseconds of one cold import."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sdk.api_client"],
+        cwd=ROOT, capture_output=True, text=True, check=True).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        (own, cumulative, name) = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main():
+    compileall.compile_dir(os.path.join(ROOT, "sdk"), quiet=1)
+    runs = [import_times() for _ in range(RUNS)]
+    total = statistics.median(times["sdk.api_client"][1] for times in runs)
+    uplink = statistics.median(times["uplink"][1] for times in runs)
+    sdk = statistics.median(sum(own for (name, (own, _)) in times.items() if name.startswith("sdk")) for times in runs)
+    api_client = statistics.median(times["sdk.api_client"][0] for times in runs)
+    print(f"import sdk.api_client  {total / 1e3:7.1f} ms (median of {RUNS} cold imports)")
+    print(f"  uplink               {uplink / 1e3:7.1f} ms")
+    print(f"  sdk modules          {sdk / 1e3:7.1f} ms, of which sdk.api_client {api_client / 1e3:5.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark for decoding large list pages and encoding request bodies.
+
+Decodes `service_wallet_transactions` pages shaped like recorded responses of
+developers api, with 100 and 1000 transactions, with every available codec,
+and encodes a 1000 entry multi-mint body.
+
+Run with `python -m benchmarks.bench_json_codec`.
+"""
+import json
+import timeit
+from sdk import json_codec
+from sdk.json_codec import OrjsonCodec, StdlibJsonCodec
+
+
+def transaction(index):
+    return {
+        "height": 1000000 + index,
+        "txhash": f"{index:064X}",
+        "index": 0,
+        "code": 0,
+        "logs": [{
+            "msg_index": 0,
+            "success": True,
+            "log": "",
+            "events": [{
+                "type": "message",
+                "attributes": [
+                    {"key": "module", "value": "collection"},
+                    {"key": "sender", "value": "tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq"},
+                    {"key": "contract_id", "value": "61e14383"},
+                ],
+            }],
+        }],
+        "gasWanted": 300000,
+        "gasUsed": 164829,
+        "tx": {
+            "type": "cosmos-sdk/StdTx",
+            "value": {
+                "msg": [{
+                    "type": "collection/MsgTransferNFT",
+                    "value": {
+                        "from": "tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq",
+                        "contractId": "61e14383",
+                        "to": "tlink18zxqds28mmg8mwduk32csx5xt6urw93ycf8jwp",
+                        "tokenIds": [f"10000001{index:08x}"],
+                    },
+                }],
+                "fee": {"gas": "300000", "amount": [{"denom": "tcony", "amount": "1"}]},
+                "memo": f"transfer {index}",
+            },
+        },
+        "timestamp": 1615185120000 + index,
+    }
+
+
+def page(size):
+    return json.dumps({
+        "responseTime": 1615185127000,
+        "statusCode": 1000,
+        "statusMessage": "Success",
+        "responseData": [transaction(index) for index in range(size)],
+    }).encode("utf-8")
+
+
+def multi_mint_body(size):
+    return {
+        "ownerAddress": "tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq",
+        "ownerSecret": "uhbdnNvIqQFnnIFDDG8EuVxtqkwsLtDR/owKInQIYmo=",
+        "toAddress": "tlink18zxqds28mmg8mwduk32csx5xt6urw93ycf8jwp",
+        "mintList": [{"tokenType": "10000001", "name": f"NewNFT{index}", "meta": f"meta {index}"} for index in range(size)],
+    }
+
+
+def main():
+    codecs = [StdlibJsonCodec()] + ([OrjsonCodec()] if json_codec.orjson is not None else [])
+    for size in (100, 1000):
+        data = page(size)
+        number = max(1, 2000 // size)
+        for codec in codecs:
+            assert codec.loads(data)["responseData"][size - 1]["height"] == 1000000 + size - 1
+            elapsed = min(timeit.repeat(lambda: codec.loads(data), number=number, repeat=5)) / number
+            print(f"decode {codec.name:7s} {size:5d} transactions ({len(data) / 1024:7.1f} KiB): {elapsed * 1e3:8.3f} ms/page")
+
+    body = multi_mint_body(1000)
+    for codec in codecs:
+        elapsed = min(timeit.repeat(lambda: codec.dumps(body), number=100, repeat=5)) / 100
+        print(f"encode {codec.name:7s}  1000 entry multi-mint body: {elapsed * 1e3:8.3f} ms/body")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Benchmark for generating the Nonce header.
+
+Compares eight random.choice calls per nonce, as signing used to do, with
+NonceProvider handing out nonces from per-thread buffers filled by os.urandom.
+
+Run with `python -m benchmarks.bench_nonce`.
+"""
+import random
+import string
+import timeit
+from sdk.nonce import NonceProvider
+
+NUMBER = 200000
+
+
+def random_choice_nonce():
+    return "".join(random.choice(string.ascii_uppercase + string.ascii_lowercase + string.digits) for _ in range(8))
+
+
+def main():
+    provider = NonceProvider()
+    before = min(timeit.repeat(random_choice_nonce, number=NUMBER, repeat=5)) / NUMBER
+    after = min(timeit.repeat(provider.next, number=NUMBER, repeat=5)) / NUMBER
+    print(f"random.choice x 8 : {before * 1e9:8.1f} ns/nonce")
+    print(f"NonceProvider     : {after * 1e9:8.1f} ns/nonce")
+    print(f"speedup           : {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
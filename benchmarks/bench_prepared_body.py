@@ -0,0 +1,51 @@
+"""
+Benchmark for signing a request body and encoding it for the wire.
+
+Compares signing a multi-mint body and then encoding it with a JSON codec,
+two walks over the body, against SignatureGenerator.generate_with_body,
+which flattens and encodes it in one. When the native extension is built,
+the pure-Python path is measured as well; generate_with_body only takes the
+single pass with the native extension, so the flatten_and_encode line shows
+what the pure-Python single pass alone costs.
+
+Run with `python -m benchmarks.bench_prepared_body`.
+"""
+import timeit
+from unittest import mock
+from benchmarks.bench_flattener import multi_mint_body
+from sdk import json_codec, request_flattener, signature_generator
+from sdk.json_codec import OrjsonCodec, StdlibJsonCodec
+from sdk.request_flattener import RequestBodyFlattener
+from sdk.signature_generator import SignatureGenerator
+
+SECRET = "9256bf8a-2b86-42fe-b3e0-d3079d0141fe"
+ARGS = ("POST", "/v1/item-tokens/61e14383/non-fungibles/multi-mint", 1581850266351, "Bp0IqgXE", {})
+
+
+def run(label):
+    generator = SignatureGenerator()
+    flattener = RequestBodyFlattener()
+    codecs = [StdlibJsonCodec()] + ([OrjsonCodec()] if json_codec.orjson is not None else [])
+    for size in (10, 100, 1000):
+        body = multi_mint_body(size)
+        number = max(1, 20000 // size)
+        for codec in codecs:
+            def two_passes():
+                return generator.generate(SECRET, *ARGS, body), codec.dumps(body)
+            elapsed = min(timeit.repeat(two_passes, number=number, repeat=5)) / number
+            print(f"{label:6s} {size:5d} entries: generate + {codec.name:7s} {elapsed * 1e6:10.2f} us/request")
+        elapsed = min(timeit.repeat(lambda: generator.generate_with_body(SECRET, *ARGS, body), number=number, repeat=5)) / number
+        print(f"{label:6s} {size:5d} entries: generate_with_body {elapsed * 1e6:10.2f} us/request")
+        elapsed = min(timeit.repeat(lambda: flattener.flatten_and_encode(body), number=number, repeat=5)) / number
+        print(f"{label:6s} {size:5d} entries: flatten_and_encode {elapsed * 1e6:10.2f} us/request")
+
+
+def main():
+    run("native" if request_flattener._speedups is not None else "python")
+    if request_flattener._speedups is not None:
+        with mock.patch.object(request_flattener, "_speedups", None), mock.patch.object(signature_generator, "_speedups", None):
+            run("python")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark for memory held by decoded list records.
+
+Decodes pages of holders, item tokens and transactions as the client does,
+and compares memory held with tracemalloc when every record is kept as the
+decoded dict against keeping the compact records of sdk.records.
+
+Run with `python -m benchmarks.bench_records`.
+"""
+import json
+import tracemalloc
+from sdk.records import Holder, NonFungibleToken, TransactionSummary, to_records
+
+RECORDS = 100000
+PAGE_SIZE = 1000
+
+
+def holder(index):
+    return {"address": f"tlink1{index:038d}", "userId": f"U{index:032x}", "amount": str(index * 31)}
+
+
+def non_fungible_token(index):
+    return {"tokenType": f"1000000{index % 8}", "name": "Card",
+            "token": {"tokenIndex": f"{index:08x}", "name": "Card", "meta": f"serial {index}", "createdAt": 1581850266351}}
+
+
+def transaction(index):
+    return {
+        "height": index,
+        "txhash": f"{index:064X}",
+        "code": 0,
+        "index": 0,
+        "timestamp": 1581850266351 + index,
+        "gasUsed": 38700,
+        "logs": [{"msgIndex": 0, "success": True, "log": "", "events": [{"type": "message", "attributes": []}]}],
+        "tx": {"type": "cosmos-sdk/StdTx", "value": {"msg": [{"type": "token/MsgMint", "value": {"amount": "1000"}}], "memo": ""}},
+    }
+
+
+def pages(make_record):
+    for start in range(0, RECORDS, PAGE_SIZE):
+        yield json.dumps({"statusCode": 1000, "responseData": [make_record(index) for index in range(start, start + PAGE_SIZE)]})
+
+
+def held(make_record, record_type):
+    encoded_pages = list(pages(make_record))
+    tracemalloc.start()
+    kept = []
+    for page in encoded_pages:
+        records = json.loads(page)["responseData"]
+        kept += records if record_type is None else to_records(record_type, records)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    for (label, make_record, record_type) in (
+            ("holder", holder, Holder),
+            ("non-fungible token", non_fungible_token, NonFungibleToken),
+            ("transaction summary", transaction, TransactionSummary)):
+        as_dicts = held(make_record, None)
+        as_records = held(make_record, record_type)
+        print(f"{label:20s} {RECORDS} records: dicts {as_dicts / 2 ** 20:7.1f} MiB, "
+              f"records {as_records / 2 ** 20:7.1f} MiB ({as_dicts / as_records:4.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
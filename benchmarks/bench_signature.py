@@ -0,0 +1,37 @@
+"""
+Microbenchmark for per-request signing cost.
+
+Compares building a new HMAC for every signature against copying the key
+state prepared once by KeyedSigner.
+
+Run with `python -m benchmarks.bench_signature`.
+"""
+import base64
+import hashlib
+import hmac
+import timeit
+from sdk.signature_generator import KeyedSigner
+
+SECRET = "9256bf8a-2b86-42fe-b3e0-d3079d0141fe"
+SIGN_TARGET = b"Bp0IqgXE1581850266351GET/v1/wallets/tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq/transactions?page=2&msgType=coin/MsgSend"
+NUMBER = 100000
+
+
+def sign_with_new_hmac():
+    raw_hmac = hmac.new(bytes(SECRET, 'utf-8'), SIGN_TARGET, hashlib.sha512)
+    return base64.b64encode(raw_hmac.digest()).decode('utf-8')
+
+
+def main():
+    signer = KeyedSigner(SECRET)
+    assert signer.sign(SIGN_TARGET) == sign_with_new_hmac()
+
+    before = min(timeit.repeat(sign_with_new_hmac, number=NUMBER, repeat=5)) / NUMBER
+    after = min(timeit.repeat(lambda: signer.sign(SIGN_TARGET), number=NUMBER, repeat=5)) / NUMBER
+    print(f"hmac.new per request : {before * 1e6:8.3f} us/signature")
+    print(f"KeyedSigner.copy()   : {after * 1e6:8.3f} us/signature")
+    print(f"speedup              : {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
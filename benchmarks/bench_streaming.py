@@ -0,0 +1,71 @@
+"""
+Benchmark for streaming decoding of a large list response.
+
+Reads one page of many transactions from a local stub, decoded whole by
+`user_transactions` against records decoded as they arrive by
+`ApiClient.stream`, and compares time to first record, total time and the
+peak of memory traced by tracemalloc while iterating.
+
+Run with `python -m benchmarks.bench_streaming`.
+"""
+import json
+import time
+import tracemalloc
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+RECORDS = 20000
+
+
+def transaction(index):
+    return {
+        "height": index,
+        "txhash": f"{index:064X}",
+        "code": 0,
+        "index": 0,
+        "timestamp": 1581850266351 + index,
+        "gasUsed": 38700,
+        "logs": [{"msgIndex": 0, "success": True, "log": "", "events": [{"type": "message", "attributes": []}]}],
+        "tx": {"type": "cosmos-sdk/StdTx", "value": {"msg": [{"type": "token/MsgMint", "value": {"amount": "1000"}}], "memo": ""}},
+    }
+
+
+def buffered(api_client):
+    return iter(api_client.user_transactions("user-id", limit=RECORDS)["responseData"])
+
+
+def streamed(api_client):
+    return api_client.stream("user_transactions", "user-id", limit=RECORDS)
+
+
+def measure(api_client, records_of):
+    started = time.perf_counter()
+    records = records_of(api_client)
+    next(records)
+    first = time.perf_counter() - started
+    count = 1 + sum(1 for _ in records)
+    total = time.perf_counter() - started
+
+    tracemalloc.start()
+    for _ in records_of(api_client):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, first, total, peak
+
+
+def main():
+    payload = json.dumps({"statusCode": 1000, "responseData": [transaction(index) for index in range(RECORDS)]}).encode("utf-8")
+    auth = ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator())
+    with StubServer(lambda method, path, query, body: payload) as server:
+        api_client = ApiClient(base_url=server.base_url, auth=auth)
+        print(f"{RECORDS} transactions, {len(payload) / 2 ** 20:.1f} MiB body")
+        for (label, records_of) in (("buffered", buffered), ("streamed", streamed)):
+            (count, first, total, peak) = measure(api_client, records_of)
+            print(f"{label:9s}: {count} records, first after {first * 1e3:7.1f} ms, "
+                  f"all after {total * 1e3:7.1f} ms, peak {peak / 2 ** 20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,638 @@
+/*
+ * Native implementation of request flattening and sign-target assembly.
+ *
+ * This mirrors RequestBodyFlattener.flatten, RequestBodyFlattener.flatten_and_encode
+ * and SignatureGenerator.build_sign_target. Whenever a body has a shape the
+ * native code does not handle (non-str keys, scalar values other than str,
+ * list elements other than dict, ...), the functions return None so the
+ * caller falls back to the pure-Python implementation, which owns error
+ * reporting for such input.
+ *
+ * Author: Yoonyoul Yoo
+ * Date: 2026/10/18
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *empty_str = NULL;
+static PyObject *comma_str = NULL;
+static PyObject *ampersand_str = NULL;
+
+/* Returns a new reference to the flattened string, a new reference to
+ * Py_None when the shape is unsupported, or NULL with an exception set. */
+static PyObject *
+flatten_list(PyObject *key, PyObject *value)
+{
+    PyObject *elements = NULL, *columns = NULL, *lkeys = NULL;
+    PyObject *pieces = NULL, *result = NULL;
+    Py_ssize_t size, index;
+
+    elements = PySequence_Tuple(value);
+    if (elements == NULL)
+        return NULL;
+    size = PyTuple_GET_SIZE(elements);
+
+    columns = PyDict_New();
+    if (columns == NULL)
+        goto done;
+
+    for (index = 0; index < size; index++) {
+        PyObject *ele = PyTuple_GET_ITEM(elements, index);
+        PyObject *items;
+        Py_ssize_t item_index, item_count;
+
+        if (!PyDict_Check(ele)) {
+            Py_INCREF(Py_None);
+            result = Py_None;
+            goto done;
+        }
+        items = PyDict_Items(ele);
+        if (items == NULL)
+            goto done;
+        item_count = PyList_GET_SIZE(items);
+        for (item_index = 0; item_index < item_count; item_index++) {
+            PyObject *item = PyList_GET_ITEM(items, item_index);
+            PyObject *lkey = PyTuple_GET_ITEM(item, 0);
+            PyObject *lvalue = PyTuple_GET_ITEM(item, 1);
+            PyObject *column, *text;
+            int rc;
+
+            if (!PyUnicode_CheckExact(lkey)) {
+                Py_DECREF(items);
+                Py_INCREF(Py_None);
+                result = Py_None;
+                goto done;
+            }
+            column = PyDict_GetItemWithError(columns, lkey);
+            if (column == NULL) {
+                if (PyErr_Occurred()) {
+                    Py_DECREF(items);
+                    goto done;
+                }
+                column = PyList_New(0);
+                if (column == NULL) {
+                    Py_DECREF(items);
+                    goto done;
+                }
+                rc = PyDict_SetItem(columns, lkey, column);
+                Py_DECREF(column);
+                if (rc < 0) {
+                    Py_DECREF(items);
+                    goto done;
+                }
+            }
+            while (PyList_GET_SIZE(column) < index) {
+                if (PyList_Append(column, empty_str) < 0) {
+                    Py_DECREF(items);
+                    goto done;
+                }
+            }
+            text = PyObject_Str(lvalue);
+            if (text == NULL) {
+                Py_DECREF(items);
+                goto done;
+            }
+            rc = PyList_Append(column, text);
+            Py_DECREF(text);
+            if (rc < 0) {
+                Py_DECREF(items);
+                goto done;
+            }
+        }
+        Py_DECREF(items);
+    }
+
+    lkeys = PyDict_Keys(columns);
+    if (lkeys == NULL || PyList_Sort(lkeys) < 0)
+        goto done;
+
+    pieces = PyList_New(PyList_GET_SIZE(lkeys));
+    if (pieces == NULL)
+        goto done;
+    for (index = 0; index < PyList_GET_SIZE(lkeys); index++) {
+        PyObject *lkey = PyList_GET_ITEM(lkeys, index);
+        PyObject *column = PyDict_GetItemWithError(columns, lkey);
+        PyObject *joined, *piece;
+
+        if (column == NULL)
+            goto done;
+        while (PyList_GET_SIZE(column) < size) {
+            if (PyList_Append(column, empty_str) < 0)
+                goto done;
+        }
+        joined = PyUnicode_Join(comma_str, column);
+        if (joined == NULL)
+            goto done;
+        piece = PyUnicode_FromFormat("%U.%U=%U", key, lkey, joined);
+        Py_DECREF(joined);
+        if (piece == NULL)
+            goto done;
+        PyList_SET_ITEM(pieces, index, piece);
+    }
+    result = PyUnicode_Join(ampersand_str, pieces);
+
+done:
+    Py_XDECREF(pieces);
+    Py_XDECREF(lkeys);
+    Py_XDECREF(columns);
+    Py_DECREF(elements);
+    return result;
+}
+
+/* Same contract as flatten_list. */
+static PyObject *
+flatten_body(PyObject *body)
+{
+    PyObject *keys = NULL, *pieces = NULL, *result = NULL;
+    Py_ssize_t index, size;
+
+    if (!PyDict_Check(body))
+        Py_RETURN_NONE;
+
+    keys = PyDict_Keys(body);
+    if (keys == NULL)
+        return NULL;
+    size = PyList_GET_SIZE(keys);
+    for (index = 0; index < size; index++) {
+        if (!PyUnicode_CheckExact(PyList_GET_ITEM(keys, index))) {
+            Py_INCREF(Py_None);
+            result = Py_None;
+            goto done;
+        }
+    }
+    if (PyList_Sort(keys) < 0)
+        goto done;
+
+    pieces = PyList_New(size);
+    if (pieces == NULL)
+        goto done;
+    for (index = 0; index < size; index++) {
+        PyObject *key = PyList_GET_ITEM(keys, index);
+        PyObject *value = PyDict_GetItemWithError(body, key);
+        PyObject *piece;
+
+        if (value == NULL) {
+            if (!PyErr_Occurred()) {
+                Py_INCREF(Py_None);
+                result = Py_None;
+            }
+            goto done;
+        }
+        if (PyUnicode_Check(value)) {
+            piece = PyUnicode_FromFormat("%U=%U", key, value);
+        }
+        else if (PyList_Check(value)) {
+            Py_INCREF(value);
+            piece = flatten_list(key, value);
+            Py_DECREF(value);
+            if (piece == Py_None) {
+                result = piece;
+                goto done;
+            }
+        }
+        else {
+            Py_INCREF(Py_None);
+            result = Py_None;
+            goto done;
+        }
+        if (piece == NULL)
+            goto done;
+        PyList_SET_ITEM(pieces, index, piece);
+    }
+    result = PyUnicode_Join(ampersand_str, pieces);
+
+done:
+    Py_XDECREF(pieces);
+    Py_XDECREF(keys);
+    return result;
+}
+
+static PyObject *
+speedups_flatten(PyObject *module, PyObject *body)
+{
+    return flatten_body(body);
+}
+
+/* Growable byte buffer written by flatten_and_encode. */
+typedef struct {
+    char *data;
+    Py_ssize_t size;
+    Py_ssize_t capacity;
+} byte_buffer;
+
+static int
+buffer_reserve(byte_buffer *buffer, Py_ssize_t extra)
+{
+    Py_ssize_t capacity;
+    char *data;
+
+    if (buffer->size + extra <= buffer->capacity)
+        return 0;
+    capacity = buffer->capacity * 2;
+    if (capacity < buffer->size + extra)
+        capacity = buffer->size + extra;
+    if (capacity < 256)
+        capacity = 256;
+    data = PyMem_Realloc(buffer->data, capacity);
+    if (data == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    buffer->data = data;
+    buffer->capacity = capacity;
+    return 0;
+}
+
+static int
+buffer_write(byte_buffer *buffer, const char *bytes, Py_ssize_t size)
+{
+    if (buffer_reserve(buffer, size) < 0)
+        return -1;
+    memcpy(buffer->data + buffer->size, bytes, size);
+    buffer->size += size;
+    return 0;
+}
+
+static int
+buffer_write_char(byte_buffer *buffer, char c)
+{
+    return buffer_write(buffer, &c, 1);
+}
+
+/* Writes the UTF-8 of text. Returns -1 with an exception set on failure. */
+static int
+buffer_write_text(byte_buffer *buffer, PyObject *text)
+{
+    Py_ssize_t size;
+    const char *utf8 = PyUnicode_AsUTF8AndSize(text, &size);
+
+    if (utf8 == NULL)
+        return -1;
+    return buffer_write(buffer, utf8, size);
+}
+
+/* Writes text as a JSON string, escaping like json.dumps(text, ensure_ascii=False). */
+static int
+buffer_write_json_string(byte_buffer *buffer, PyObject *text)
+{
+    static const char hex[] = "0123456789abcdef";
+    Py_ssize_t size, index;
+    const char *utf8 = PyUnicode_AsUTF8AndSize(text, &size);
+    char *out;
+
+    if (utf8 == NULL || buffer_reserve(buffer, size * 6 + 2) < 0)
+        return -1;
+    out = buffer->data + buffer->size;
+    *out++ = '"';
+    for (index = 0; index < size; index++) {
+        unsigned char c = (unsigned char)utf8[index];
+        if (c >= 0x20 && c != '"' && c != '\\') {
+            *out++ = (char)c;
+            continue;
+        }
+        *out++ = '\\';
+        switch (c) {
+        case '"': *out++ = '"'; break;
+        case '\\': *out++ = '\\'; break;
+        case '\n': *out++ = 'n'; break;
+        case '\r': *out++ = 'r'; break;
+        case '\t': *out++ = 't'; break;
+        case '\b': *out++ = 'b'; break;
+        case '\f': *out++ = 'f'; break;
+        default:
+            *out++ = 'u';
+            *out++ = '0';
+            *out++ = '0';
+            *out++ = hex[c >> 4];
+            *out++ = hex[c & 0xf];
+        }
+    }
+    *out++ = '"';
+    buffer->size = out - buffer->data;
+    return 0;
+}
+
+/* A column of a list value: the comma separated values of one element key. */
+typedef struct {
+    PyObject *lkey;
+    byte_buffer values;
+    Py_ssize_t count;
+} list_column;
+
+static int
+compare_columns(const void *left, const void *right)
+{
+    return PyUnicode_Compare(((const list_column *)left)->lkey, ((const list_column *)right)->lkey);
+}
+
+/* Pads column with empty values up to count values. */
+static int
+column_pad(list_column *column, Py_ssize_t count)
+{
+    for (; column->count < count; column->count++) {
+        if (column->count > 0 && buffer_write_char(&column->values, ',') < 0)
+            return -1;
+    }
+    return 0;
+}
+
+/* Writes the flattened list to flat and its JSON to json in one pass over the
+ * elements. Returns 1 on success, 0 when the shape is unsupported, -1 with an
+ * exception set on failure. */
+static int
+flatten_and_encode_list(PyObject *key, PyObject *value, byte_buffer *flat, byte_buffer *json)
+{
+    list_column *columns = NULL;
+    Py_ssize_t column_count = 0, column_capacity = 0, size, index, column_index;
+    int status = -1;
+
+    size = PyList_GET_SIZE(value);
+    if (buffer_write_char(json, '[') < 0)
+        goto done;
+    for (index = 0; index < size; index++) {
+        PyObject *ele = PyList_GET_ITEM(value, index);
+        PyObject *lkey, *lvalue;
+        Py_ssize_t position = 0;
+        int first = 1;
+
+        if (!PyDict_Check(ele)) {
+            status = 0;
+            goto done;
+        }
+        if ((index > 0 && buffer_write_char(json, ',') < 0) || buffer_write_char(json, '{') < 0)
+            goto done;
+        while (PyDict_Next(ele, &position, &lkey, &lvalue)) {
+            list_column *column = NULL;
+
+            if (!PyUnicode_CheckExact(lkey) || !PyUnicode_Check(lvalue)) {
+                status = 0;
+                goto done;
+            }
+            if ((!first && buffer_write_char(json, ',') < 0)
+                    || buffer_write_json_string(json, lkey) < 0
+                    || buffer_write_char(json, ':') < 0
+                    || buffer_write_json_string(json, lvalue) < 0)
+                goto done;
+            first = 0;
+
+            for (column_index = 0; column_index < column_count; column_index++) {
+                if (columns[column_index].lkey == lkey
+                        || PyUnicode_Compare(columns[column_index].lkey, lkey) == 0) {
+                    column = &columns[column_index];
+                    break;
+                }
+            }
+            if (column == NULL) {
+                if (column_count == column_capacity) {
+                    list_column *grown;
+                    column_capacity = column_capacity ? column_capacity * 2 : 8;
+                    grown = PyMem_Realloc(columns, column_capacity * sizeof(list_column));
+                    if (grown == NULL) {
+                        PyErr_NoMemory();
+                        goto done;
+                    }
+                    columns = grown;
+                }
+                column = &columns[column_count++];
+                column->lkey = lkey;
+                column->values.data = NULL;
+                column->values.size = column->values.capacity = 0;
+                column->count = 0;
+            }
+            if (column_pad(column, index) < 0
+                    || (index > 0 && buffer_write_char(&column->values, ',') < 0)
+                    || buffer_write_text(&column->values, lvalue) < 0)
+                goto done;
+            column->count++;
+        }
+        if (buffer_write_char(json, '}') < 0)
+            goto done;
+    }
+    if (buffer_write_char(json, ']') < 0)
+        goto done;
+
+    if (column_count > 1)
+        qsort(columns, column_count, sizeof(list_column), compare_columns);
+    for (column_index = 0; column_index < column_count; column_index++) {
+        list_column *column = &columns[column_index];
+        if (column_pad(column, size) < 0
+                || (column_index > 0 && buffer_write_char(flat, '&') < 0)
+                || buffer_write_text(flat, key) < 0
+                || buffer_write_char(flat, '.') < 0
+                || buffer_write_text(flat, column->lkey) < 0
+                || buffer_write_char(flat, '=') < 0
+                || buffer_write(flat, column->values.data, column->values.size) < 0)
+            goto done;
+    }
+    status = 1;
+
+done:
+    for (column_index = 0; column_index < column_count; column_index++)
+        PyMem_Free(columns[column_index].values.data);
+    PyMem_Free(columns);
+    return status;
+}
+
+/* Returns a new reference to a (flattened str, JSON bytes) tuple built in one
+ * pass over body, a new reference to Py_None when the shape is unsupported,
+ * or NULL with an exception set. */
+static PyObject *
+speedups_flatten_and_encode(PyObject *module, PyObject *body)
+{
+    byte_buffer flat = {NULL, 0, 0}, json = {NULL, 0, 0};
+    PyObject *keys = NULL, *flattened = NULL, *encoded = NULL, *result = NULL;
+    Py_ssize_t index, size;
+    int status;
+
+    if (!PyDict_Check(body))
+        Py_RETURN_NONE;
+
+    keys = PyDict_Keys(body);
+    if (keys == NULL)
+        return NULL;
+    size = PyList_GET_SIZE(keys);
+    for (index = 0; index < size; index++) {
+        if (!PyUnicode_CheckExact(PyList_GET_ITEM(keys, index)))
+            goto unsupported;
+    }
+    if (PyList_Sort(keys) < 0)
+        goto done;
+
+    if (buffer_write_char(&json, '{') < 0)
+        goto done;
+    for (index = 0; index < size; index++) {
+        PyObject *key = PyList_GET_ITEM(keys, index);
+        PyObject *value = PyDict_GetItemWithError(body, key);
+
+        if (value == NULL) {
+            if (PyErr_Occurred())
+                goto done;
+            goto unsupported;
+        }
+        if ((index > 0 && buffer_write_char(&flat, '&') < 0)
+                || (index > 0 && buffer_write_char(&json, ',') < 0)
+                || buffer_write_json_string(&json, key) < 0
+                || buffer_write_char(&json, ':') < 0)
+            goto done;
+        if (PyUnicode_Check(value)) {
+            if (buffer_write_text(&flat, key) < 0
+                    || buffer_write_char(&flat, '=') < 0
+                    || buffer_write_text(&flat, value) < 0
+                    || buffer_write_json_string(&json, value) < 0)
+                goto done;
+        }
+        else if (PyList_Check(value)) {
+            Py_INCREF(value);
+            status = flatten_and_encode_list(key, value, &flat, &json);
+            Py_DECREF(value);
+            if (status < 0)
+                goto done;
+            if (status == 0)
+                goto unsupported;
+        }
+        else {
+            goto unsupported;
+        }
+    }
+    if (buffer_write_char(&json, '}') < 0)
+        goto done;
+
+    flattened = PyUnicode_DecodeUTF8(flat.data, flat.size, "strict");
+    if (flattened == NULL)
+        goto done;
+    encoded = PyBytes_FromStringAndSize(json.data, json.size);
+    if (encoded == NULL)
+        goto done;
+    result = PyTuple_Pack(2, flattened, encoded);
+    goto done;
+
+unsupported:
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+done:
+    if (result == NULL && PyErr_ExceptionMatches(PyExc_UnicodeEncodeError)) {
+        /* e.g. lone surrogates, left to the Python path to report. */
+        PyErr_Clear();
+        Py_INCREF(Py_None);
+        result = Py_None;
+    }
+    Py_XDECREF(encoded);
+    Py_XDECREF(flattened);
+    Py_XDECREF(keys);
+    PyMem_Free(flat.data);
+    PyMem_Free(json.data);
+    return result;
+}
+
+static PyObject *
+speedups_build_sign_target(PyObject *module, PyObject *args)
+{
+    PyObject *method, *path, *timestamp, *nonce, *query_params, *body;
+    PyObject *buffer = NULL, *item = NULL, *joined = NULL, *result = NULL;
+    PyObject *items = NULL;
+    Py_ssize_t index;
+    int has_query, has_body;
+
+    if (!PyArg_ParseTuple(args, "OOOOOO:build_sign_target",
+                          &method, &path, &timestamp, &nonce, &query_params, &body))
+        return NULL;
+    if (!PyUnicode_Check(method) || !PyUnicode_Check(path) || !PyUnicode_Check(nonce)
+            || !PyDict_Check(query_params) || !PyDict_Check(body))
+        Py_RETURN_NONE;
+
+    buffer = PyList_New(0);
+    if (buffer == NULL)
+        return NULL;
+    if (PyList_Append(buffer, nonce) < 0)
+        goto done;
+    item = PyObject_Str(timestamp);
+    if (item == NULL || PyList_Append(buffer, item) < 0)
+        goto done;
+    Py_CLEAR(item);
+    item = PyObject_CallMethod(method, "upper", NULL);
+    if (item == NULL || PyList_Append(buffer, item) < 0)
+        goto done;
+    Py_CLEAR(item);
+    if (PyList_Append(buffer, path) < 0)
+        goto done;
+
+    has_query = PyDict_Size(query_params) > 0;
+    has_body = PyDict_Size(body) > 0;
+    if (has_query || has_body) {
+        item = PyUnicode_FromString("?");
+        if (item == NULL || PyList_Append(buffer, item) < 0)
+            goto done;
+        Py_CLEAR(item);
+
+        items = PyDict_Items(query_params);
+        if (items == NULL)
+            goto done;
+        for (index = 0; index < PyList_GET_SIZE(items); index++) {
+            PyObject *pair = PyList_GET_ITEM(items, index);
+            item = PyUnicode_FromFormat("%S=%S", PyTuple_GET_ITEM(pair, 0), PyTuple_GET_ITEM(pair, 1));
+            if (item == NULL || PyList_Append(buffer, item) < 0)
+                goto done;
+            Py_CLEAR(item);
+            if (index + 1 < PyList_GET_SIZE(items) || has_body) {
+                if (PyList_Append(buffer, ampersand_str) < 0)
+                    goto done;
+            }
+        }
+
+        if (has_body) {
+            item = flatten_body(body);
+            if (item == NULL)
+                goto done;
+            if (item == Py_None) {
+                result = item;
+                item = NULL;
+                goto done;
+            }
+            if (PyList_Append(buffer, item) < 0)
+                goto done;
+            Py_CLEAR(item);
+        }
+    }
+
+    joined = PyUnicode_Join(empty_str, buffer);
+    if (joined == NULL)
+        goto done;
+    result = PyUnicode_AsUTF8String(joined);
+
+done:
+    Py_XDECREF(joined);
+    Py_XDECREF(items);
+    Py_XDECREF(item);
+    Py_DECREF(buffer);
+    return result;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"flatten", speedups_flatten, METH_O,
+     "Flatten given body into a single line string, or return None if unsupported."},
+    {"flatten_and_encode", speedups_flatten_and_encode, METH_O,
+     "Return (flattened body, utf-8 JSON body) built in one pass, or None if unsupported."},
+    {"build_sign_target", speedups_build_sign_target, METH_VARARGS,
+     "Build utf-8 encoded sign target, or return None if unsupported."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "sdk._speedups",
+    "Native implementation of request flattening and sign-target assembly.",
+    -1,
+    speedups_methods
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    empty_str = PyUnicode_InternFromString("");
+    comma_str = PyUnicode_InternFromString(",");
+    ampersand_str = PyUnicode_InternFromString("&");
+    if (empty_str == NULL || comma_str == NULL || ampersand_str == NULL)
+        return NULL;
+    return PyModule_Create(&speedups_module);
+}
@@ -5,14 +5,21 @@ Author: Yoonyoul Yoo
 Date: 2021/01/09
 """
 
-from uplink import Consumer, put, get, post, returns, Path, Query, json, Body
+from uplink import Consumer, Path, Query, Body
 from uplink.auth import ApiTokenHeader
+import functools
+import inspect
 import logging
 import os
 import sys
-import random
-import string
 import time
+from sdk.endpoints import get, json, post, put, returns
+from sdk.json_codec import PreparedBody
+from sdk.layers import endpoint_methods
+from sdk.log_utils import debug_sampler, redact
+from sdk.nonce import default_nonce_provider
+from sdk.session import CodecSession, create_pooled_session
+from sdk.streaming import STREAM_CHUNK_SIZE, astream_records, stream_records
 
 
 SERVICE_API_KEY_HEADER = "service-api-key"
@@ -26,21 +33,34 @@ class ApiSignatureAuth(ApiTokenHeader):
 
     __logger = logging.getLogger(__name__)
 
-    def __init__(self, api_key, api_secret, signature_generator):
-        """Initialize with api_key, secret and signature_generator."""
+    def __init__(self, api_key, api_secret, signature_generator, clock=None, nonce_provider=None):
+        """
+        Initialize with api_key, secret and signature_generator.
+
+        Timestamps come from local time unless a clock, such as a CalibratedClock, is given.
+        Nonces come from the shared default NonceProvider unless nonce_provider is given.
+        The default provider has no prefix, so worker processes sharing an api key must
+        each pass a NonceProvider with a distinct prefix, e.g. NonceProvider(prefix="W1").
+        """
         self.api_key = api_key
         self.api_secret = api_secret
         self.signature_generator = signature_generator
+        self.clock = clock
+        self.nonce_provider = nonce_provider or default_nonce_provider
 
-    def __log_request(self, request_builder):
-        self.__logger.debug("request headers: " + str(request_builder.info["headers"]))
-        self.__logger.debug("request params: " + str(request_builder.info["params"]))
-        self.__logger.debug("request body: " + str(request_builder.info["data"]))
+    def __log_request(self, request_builder, debug_sampled):
+        if not debug_sampler.enabled_for(self.__logger, debug_sampled):
+            return
+        self.__logger.debug("request headers: %s", request_builder.info["headers"])
+        self.__logger.debug("request params: %s", redact(request_builder.info["params"]))
+        self.__logger.debug("request body: %s", redact(request_builder.info["data"]))
 
     def __nonce(self):
-        return "".join(random.choice(string.ascii_uppercase + string.ascii_lowercase + string.digits) for _ in range(8))
+        return self.nonce_provider.next()
 
     def __timestamp(self):
+        if self.clock is not None:
+            return str(self.clock.now_millis())
         return str(int(round(time.time() * 1000)))
 
     def __build_headers(self, nonce, timestamp, api_key, signature):
@@ -49,6 +69,14 @@ class ApiSignatureAuth(ApiTokenHeader):
     def __user_agent(self, headers ={}):
         headers['user-agent'] = "developers-sdk-py"
 
+    def __sign(self, method, path, timestamp, nonce, params, body, debug_sampled):
+        generate_with_body = getattr(self.signature_generator, "generate_with_body", None)
+        if generate_with_body is None:
+            # generators implementing only generate() sign, and the session encodes the body.
+            signature = self.signature_generator.generate(self.api_secret, method, path, timestamp, nonce, params, body)
+            return signature, None
+        return generate_with_body(self.api_secret, method, path, timestamp, nonce, params, body, debug_sampled)
+
     def __call__(self, request_builder):
         """Append headers for authentication of developers api."""
         method = request_builder.method
@@ -57,16 +85,99 @@ class ApiSignatureAuth(ApiTokenHeader):
         nonce = self.__nonce()
         params = request_builder.info["params"]
         body = request_builder.info["data"]
-        signature = self.signature_generator.generate(self.api_secret, method, path, timestamp, nonce, params, body)
+        # decided once, so a request is logged by every logger or by none.
+        debug_sampled = debug_sampler.sample()
+        (signature, encoded_body) = self.__sign(method, path, timestamp, nonce, params, body, debug_sampled)
+        if encoded_body is not None:
+            # `@json` moves `data` into `json`, keeping a `json` value already present,
+            # so the body encoded while signing is what the session sends.
+            request_builder.info["data"] = request_builder.info["json"] = PreparedBody(body, encoded_body)
         headers = self.__build_headers(nonce, timestamp, self.api_key, signature)
         self.__user_agent(headers)
         request_builder.info["headers"].update(headers)
-        self.__log_request(request_builder)
+        self.__log_request(request_builder, debug_sampled)
 
 
 class ApiClient(Consumer):
     """A Python client for link-developers API."""
 
+    _asynchronous = False
+
+    def __init__(self, base_url="", client=None, converters=(), auth=None, hooks=(), *, pool_config=None, layers=(),
+                 json_codec=None, **kwargs):
+        """
+        Initialize with base_url and auth.
+
+        Args:
+            -base_url- base url of developers api
+            -client- http client such as a session from create_pooled_session, shareable across instances
+            -converters- uplink converters, as for uplink.Consumer
+            -auth- ApiSignatureAuth signing every request
+            -hooks- uplink hooks, as for uplink.Consumer
+            -pool_config- PoolConfig to build a pooled session from, when no client is given
+            -layers- EndpointLayer instances such as ResponseCache wrapping endpoints, the first one outermost
+            -json_codec- JsonCodec of the session created when no client is given, defaults to default_json_codec()
+        """
+        if client is None:
+            client = create_pooled_session(pool_config, json_codec) if pool_config is not None else CodecSession(json_codec)
+        super().__init__(base_url=base_url, client=client, converters=converters, auth=auth, hooks=hooks, **kwargs)
+        for layer in reversed(layers):
+            self.__install(layer)
+
+    def __install(self, layer):
+        api_client_class = type(self)
+        for name in layer.endpoint_names(api_client_class):
+            if name in endpoint_methods(api_client_class):
+                endpoint = self.__dict__.get(name) or self.__unlayered_endpoint(name)
+                setattr(self, name, layer.wrap(api_client_class, name, endpoint, self._asynchronous))
+
+    def __unlayered_endpoint(self, name):
+        # bound on every call, so that calls see the session of this client at that time.
+        definition = inspect.getattr_static(type(self), name)
+
+        def endpoint(*args, **kwargs):
+            return definition.__get__(self, type(self))(*args, **kwargs)
+        return functools.wraps(definition, updated=())(endpoint)
+
+    def bulk_read(self, endpoint: str, keys, max_workers: int = 16, **kwargs):
+        """
+        Call the endpoint of given name for many wallets or users at once.
+
+        Args:
+            -endpoint- name of the endpoint, e.g. "user_base_coin"
+            -keys- ids, or tuples of positional arguments, to call the endpoint with
+            -max_workers- maximum number of requests in flight
+            -kwargs- keyword arguments passed to every call
+
+        Returns:
+            -results- list of BulkResult(key, response, error) in the order of keys
+        """
+        from sdk.bulk import bulk_read
+        return bulk_read(getattr(self, endpoint), keys, max_workers, **kwargs)
+
+    def stream(self, endpoint: str, *args, record_type=None, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs):
+        """
+        Call the list endpoint of given name, decoding records of its responseData as they arrive.
+
+        The call bypasses layers of this client, and memory held stays bounded
+        by a record and a chunk instead of the whole page. AsyncApiClient returns
+        an async generator, iterated with `async for`.
+
+        Args:
+            -endpoint- name of the list endpoint, e.g. "service_wallet_transactions"
+            -args- positional arguments of the endpoint
+            -record_type- Record subclass of sdk.records, or callable taking a record dict, to yield instead of dicts
+            -chunk_size- bytes read from the socket at a time
+            -kwargs- keyword arguments of the endpoint, e.g. limit
+
+        Returns:
+            -records- generator of records, raising ApiResponseError after them when the call failed
+        """
+        unlayered = self.__unlayered_endpoint(endpoint)
+        if self._asynchronous:
+            return astream_records(unlayered, args, kwargs, record_type, chunk_size)
+        return stream_records(unlayered, args, kwargs, record_type, chunk_size)
+
     @returns.json
     @get("/v1/time")
     def time(self):
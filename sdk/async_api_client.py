@@ -0,0 +1,176 @@
+"""
+This module implements an asyncio variant of ApiClient.
+
+AsyncApiClient exposes every endpoint of ApiClient as a coroutine backed by
+aiohttp, signing requests with the same ApiSignatureAuth.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import asyncio
+from uplink import AiohttpClient
+from sdk.api_client import ApiClient
+from sdk.bulk import abulk_read
+from sdk.json_codec import JsonCodec, PreparedBody, default_json_codec
+from sdk.session import PoolConfig
+from sdk.streaming import AsyncStreamingResponse, streaming_chunk_size
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class _StreamedResponse:
+    """
+    Aiohttp response of a streamed call, its body left unread.
+
+    uplink reads the body of an aiohttp.ClientResponse before handing it to
+    `@returns.json`, so streamed responses are passed in this wrapper instead.
+    """
+
+    def __init__(self, response, json_codec, chunk_size):
+        self.__response = response
+        self.json = lambda *args, **kwargs: AsyncStreamingResponse(
+            response.content.iter_chunked(chunk_size), json_codec, response.release)
+
+    def __getattr__(self, item):
+        return getattr(self.__response, item)
+
+
+class PooledAiohttpClient(AiohttpClient):
+    """Aiohttp client adapter creating its pooled session lazily inside the running loop."""
+
+    def __init__(self, pool_config: PoolConfig = None, json_codec: JsonCodec = None):
+        """Initialize with pool_config, defaults to PoolConfig(), and json_codec, defaults to default_json_codec()."""
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncApiClient, install it with `pip install aiohttp`.")
+        super().__init__(session=None)
+        self.pool_config = pool_config or PoolConfig()
+        self.json_codec = json_codec or default_json_codec()
+        self._session = None
+
+    def __del__(self):
+        # sessions are closed explicitly by close(), not at garbage collection.
+        pass
+
+    async def session(self):
+        """Return the underlying aiohttp.ClientSession, creating it on first use."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_config.max_connections,
+                limit_per_host=self.pool_config.max_connections_per_host,
+                keepalive_timeout=self.pool_config.keep_alive_timeout)
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.pool_config.connect_timeout,
+                sock_read=self.pool_config.read_timeout)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout, json_serialize=self.json_codec.dumps_str)
+        return self._session
+
+    async def send(self, request):
+        """
+        Send request, sending bodies encoded while signing as is, and return the response decoding with the codec.
+
+        Within sdk.streaming.streaming_responses, the body is left unread and
+        response.json() returns an AsyncStreamingResponse reading it chunk by chunk.
+        """
+        (method, url, extras) = request
+        if isinstance(extras.get("json"), PreparedBody) and not extras.get("data"):
+            extras = dict(extras)
+            extras["data"] = extras.pop("json").encoded
+            extras["headers"] = dict(extras.get("headers") or {})
+            extras["headers"].setdefault("Content-Type", "application/json")
+            request = (method, url, extras)
+        response = await super().send(request)
+        chunk_size = streaming_chunk_size()
+        if chunk_size is not None:
+            return _StreamedResponse(response, self.json_codec, chunk_size)
+        return self.json_codec.bind(response, await response.read())
+
+    async def close(self):
+        """Close the underlying session, if it was created."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncApiClient(ApiClient):
+    """
+    An asyncio client for link-developers API.
+
+    Every endpoint of ApiClient returns a coroutine here, e.g.
+    `response = await api_client.user_detail(user_id)`.
+    Close the client with `await api_client.close()` or use it with `async with`.
+    """
+
+    _asynchronous = True
+
+    def __init__(self, base_url="", client=None, converters=(), auth=None, hooks=(), *, pool_config=None, layers=(),
+                 json_codec=None, **kwargs):
+        """
+        Initialize with base_url and auth.
+
+        Args:
+            -base_url- base url of developers api
+            -client- aiohttp.ClientSession or uplink AiohttpClient, shareable across instances
+            -converters- uplink converters, as for uplink.Consumer
+            -auth- ApiSignatureAuth signing every request
+            -hooks- uplink hooks, as for uplink.Consumer
+            -pool_config- PoolConfig for the aiohttp connection pool, when no client is given
+            -layers- EndpointLayer instances such as ResponseCache wrapping endpoints, the first one outermost
+            -json_codec- JsonCodec of the session created when no client is given, defaults to default_json_codec()
+        """
+        self.__owned_client = None
+        if client is None:
+            client = self.__owned_client = PooledAiohttpClient(pool_config, json_codec)
+        super().__init__(base_url, client, converters, auth, hooks, layers=layers, **kwargs)
+
+    async def bulk_read(self, endpoint: str, keys, max_workers: int = 16, **kwargs):
+        """
+        Await the endpoint of given name for many wallets or users at once.
+
+        Args:
+            -endpoint- name of the endpoint, e.g. "user_base_coin"
+            -keys- ids, or tuples of positional arguments, to call the endpoint with
+            -max_workers- maximum number of requests in flight
+            -kwargs- keyword arguments passed to every call
+
+        Returns:
+            -results- list of BulkResult(key, response, error) in the order of keys
+        """
+        return await abulk_read(getattr(self, endpoint), keys, max_workers, **kwargs)
+
+    async def close(self):
+        """Close the http session created by this client. A session given by the caller is left open."""
+        if self.__owned_client is not None:
+            await self.__owned_client.close()
+
+    async def __aenter__(self):
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the client on leaving async context."""
+        await self.close()
+
+
+async def gather_bounded(awaitables, limit: int = 10, return_exceptions: bool = False):
+    """
+    Await given awaitables with at most `limit` of them in flight at once.
+
+    Args:
+        -awaitables- iterable of coroutines or other awaitables
+        -limit- maximum number of awaitables running concurrently
+        -return_exceptions- return raised exceptions in place of results instead of raising the first one
+
+    Returns:
+        -results- list of results in the order of given awaitables
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(awaitable):
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(bounded(awaitable) for awaitable in awaitables), return_exceptions=return_exceptions)
@@ -0,0 +1,81 @@
+"""
+This module implements concurrent bulk reads over many wallets or users.
+
+A bulk read calls one endpoint for every given key with bounded concurrency,
+on a thread pool for ApiClient or on the event loop for AsyncApiClient.
+Results come back in input order and a failing key does not abort the batch.
+
+    results = api_client.bulk_read("user_base_coin", user_ids, max_workers=32)
+    for result in results:
+        if result.error is None:
+            balance = result.response["responseData"]
+
+A key is passed as the first argument of the endpoint; use a tuple to pass
+several, e.g. `(user_id, contract_id)` for `user_service_token`.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import asyncio
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from sdk.exceptions import check_response
+
+BulkResult = namedtuple("BulkResult", ["key", "response", "error"])
+BulkResult.__doc__ = """Outcome of one key of a bulk read: successful response, or the error raised for it."""
+
+
+def _arguments_of(key):
+    return key if isinstance(key, tuple) else (key,)
+
+
+def bulk_read(endpoint, keys, max_workers: int = 16, **kwargs):
+    """
+    Call endpoint for every key on a thread pool.
+
+    Args:
+        -endpoint- bound endpoint of ApiClient, e.g. api_client.user_base_coin
+        -keys- ids, or tuples of positional arguments, to call the endpoint with
+        -max_workers- maximum number of requests in flight
+        -kwargs- keyword arguments passed to every call
+
+    Returns:
+        -results- list of BulkResult in the order of keys
+    """
+    keys = list(keys)
+
+    def read(key):
+        try:
+            return BulkResult(key, check_response(endpoint(*_arguments_of(key), **kwargs)), None)
+        except Exception as error:
+            return BulkResult(key, None, error)
+
+    if not keys:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+        return list(executor.map(read, keys))
+
+
+async def abulk_read(endpoint, keys, max_concurrency: int = 16, **kwargs):
+    """
+    Await endpoint of AsyncApiClient for every key with bounded concurrency.
+
+    Args:
+        -endpoint- bound endpoint of AsyncApiClient, e.g. api_client.user_base_coin
+        -keys- ids, or tuples of positional arguments, to call the endpoint with
+        -max_concurrency- maximum number of requests in flight
+        -kwargs- keyword arguments passed to every call
+
+    Returns:
+        -results- list of BulkResult in the order of keys
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def read(key):
+        async with semaphore:
+            try:
+                return BulkResult(key, check_response(await endpoint(*_arguments_of(key), **kwargs)), None)
+            except Exception as error:
+                return BulkResult(key, None, error)
+
+    return await asyncio.gather(*(read(key) for key in keys))
@@ -0,0 +1,218 @@
+"""
+This module implements minting large numbers of non-fungible item tokens.
+
+BulkMinter takes a stream of MintRecord(token_type, name, meta, recipient),
+groups records per recipient into `mintList` chunks of up to chunk_size,
+submits chunks through `multi_mint_non_fungible_token` concurrently under a
+rate cap, and tracks every resulting txHash with a TransactionPoller.
+
+    minter = BulkMinter(api_client, contract_id, owner_address, owner_secret,
+                        SqliteCheckpointStore("mint.db"), job_id="campaign-42")
+    for result in minter.run(records):
+        if result.error is not None:
+            handle_failed(result)
+
+Progress of each chunk is checkpointed under the job id: a run after a crash
+skips confirmed chunks, polls chunks already submitted instead of minting
+them again, and submits the rest. Chunks are identified by position in the
+stream, so a resumed run must be given the same records in the same order.
+
+A chunk is checkpointed as submitting before its call. When the call is
+rejected the chunk is submitted again on resume, but when it raised otherwise,
+e.g. a timeout, or the process crashed during it, the mint may have been
+accepted. Such chunks are not submitted again: a resumed run reports them
+with ReconciliationRequiredError, to be checked against the transactions of
+the owner wallet, and minted again once their checkpoint is deleted.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import collections
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from sdk.checkpoint import CheckpointStore
+from sdk.exceptions import ACCEPTED_STATUS_CODE, ApiResponseError, ReconciliationRequiredError, TransactionFailedError
+from sdk.rate_limit import TokenBucket
+from sdk.transaction_poller import TransactionPoller
+
+# largest mintList accepted by multi_mint_non_fungible_token.
+MAX_MINT_LIST_SIZE = 50
+
+MintRecord = collections.namedtuple("MintRecord", ["token_type", "name", "meta", "recipient"])
+MintResult = collections.namedtuple("MintResult", ["chunk_id", "recipient", "records", "tx_hash", "error"])
+
+SUBMITTING = "submitting"
+SUBMITTED = "submitted"
+CONFIRMED = "confirmed"
+FAILED = "failed"
+
+
+class BulkMinter:
+    """This is to mint streams of non-fungible item tokens in concurrent, resumable chunks."""
+
+    def __init__(
+        self,
+        api_client,
+        contract_id: str,
+        owner_address: str,
+        owner_secret: str,
+        checkpoint_store: CheckpointStore,
+        job_id: str,
+        recipient_field: str = "toAddress",
+        chunk_size: int = MAX_MINT_LIST_SIZE,
+        max_concurrency: int = 4,
+        rate: float = None,
+        max_buffered: int = 10000,
+        poller: TransactionPoller = None
+    ):
+        """
+        Initialize bulk minter.
+
+        Args:
+            -api_client- ApiClient to mint with
+            -contract_id- contract of the item tokens
+            -owner_address- address of the contract owner service wallet
+            -owner_secret- secret of the contract owner service wallet
+            -checkpoint_store- store of progress per chunk
+            -job_id- name of this minting job, keying its checkpoints
+            -recipient_field- "toAddress" when recipients are wallet addresses, "toUserId" when user ids
+            -chunk_size- most records per multi_mint_non_fungible_token call
+            -max_concurrency- most multi_mint_non_fungible_token calls in flight
+            -rate- most multi_mint_non_fungible_token calls per second, unlimited when omitted
+            -max_buffered- most records held in partial chunks, the largest one is submitted beyond it
+            -poller- TransactionPoller tracking txHashes, one owned by this minter when omitted
+        """
+        if recipient_field not in ("toAddress", "toUserId"):
+            raise ValueError("recipient_field must be toAddress or toUserId")
+        self.api_client = api_client
+        self.contract_id = contract_id
+        self.owner_address = owner_address
+        self.owner_secret = owner_secret
+        self.checkpoint_store = checkpoint_store
+        self.job_id = job_id
+        self.recipient_field = recipient_field
+        self.chunk_size = min(chunk_size, MAX_MINT_LIST_SIZE)
+        self.max_concurrency = max_concurrency
+        self.max_buffered = max_buffered
+        self.poller = poller
+        self.__bucket = None if rate is None else TokenBucket(rate, capacity=1)
+
+    def chunks(self, records):
+        """
+        Group records per recipient into chunks.
+
+        Args:
+            -records- iterable of MintRecord, or of (token_type, name, meta, recipient) tuples
+
+        Returns:
+            -chunks- generator of (chunk_id, recipient, records), chunk_id being the
+                     position of the first record of the chunk in the stream
+        """
+        buffers = {}
+        buffered = 0
+        for (index, record) in enumerate(records):
+            record = MintRecord(*record)
+            buffer = buffers.setdefault(record.recipient, [])
+            buffer.append((index, record))
+            buffered += 1
+            if len(buffer) == self.chunk_size:
+                del buffers[record.recipient]
+                buffered -= len(buffer)
+                yield self.__chunk(record.recipient, buffer)
+            elif buffered > self.max_buffered:
+                recipient = max(buffers, key=lambda key: len(buffers[key]))
+                buffer = buffers.pop(recipient)
+                buffered -= len(buffer)
+                yield self.__chunk(recipient, buffer)
+        for (recipient, buffer) in buffers.items():
+            yield self.__chunk(recipient, buffer)
+
+    def __chunk(self, recipient, buffer):
+        return (buffer[0][0], recipient, [record for (_, record) in buffer])
+
+    def run(self, records):
+        """
+        Mint given records and wait until every chunk is confirmed or failed.
+
+        Args:
+            -records- iterable of MintRecord, or of (token_type, name, meta, recipient) tuples
+
+        Returns:
+            -results- list of MintResult(chunk_id, recipient, records, tx_hash, error) ordered by chunk_id,
+                      error being None for confirmed chunks
+        """
+        poller = self.poller or TransactionPoller(self.api_client)
+        # bounds chunks waiting for their txHash, so records are drawn from the stream only as fast as they are submitted.
+        slots = threading.BoundedSemaphore(self.max_concurrency * 2)
+        futures = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="bulk-mint") as executor:
+                for chunk in self.chunks(records):
+                    future = Future()
+                    futures.append(future)
+                    key = self.__key(chunk[0])
+                    state = self.checkpoint_store.get(key) or {}
+                    if state.get("status") == CONFIRMED:
+                        future.set_result(MintResult(*chunk, state["txHash"], None))
+                    elif state.get("status") == SUBMITTED:
+                        self.__track(poller, chunk, state["txHash"], future)
+                    elif state.get("status") == SUBMITTING:
+                        future.set_result(MintResult(*chunk, None, ReconciliationRequiredError(key)))
+                    else:
+                        slots.acquire()
+                        executor.submit(self.__submit, poller, chunk, future, slots)
+                results = [future.result() for future in futures]
+        finally:
+            if self.poller is None:
+                poller.close()
+        return sorted(results, key=lambda result: result.chunk_id)
+
+    def __key(self, chunk_id):
+        return f"mint:{self.job_id}:{chunk_id}"
+
+    def __submit(self, poller, chunk, future, slots):
+        (chunk_id, recipient, records) = chunk
+        request_body = {
+            "ownerAddress": self.owner_address,
+            "ownerSecret": self.owner_secret,
+            self.recipient_field: recipient,
+            "mintList": [self.__mint_entry(record) for record in records],
+        }
+        key = self.__key(chunk_id)
+        try:
+            if self.__bucket is not None:
+                delay = self.__bucket.reserve()
+                if delay > 0:
+                    time.sleep(delay)
+            self.checkpoint_store.set(key, {"status": SUBMITTING})
+            response = self.api_client.multi_mint_non_fungible_token(self.contract_id, request_body)
+            if not isinstance(response, dict) or response.get("statusCode") != ACCEPTED_STATUS_CODE:
+                # nothing was minted, so a resumed run submits the chunk again.
+                self.checkpoint_store.set(key, {"status": FAILED})
+                raise ApiResponseError(response)
+            tx_hash = response["responseData"]["txHash"]
+            self.checkpoint_store.set(key, {"status": SUBMITTED, "txHash": tx_hash})
+        except Exception as error:
+            future.set_result(MintResult(chunk_id, recipient, records, None, error))
+            return
+        finally:
+            slots.release()
+        self.__track(poller, chunk, tx_hash, future)
+
+    def __mint_entry(self, record):
+        # a None value would be sent as null but signed as "None", so optional fields are left out instead.
+        entry = {"tokenType": record.token_type, "name": record.name, "meta": record.meta}
+        return {key: value for (key, value) in entry.items() if value is not None}
+
+    def __track(self, poller, chunk, tx_hash, future):
+        def confirmed(poll):
+            error = poll.exception() if not poll.cancelled() else RuntimeError("polling was cancelled")
+            if error is None:
+                self.checkpoint_store.set(self.__key(chunk[0]), {"status": CONFIRMED, "txHash": tx_hash})
+            elif isinstance(error, TransactionFailedError):
+                # nothing was minted, so a resumed run submits the chunk again.
+                self.checkpoint_store.set(self.__key(chunk[0]), {"status": FAILED, "txHash": tx_hash})
+            future.set_result(MintResult(*chunk, tx_hash, error))
+
+        poller.submit(tx_hash, callback=confirmed)
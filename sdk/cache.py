@@ -0,0 +1,160 @@
+"""
+This module implements an opt-in read-through cache of metadata endpoints.
+
+Endpoints such as `service_detail`, `service_token_detail` or `user_detail`
+change rarely but are read on nearly every business operation. ResponseCache
+keeps their successful responses for a TTL per endpoint in a size-bounded LRU,
+and evicts matching entries when a mutating endpoint such as
+`update_service_token_detail` or `update_fungible_token` is called.
+
+    cache = ResponseCache(max_entries=10000)
+    api_client = ApiClient(base_url=api_base_url, auth=auth, layers=[cache])
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import collections
+import threading
+import time
+from sdk.exceptions import SUCCESS_STATUS_CODE
+from sdk.layers import EndpointLayer, bound_arguments
+
+DEFAULT_TTLS = {
+    "service_detail": 300,
+    "service_tokens": 60,
+    "service_token_detail": 60,
+    "item_token": 300,
+    "fungible_tokens": 60,
+    "fungible_token": 60,
+    "non_fungible_token_type": 60,
+    "user_detail": 60,
+}
+
+# mutating endpoint -> cached endpoints whose entries sharing its arguments are evicted
+DEFAULT_INVALIDATIONS = {
+    "update_service_token_detail": ("service_token_detail", "service_tokens"),
+    "update_fungible_token": ("fungible_token", "fungible_tokens"),
+    "create_fungible_token": ("fungible_tokens",),
+    "update_non_fungible_token_type": ("non_fungible_token_type", "non_fungible_tokens"),
+    "create_non_fungible_token": ("non_fungible_tokens",),
+}
+
+
+class ResponseCache(EndpointLayer):
+    """This is to cache successful responses of slow-changing endpoints."""
+
+    def __init__(self, ttls: dict = None, max_entries: int = 10000, invalidations: dict = None):
+        """
+        Initialize response cache.
+
+        Args:
+            -ttls- seconds to keep responses per endpoint name, defaults to DEFAULT_TTLS
+            -max_entries- number of responses kept, least recently used are evicted beyond it
+            -invalidations- mutating endpoint name to cached endpoint names it evicts, defaults to DEFAULT_INVALIDATIONS
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.invalidations = dict(DEFAULT_INVALIDATIONS if invalidations is None else invalidations)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def endpoint_names(self, api_client_class):
+        """Return cached and mutating endpoint names."""
+        return list(self.ttls) + list(self.invalidations)
+
+    def __len__(self):
+        """Return number of cached responses."""
+        return len(self.__entries)
+
+    def stats(self):
+        """Return hit, miss and eviction counters and current size."""
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self.__entries)}
+
+    def get(self, key):
+        """Return cached response of key, or None when missing or expired."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                (expires_at, response) = entry
+                if expires_at > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self.__entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, response, ttl):
+        """Cache response under key for ttl seconds."""
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + ttl, response)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str = None, **arguments):
+        """
+        Evict cached responses.
+
+        Args:
+            -endpoint- endpoint name to evict responses of, all endpoints when omitted
+            -arguments- only evict responses whose arguments of the same name are equal,
+                        e.g. invalidate("service_token_detail", contract_id="a48f097b")
+        """
+        with self.__lock:
+            for key in list(self.__entries):
+                (name, key_arguments) = key
+                if endpoint is not None and name != endpoint:
+                    continue
+                if all(arguments.get(argument, value) == value for (argument, value) in key_arguments):
+                    del self.__entries[key]
+
+    def clear(self):
+        """Evict every cached response."""
+        self.invalidate()
+
+    def __key(self, api_client_class, name, args, kwargs):
+        return (name, tuple(sorted(bound_arguments(api_client_class, name, args, kwargs).items())))
+
+    def __evict_for(self, api_client_class, name, args, kwargs):
+        arguments = bound_arguments(api_client_class, name, args, kwargs)
+        for endpoint in self.invalidations[name]:
+            self.invalidate(endpoint, **arguments)
+
+    def __cacheable(self, response):
+        return isinstance(response, dict) and response.get("statusCode") == SUCCESS_STATUS_CODE
+
+    def call(self, api_client_class, name, endpoint, args, kwargs):
+        """Answer cached endpoints from cache, evict after mutating endpoints."""
+        if name in self.invalidations:
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                self.__evict_for(api_client_class, name, args, kwargs)
+        key = self.__key(api_client_class, name, args, kwargs)
+        response = self.get(key)
+        if response is None:
+            response = endpoint(*args, **kwargs)
+            if self.__cacheable(response):
+                self.put(key, response, self.ttls[name])
+        return response
+
+    async def acall(self, api_client_class, name, endpoint, args, kwargs):
+        """Answer cached endpoints from cache, evict after mutating endpoints."""
+        if name in self.invalidations:
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                self.__evict_for(api_client_class, name, args, kwargs)
+        key = self.__key(api_client_class, name, args, kwargs)
+        response = self.get(key)
+        if response is None:
+            response = await endpoint(*args, **kwargs)
+            if self.__cacheable(response):
+                self.put(key, response, self.ttls[name])
+        return response
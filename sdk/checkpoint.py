@@ -0,0 +1,134 @@
+"""
+This module implements checkpoint stores for resumable, incremental jobs.
+
+A checkpoint store maps a string key to a JSON serializable value. Stores are
+interchangeable, pick one by how long the checkpoint has to survive:
+
+* MemoryCheckpointStore: lives as long as the process
+* JsonFileCheckpointStore: a single JSON file, rewritten atomically
+* SqliteCheckpointStore: a SQLite database, safe to share between processes
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+
+
+class CheckpointStore:
+    """Base class of checkpoint stores."""
+
+    def get(self, key: str, default=None):
+        """Return the checkpoint value of key, or default when there is none."""
+        raise NotImplementedError
+
+    def set(self, key: str, value):
+        """Persist value as the checkpoint of key."""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """Remove the checkpoint of key, if any."""
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Checkpoint store keeping values in memory."""
+
+    def __init__(self):
+        """Initialize with no checkpoints."""
+        self.__values = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key: str, default=None):
+        """Return the checkpoint value of key, or default when there is none."""
+        with self.__lock:
+            return self.__values.get(key, default)
+
+    def set(self, key: str, value):
+        """Persist value as the checkpoint of key."""
+        with self.__lock:
+            self.__values[key] = value
+
+    def delete(self, key: str):
+        """Remove the checkpoint of key, if any."""
+        with self.__lock:
+            self.__values.pop(key, None)
+
+
+class JsonFileCheckpointStore(CheckpointStore):
+    """Checkpoint store keeping values in a JSON file."""
+
+    def __init__(self, path: str):
+        """Initialize with path of the JSON file, loading it when it exists."""
+        self.path = path
+        self.__lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as stream:
+                self.__values = json.load(stream)
+        except FileNotFoundError:
+            self.__values = {}
+
+    def __flush(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                json.dump(self.__values, stream)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def get(self, key: str, default=None):
+        """Return the checkpoint value of key, or default when there is none."""
+        with self.__lock:
+            return self.__values.get(key, default)
+
+    def set(self, key: str, value):
+        """Persist value as the checkpoint of key."""
+        with self.__lock:
+            self.__values[key] = value
+            self.__flush()
+
+    def delete(self, key: str):
+        """Remove the checkpoint of key, if any."""
+        with self.__lock:
+            if self.__values.pop(key, None) is not None:
+                self.__flush()
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """Checkpoint store keeping values in a SQLite database."""
+
+    def __init__(self, path: str, table: str = "checkpoints"):
+        """Initialize with path of the database and name of the table to use."""
+        self.path = path
+        self.table = table
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def get(self, key: str, default=None):
+        """Return the checkpoint value of key, or default when there is none."""
+        with self.__lock:
+            row = self.__connection.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key: str, value):
+        """Persist value as the checkpoint of key."""
+        with self.__lock:
+            self.__connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+    def delete(self, key: str):
+        """Remove the checkpoint of key, if any."""
+        with self.__lock:
+            self.__connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def close(self):
+        """Close the database connection."""
+        self.__connection.close()
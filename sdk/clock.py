@@ -0,0 +1,101 @@
+"""
+This module implements a time source calibrated against developers api.
+
+Requests are rejected when their Timestamp header is too far from server time.
+CalibratedClock samples `ApiClient.time()` (responseTime), estimates the offset
+of the local clock and the round trip time, and gives ApiSignatureAuth
+corrected timestamps.
+
+    auth = ApiSignatureAuth(service_api_key, service_api_secret, SignatureGenerator())
+    api_client = ApiClient(base_url=api_base_url, auth=auth)
+    auth.clock = CalibratedClock(api_client).start()
+
+Among the latest samples, the one with the smallest round trip time is trusted,
+since its midpoint is the tightest bound on when the server read its clock.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import collections
+import logging
+import threading
+import time
+
+
+class CalibratedClock:
+    """This is to provide timestamps corrected by the estimated skew to server time."""
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, api_client, resample_interval: float = 300, window: int = 8):
+        """
+        Initialize with api_client.
+
+        Args:
+            -api_client- ApiClient to sample server time with
+            -resample_interval- seconds between samples once started
+            -window- number of latest samples the estimate is chosen from
+        """
+        self.api_client = api_client
+        self.resample_interval = resample_interval
+        self.__samples = collections.deque(maxlen=window)
+        self.__offset_ms = 0.0
+        self.__rtt_ms = None
+        self.__lock = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__thread = None
+
+    @property
+    def skew_ms(self):
+        """Estimated milliseconds to add to local time to get server time."""
+        return self.__offset_ms
+
+    @property
+    def rtt_ms(self):
+        """Round trip time in milliseconds of the sample the estimate is based on, None before sampling."""
+        return self.__rtt_ms
+
+    def now_millis(self):
+        """Return current server time estimate as Unix timestamp in milliseconds."""
+        return int(round(time.time() * 1000 + self.__offset_ms))
+
+    def sample(self):
+        """
+        Sample server time once and update the estimate.
+
+        Returns:
+            -skew_ms- estimated skew after this sample
+        """
+        sent = time.time()
+        response = self.api_client.time()
+        received = time.time()
+        server_ms = response["responseTime"]
+        rtt_ms = (received - sent) * 1000
+        offset_ms = server_ms - (sent + received) * 500
+        with self.__lock:
+            self.__samples.append((rtt_ms, offset_ms))
+            self.__rtt_ms, self.__offset_ms = min(self.__samples)
+        self.__logger.debug("clock skew: %.1f ms, rtt: %.1f ms", self.__offset_ms, self.__rtt_ms)
+        return self.__offset_ms
+
+    def start(self):
+        """Sample now, then keep sampling every resample_interval seconds in background. Returns self."""
+        self.sample()
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__run, name="calibrated-clock", daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling in background."""
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self):
+        while not self.__stopped.wait(self.resample_interval):
+            try:
+                self.sample()
+            except Exception as error:
+                self.__logger.warning("sampling server time failed: %s", error)
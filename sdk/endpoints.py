@@ -0,0 +1,101 @@
+"""
+This module implements lazily built endpoint definitions for ApiClient.
+
+uplink builds a request definition for every decorated method when the
+Consumer class is created, which is most of the time spent importing
+`sdk.api_client`. The decorators here have the same names and usage as
+uplink's, but only record what they decorate:
+
+    @json
+    @returns.json
+    @post("/v1/service-tokens/{contract_id}/mint")
+    def mint_service_token(self, contract_id: Path("contract_id"), service_token_mint_request: Body):
+        ...
+
+The uplink definition is built on first access of the endpoint and kept
+for later accesses. Endpoints are bound on every access, as uplink does,
+so changes to the session of an instance apply to later calls.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import functools
+import uplink
+from uplink.builder import ConsumerMethod
+
+
+class LazyEndpoint:
+    """Descriptor building the uplink definition of an endpoint on first access."""
+
+    def __init__(self, func, method: str, decorators):
+        """
+        Initialize with the endpoint function and the uplink decorators to apply to it.
+
+        Args:
+            -func- endpoint function
+            -method- http method, e.g. "GET"
+            -decorators- uplink decorators, the innermost first
+        """
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.method = method
+        self.decorators = list(decorators)
+        self.name = func.__name__
+        self.__consumer_method = None
+
+    def __set_name__(self, owner, name):
+        """Remember the attribute name of the endpoint."""
+        self.name = name
+
+    def __consumer_method_of(self, owner):
+        if self.__consumer_method is None:
+            definition = self.func
+            for decorator in self.decorators:
+                definition = decorator(definition)
+            self.__consumer_method = ConsumerMethod(owner.__name__, self.name, definition)
+        return self.__consumer_method
+
+    def __get__(self, instance, owner):
+        """Return the endpoint bound to instance, or a copy of its definition builder on class access."""
+        return self.__consumer_method_of(owner).__get__(instance, owner)
+
+
+class _LazyDecorator:
+    """uplink decorator recorded on a LazyEndpoint instead of applied."""
+
+    def __init__(self, decorator, method: str = None):
+        self.decorator = decorator
+        self.method = method
+
+    def __call__(self, endpoint):
+        if isinstance(endpoint, LazyEndpoint):
+            endpoint.decorators.append(self.decorator)
+            if self.method is not None:
+                endpoint.method = self.method
+            return endpoint
+        return LazyEndpoint(endpoint, self.method, [self.decorator])
+
+
+def get(uri: str = None):
+    """Lazy uplink.get."""
+    return _LazyDecorator(uplink.get(uri), "GET")
+
+
+def post(uri: str = None):
+    """Lazy uplink.post."""
+    return _LazyDecorator(uplink.post(uri), "POST")
+
+
+def put(uri: str = None):
+    """Lazy uplink.put."""
+    return _LazyDecorator(uplink.put(uri), "PUT")
+
+
+# lazy uplink.json, sending the body as json.
+json = _LazyDecorator(uplink.json)
+
+
+class returns:
+    """Lazy uplink.returns."""
+
+    json = _LazyDecorator(uplink.returns.json)
@@ -0,0 +1,68 @@
+"""
+This module defines exceptions raised by helpers built on ApiClient.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+
+SUCCESS_STATUS_CODE = 1000
+# answered by endpoints creating a transaction, with its txHash.
+ACCEPTED_STATUS_CODE = 1002
+
+
+class ApiResponseError(Exception):
+    """Raised when developers api answers with an unexpected status code."""
+
+    def __init__(self, response: dict):
+        """Initialize with decoded response of developers api."""
+        self.response = response
+        self.status_code = response.get("statusCode") if isinstance(response, dict) else None
+        self.status_message = response.get("statusMessage") if isinstance(response, dict) else None
+        super().__init__(f"statusCode: {self.status_code}, statusMessage: {self.status_message}")
+
+
+def check_response(response: dict):
+    """
+    Return given response when it succeeded.
+
+    Args:
+        -response- decoded response of developers api
+
+    Returns:
+        -response- the same response
+
+    Raises:
+        -ApiResponseError- when statusCode is not SUCCESS_STATUS_CODE
+    """
+    if not isinstance(response, dict) or response.get("statusCode") != SUCCESS_STATUS_CODE:
+        raise ApiResponseError(response)
+    return response
+
+
+class TransactionFailedError(Exception):
+    """Raised when a transaction was committed with a non-zero result code."""
+
+    def __init__(self, tx_hash: str, response: dict):
+        """Initialize with tx_hash and the transaction_result response."""
+        self.tx_hash = tx_hash
+        self.response = response
+        self.code = (response.get("responseData") or {}).get("code")
+        super().__init__(f"txHash: {tx_hash}, code: {self.code}")
+
+
+class TransactionTimeoutError(Exception):
+    """Raised when a transaction is not confirmed within the polling timeout."""
+
+    def __init__(self, tx_hash: str):
+        """Initialize with tx_hash."""
+        self.tx_hash = tx_hash
+        super().__init__(f"txHash: {tx_hash} is not confirmed in time")
+
+
+class ReconciliationRequiredError(Exception):
+    """Raised for a submission that may have been accepted without its txHash being known."""
+
+    def __init__(self, key: str):
+        """Initialize with the checkpoint key of the submission."""
+        self.key = key
+        super().__init__(f"{key} may have been submitted, reconcile it before submitting again")
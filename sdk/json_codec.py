@@ -0,0 +1,134 @@
+"""
+This module implements the JSON codecs used on the wire by ApiClient.
+
+Request bodies of `@json` endpoints are encoded, and responses of
+`@returns.json` endpoints decoded, by the codec of the http session the client
+was given. OrjsonCodec is used when orjson is installed, StdlibJsonCodec
+otherwise:
+
+    api_client = ApiClient(base_url=api_base_url, auth=auth, json_codec=StdlibJsonCodec())
+
+Signatures do not depend on the codec, they are computed from the flattened
+body, so codecs may differ in whitespace or escaping.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec:
+    """Base class of JSON codecs."""
+
+    name = None
+
+    def dumps(self, value) -> bytes:
+        """Return value encoded as UTF-8 JSON."""
+        raise NotImplementedError
+
+    def loads(self, data):
+        """Return value decoded from JSON bytes or str. Raises json.JSONDecodeError on invalid JSON."""
+        raise NotImplementedError
+
+    def dumps_str(self, value) -> str:
+        """Return value encoded as JSON text."""
+        return self.dumps(value).decode("utf-8")
+
+    def bind(self, response, content: bytes):
+        """
+        Make response.json() decode content with this codec.
+
+        uplink's `@returns.json` decodes by calling response.json(), so the
+        method is replaced on the response instance, for requests and aiohttp
+        responses alike.
+
+        Objects of responses of an http error status are decoded as
+        HttpErrorResponse, so the status is known to layers such as RetryPolicy
+        even when the body has no statusCode.
+
+        Args:
+            -response- http response
+            -content- body of the response, already read
+
+        Returns:
+            -response- the same response
+        """
+        # requests responses have status_code, aiohttp responses status.
+        status = getattr(response, "status_code", None) or getattr(response, "status", None)
+        if isinstance(status, int) and status >= 400:
+            response.json = lambda *args, **kwargs: HttpErrorResponse.of(self.loads(content), status)
+        else:
+            response.json = lambda *args, **kwargs: self.loads(content)
+        return response
+
+
+class PreparedBody(dict):
+    """
+    Request body whose JSON encoding is already known.
+
+    ApiSignatureAuth builds it while signing, so sessions of this sdk send
+    `encoded` as is instead of encoding the body again. Other http clients
+    see a plain dict.
+    """
+
+    def __init__(self, body: dict, encoded: bytes):
+        """Initialize with body and its UTF-8 JSON encoding."""
+        super().__init__(body)
+        self.encoded = encoded
+
+
+class HttpErrorResponse(dict):
+    """Response decoded from a body answered with an http error status, a plain dict otherwise."""
+
+    def __init__(self, response: dict, http_status: int):
+        """Initialize with the decoded response and the http status it was answered with."""
+        super().__init__(response)
+        self.http_status = http_status
+
+    @classmethod
+    def of(cls, response, http_status: int):
+        """Return response with its http status when it is an object, as is otherwise."""
+        return cls(response, http_status) if isinstance(response, dict) else response
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec of the standard library."""
+
+    name = "stdlib"
+
+    def dumps(self, value) -> bytes:
+        """Return value encoded as compact UTF-8 JSON."""
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data):
+        """Return value decoded from JSON bytes or str."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson, several times faster than the standard library."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """Initialize, requires orjson."""
+        if orjson is None:
+            raise ImportError("orjson is required for OrjsonCodec, install it with `pip install orjson`.")
+
+    def dumps(self, value) -> bytes:
+        """Return value encoded as compact UTF-8 JSON."""
+        return orjson.dumps(value)
+
+    def loads(self, data):
+        """Return value decoded from JSON bytes or str. orjson.JSONDecodeError subclasses json.JSONDecodeError."""
+        return orjson.loads(data)
+
+
+def default_json_codec():
+    """Return OrjsonCodec when orjson is installed, StdlibJsonCodec otherwise."""
+    return OrjsonCodec() if orjson is not None else StdlibJsonCodec()
@@ -0,0 +1,95 @@
+"""
+This module implements layers wrapping endpoints of an ApiClient instance.
+
+A layer intercepts calls of the endpoints it applies to, e.g. to answer from
+a cache or to retry, and works the same for ApiClient and AsyncApiClient.
+ApiClient installs the layers given to its constructor, the first given being
+the outermost.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import functools
+import inspect
+from uplink.interfaces import RequestDefinitionBuilder
+from sdk.endpoints import LazyEndpoint
+
+
+@functools.lru_cache(maxsize=None)
+def endpoint_methods(api_client_class):
+    """
+    Return http methods of endpoints declared by given ApiClient class.
+
+    Args:
+        -api_client_class- ApiClient or a subclass of it
+
+    Returns:
+        -methods- dict of endpoint name to http method, e.g. {"user_detail": "GET", ...}
+    """
+    methods = {}
+    for name in dir(api_client_class):
+        if name.startswith("_"):
+            continue
+        definition = inspect.getattr_static(api_client_class, name)
+        if isinstance(definition, LazyEndpoint):
+            # known without building the endpoint.
+            methods[name] = definition.method
+            continue
+        definition = getattr(api_client_class, name)
+        if isinstance(definition, RequestDefinitionBuilder):
+            methods[name] = definition.method.upper()
+    return methods
+
+
+@functools.lru_cache(maxsize=None)
+def _signature_of(api_client_class, name):
+    definition = inspect.getattr_static(api_client_class, name)
+    if isinstance(definition, LazyEndpoint):
+        return inspect.signature(definition.func)
+    return inspect.signature(getattr(api_client_class, name))
+
+
+def bound_arguments(api_client_class, name, args, kwargs):
+    """
+    Return arguments of an endpoint call by parameter name, defaults included.
+
+    Args:
+        -api_client_class- ApiClient or a subclass of it
+        -name- endpoint name
+        -args- positional arguments of the call
+        -kwargs- keyword arguments of the call
+
+    Returns:
+        -arguments- dict of parameter name to value
+    """
+    bound = _signature_of(api_client_class, name).bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self", None)
+    return arguments
+
+
+class EndpointLayer:
+    """Base class of endpoint layers, passing calls through unchanged."""
+
+    def endpoint_names(self, api_client_class):
+        """Return names of the endpoints of api_client_class this layer applies to."""
+        raise NotImplementedError
+
+    def call(self, api_client_class, name, endpoint, args, kwargs):
+        """Call endpoint of given name of a synchronous client."""
+        return endpoint(*args, **kwargs)
+
+    async def acall(self, api_client_class, name, endpoint, args, kwargs):
+        """Await endpoint of given name of an asynchronous client."""
+        return await endpoint(*args, **kwargs)
+
+    def wrap(self, api_client_class, name, endpoint, asynchronous: bool):
+        """Return endpoint wrapped so that its calls go through this layer."""
+        if asynchronous:
+            async def wrapper(*args, **kwargs):
+                return await self.acall(api_client_class, name, endpoint, args, kwargs)
+        else:
+            def wrapper(*args, **kwargs):
+                return self.call(api_client_class, name, endpoint, args, kwargs)
+        return functools.wraps(endpoint)(wrapper)
@@ -0,0 +1,78 @@
+"""
+This module implements helpers for cheap, redacted debug logging.
+
+Debug logs of requests are only formatted when DEBUG is enabled for the logger
+and the request is picked by the sampler, and secret fields such as
+`ownerSecret` or `walletSecret` never reach the log.
+
+    configure_debug_sampling(0.01)  # log 1% of requests at DEBUG
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import logging
+import random
+import re
+
+REDACTED = "***"
+
+_SECRET_KEY = re.compile("secret", re.IGNORECASE)
+_SECRET_PARAMETER = re.compile(r"([^&?=]*secret=)[^&]*", re.IGNORECASE)
+
+
+def redact(value):
+    """
+    Return a copy of value with values of secret fields replaced.
+
+    Args:
+        -value- dict, list or scalar such as a request body
+
+    Returns:
+        -redacted- copy of value, where any field whose name contains `secret` is REDACTED
+    """
+    if isinstance(value, dict):
+        return {key: REDACTED if isinstance(key, str) and _SECRET_KEY.search(key) else redact(item) for (key, item) in value.items()}
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def redact_sign_target(sign_target):
+    """
+    Return sign target with values of secret parameters replaced.
+
+    Args:
+        -sign_target- flatten request as str or utf-8 bytes
+
+    Returns:
+        -redacted- sign target as str
+    """
+    if isinstance(sign_target, bytes):
+        sign_target = sign_target.decode("utf-8")
+    return _SECRET_PARAMETER.sub(r"\1" + REDACTED, sign_target)
+
+
+class DebugLogSampler:
+    """This is to decide whether a request is logged at DEBUG."""
+
+    def __init__(self, rate: float = 1.0):
+        """Initialize with rate, the fraction of requests logged when DEBUG is enabled."""
+        self.rate = rate
+
+    def sample(self):
+        """Return whether a request is sampled, to be decided once per request."""
+        return self.rate >= 1.0 or random.random() < self.rate
+
+    def enabled_for(self, logger: logging.Logger, sampled: bool = None):
+        """Return True when logger emits DEBUG and this request is sampled, by `sampled` when already decided."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return False
+        return self.sample() if sampled is None else sampled
+
+
+debug_sampler = DebugLogSampler()
+
+
+def configure_debug_sampling(rate: float):
+    """Set the fraction of requests logged at DEBUG, from 0.0 to 1.0."""
+    debug_sampler.rate = rate
@@ -0,0 +1,124 @@
+"""
+This module implements auto-paginating iterators for list endpoints.
+
+List endpoints such as `service_token_holders`, `service_wallet_transactions`
+or `user_fungible_tokens` take `limit`, `page` and `order_by` and return one page.
+The iterators here walk every page lazily and yield single records, while the
+next page is fetched in the background as the current one is consumed.
+
+    for holder in paginate(api_client.service_token_holders, contract_id, limit=100):
+        ...
+
+    async for transaction in apaginate(async_api_client.user_transactions, user_id):
+        ...
+
+Records are dicts, or compact records of `sdk.records` given `record_type`.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from sdk.exceptions import check_response
+from sdk.records import to_records
+
+PAGINATED_ENDPOINTS = (
+    "service_token_holders",
+    "service_wallet_transactions",
+    "service_wallet_service_tokens",
+    "service_wallet_fungible_tokens",
+    "service_wallet_non_fungible_tokens",
+    "service_wallet_non_fungible_token_type",
+    "user_transactions",
+    "user_service_tokens",
+    "user_fungible_tokens",
+    "user_non_fungible_tokens",
+    "user_non_fungible_token_type",
+)
+
+
+def _records_of(response, record_type=None):
+    records = check_response(response).get("responseData") or []
+    return to_records(record_type, records) if record_type is not None else records
+
+
+def paginate(endpoint, *args, limit: int = 100, order_by: str = "desc", page: int = 1, prefetch: bool = True,
+             record_type=None, **kwargs):
+    """
+    Iterate records of every page of given list endpoint.
+
+    Args:
+        -endpoint- bound list endpoint of ApiClient, e.g. api_client.user_transactions
+        -args- positional arguments of the endpoint, e.g. user_id
+        -limit- page size
+        -order_by- `asc` or `desc`
+        -page- page to start from
+        -prefetch- fetch the next page in background while the current one is consumed
+        -record_type- Record subclass of sdk.records, or callable taking a record dict, to yield instead of dicts
+        -kwargs- other query arguments of the endpoint, e.g. before or after
+
+    Returns:
+        -records- generator of records, stopping after an empty or short page
+    """
+    def fetch(page_number):
+        return _records_of(endpoint(*args, limit=limit, page=page_number, order_by=order_by, **kwargs), record_type)
+
+    if not prefetch:
+        while True:
+            records = fetch(page)
+            yield from records
+            if len(records) < limit:
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = executor.submit(fetch, page)
+        while True:
+            records = pending.result()
+            if len(records) < limit:
+                pending = None
+                yield from records
+                return
+            page += 1
+            pending = executor.submit(fetch, page)
+            yield from records
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+
+async def apaginate(endpoint, *args, limit: int = 100, order_by: str = "desc", page: int = 1, prefetch: bool = True,
+                    record_type=None, **kwargs):
+    """
+    Iterate records of every page of given list endpoint of AsyncApiClient.
+
+    Same as paginate, but `endpoint` returns a coroutine and the next page is
+    prefetched as an asyncio task.
+
+    Returns:
+        -records- async generator of records, stopping after an empty or short page
+    """
+    async def fetch(page_number):
+        return _records_of(await endpoint(*args, limit=limit, page=page_number, order_by=order_by, **kwargs), record_type)
+
+    pending = asyncio.ensure_future(fetch(page))
+    try:
+        while True:
+            records = await pending
+            pending = None
+            if len(records) < limit:
+                for record in records:
+                    yield record
+                return
+            page += 1
+            if prefetch:
+                pending = asyncio.ensure_future(fetch(page))
+            for record in records:
+                yield record
+            if pending is None:
+                pending = asyncio.ensure_future(fetch(page))
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,167 @@
+"""
+This module implements client-side rate limiting of endpoint calls.
+
+RateLimiter holds calls back before they are signed and sent, so that traffic
+of one api key stays just under the server quota instead of being rejected by
+it. Reads (GET) and writes draw from separate token buckets, and an endpoint
+may weigh more than one token.
+
+    limiter = RateLimiter(read_rate=45, write_rate=9, weights={"multi_mint_non_fungible_token": 5}, state_path="/tmp/line-sdk.rate")
+    api_client = ApiClient(base_url=api_base_url, auth=auth, layers=[limiter])
+
+Given a state_path, the buckets live in that file under an exclusive file lock,
+so every thread and every process on the host using the same path shares one
+budget. Otherwise the budget is shared by the threads of this process only.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import asyncio
+import os
+import struct
+import threading
+import time
+from sdk.layers import EndpointLayer, endpoint_methods
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_STATE = struct.Struct("=dd")
+
+
+class TokenBucket:
+    """This is to hand out tokens at a steady rate, with bursts up to capacity."""
+
+    def __init__(self, rate: float, capacity: float = None, state_path: str = None, slot: int = 0, clock=time.time):
+        """
+        Initialize token bucket, full.
+
+        Args:
+            -rate- tokens added per second
+            -capacity- maximum tokens stored, i.e. largest burst, defaults to rate
+            -state_path- file shared by processes to keep the bucket in, in memory when omitted
+            -slot- index of this bucket in state_path, for several buckets in one file
+            -clock- function returning wall clock seconds, shared by processes
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if state_path is not None and fcntl is None:
+            raise RuntimeError("sharing a token bucket across processes requires fcntl")
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self.state_path = state_path
+        self.clock = clock
+        self.__offset = slot * _STATE.size
+        self.__lock = threading.Lock()
+        self.__state = (self.capacity, clock())
+        self.__fd = None
+        self.__pid = None
+
+    def __descriptor(self):
+        # a descriptor must not cross fork, or the file lock would be shared with the parent.
+        if self.__fd is None or self.__pid != os.getpid():
+            self.__fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o600)
+            self.__pid = os.getpid()
+        return self.__fd
+
+    def __take(self, state, tokens):
+        (available, updated) = state
+        now = self.clock()
+        available = min(self.capacity, available + max(0.0, now - updated) * self.rate) - tokens
+        delay = -available / self.rate if available < 0 else 0.0
+        return (available, now), delay
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket, going into debt when there are not enough.
+
+        Args:
+            -tokens- number of tokens taken
+
+        Returns:
+            -delay- seconds to wait before using the tokens
+        """
+        with self.__lock:
+            if self.state_path is None:
+                (self.__state, delay) = self.__take(self.__state, tokens)
+                return delay
+            fd = self.__descriptor()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                data = os.pread(fd, _STATE.size, self.__offset)
+                state = _STATE.unpack(data) if len(data) == _STATE.size else (self.capacity, self.clock())
+                (state, delay) = self.__take(state, tokens)
+                os.pwrite(fd, _STATE.pack(*state), self.__offset)
+                return delay
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self):
+        """Close the state file of this process."""
+        with self.__lock:
+            if self.__fd is not None and self.__pid == os.getpid():
+                os.close(self.__fd)
+            self.__fd = None
+
+
+class RateLimiter(EndpointLayer):
+    """This is to keep endpoint calls within separate read and write budgets."""
+
+    def __init__(self, read_rate: float, write_rate: float, read_capacity: float = None, write_capacity: float = None,
+                 weights: dict = None, state_path: str = None):
+        """
+        Initialize rate limiter.
+
+        Args:
+            -read_rate- tokens per second for GET endpoints, set a little under the server quota
+            -write_rate- tokens per second for POST, PUT and DELETE endpoints
+            -read_capacity- largest burst of reads, defaults to read_rate
+            -write_capacity- largest burst of writes, defaults to write_rate
+            -weights- endpoint name to tokens taken per call, 1 for endpoints not given
+            -state_path- file sharing the budgets across processes, per process when omitted
+        """
+        self.weights = dict(weights or {})
+        self.read_bucket = TokenBucket(read_rate, read_capacity, state_path, slot=0)
+        self.write_bucket = TokenBucket(write_rate, write_capacity, state_path, slot=1)
+        self.throttled = 0
+        self.waited = 0.0
+        self.__lock = threading.Lock()
+
+    def endpoint_names(self, api_client_class):
+        """Return names of every endpoint."""
+        return list(endpoint_methods(api_client_class))
+
+    def stats(self):
+        """Return number of calls held back and total seconds waited."""
+        with self.__lock:
+            return {"throttled": self.throttled, "waited": self.waited}
+
+    def close(self):
+        """Close the shared state file of this process."""
+        self.read_bucket.close()
+        self.write_bucket.close()
+
+    def __reserve(self, api_client_class, name):
+        bucket = self.read_bucket if endpoint_methods(api_client_class)[name] == "GET" else self.write_bucket
+        delay = bucket.reserve(self.weights.get(name, 1))
+        if delay > 0:
+            with self.__lock:
+                self.throttled += 1
+                self.waited += delay
+        return delay
+
+    def call(self, api_client_class, name, endpoint, args, kwargs):
+        """Wait for the budget of the endpoint, then call it."""
+        delay = self.__reserve(api_client_class, name)
+        if delay > 0:
+            time.sleep(delay)
+        return endpoint(*args, **kwargs)
+
+    async def acall(self, api_client_class, name, endpoint, args, kwargs):
+        """Wait for the budget of the endpoint without blocking the event loop, then await it."""
+        delay = self.__reserve(api_client_class, name)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await endpoint(*args, **kwargs)
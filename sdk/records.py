@@ -0,0 +1,238 @@
+"""
+This module implements compact record types for common list responses.
+
+Records of `service_token_holders`, `user_non_fungible_tokens` or
+`service_wallet_transactions` are decoded as one dict each, which is costly
+when hundreds of thousands of them are held, e.g. for reconciliation. The
+record types here keep only the common fields in `__slots__` and intern the
+strings repeated across records, such as contract ids, token types and names.
+
+    for holder in paginate(api_client.service_token_holders, contract_id, record_type=Holder):
+        holder.address, holder.amount
+
+RecordMapper converts responseData of list endpoints of a client instead:
+
+    api_client = ApiClient(base_url=api_base_url, auth=auth, layers=[RecordMapper()])
+    api_client.service_token_holders(contract_id)["responseData"]  # [Holder(...), ...]
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import sys
+from sdk.exceptions import SUCCESS_STATUS_CODE
+from sdk.layers import EndpointLayer, endpoint_methods
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Record:
+    """Base class of record types, comparing and converting by their fields."""
+
+    __slots__ = ()
+    # (attribute, key in response) of every field, in __slots__ order.
+    FIELDS = ()
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Return record of given record of a response."""
+        raise NotImplementedError
+
+    def to_dict(self):
+        """Return fields of this record by their key in response."""
+        return {key: getattr(self, attribute) for (attribute, key) in self.FIELDS}
+
+    def __eq__(self, other):
+        """Return whether other is a record of the same type and fields."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, attribute) == getattr(other, attribute) for attribute in self.__slots__)
+
+    def __hash__(self):
+        """Return hash of fields."""
+        return hash(tuple(getattr(self, attribute) for attribute in self.__slots__))
+
+    def __repr__(self):
+        """Return representation with every field."""
+        fields = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Holder(Record):
+    """Holder of a service token or fungible item token."""
+
+    __slots__ = ("address", "user_id", "amount")
+    FIELDS = (("address", "address"), ("user_id", "userId"), ("amount", "amount"))
+
+    def __init__(self, address: str, user_id: str = None, amount: str = None):
+        """Initialize with wallet address, user id if a user holds it and amount."""
+        self.address = address
+        self.user_id = user_id
+        self.amount = amount
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Return holder of given holder record of a response."""
+        return cls(data.get("address") or data.get("walletAddress"), data.get("userId"), data.get("amount"))
+
+
+class Balance(Record):
+    """Balance of base coin, a service token or a fungible item token."""
+
+    __slots__ = ("contract_id", "token_type", "name", "symbol", "decimals", "amount")
+    FIELDS = (
+        ("contract_id", "contractId"),
+        ("token_type", "tokenType"),
+        ("name", "name"),
+        ("symbol", "symbol"),
+        ("decimals", "decimals"),
+        ("amount", "amount"),
+    )
+
+    def __init__(self, contract_id: str = None, token_type: str = None, name: str = None, symbol: str = None,
+                 decimals: int = None, amount: str = None):
+        """Initialize with token identity, contract_id or token_type being None for base coin."""
+        self.contract_id = _intern(contract_id)
+        self.token_type = _intern(token_type)
+        self.name = _intern(name)
+        self.symbol = _intern(symbol)
+        self.decimals = decimals
+        self.amount = amount
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Return balance of given balance record of a response."""
+        return cls(data.get("contractId"), data.get("tokenType"), data.get("name"), data.get("symbol"),
+                   data.get("decimals"), data.get("amount"))
+
+
+class NonFungibleToken(Record):
+    """Non-fungible item token, of a token type list or a holder's list."""
+
+    __slots__ = ("token_type", "token_index", "name", "meta")
+    FIELDS = (("token_type", "tokenType"), ("token_index", "tokenIndex"), ("name", "name"), ("meta", "meta"))
+
+    def __init__(self, token_type: str, token_index: str, name: str = None, meta: str = None):
+        """Initialize with token type, token index, name and meta."""
+        self.token_type = _intern(token_type)
+        self.token_index = token_index
+        self.name = _intern(name)
+        self.meta = meta
+
+    @property
+    def token_id(self):
+        """Return token id, token type followed by token index."""
+        return self.token_type + self.token_index
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Return item token of given record of a response, the token being nested or not."""
+        token = data.get("token")
+        if isinstance(token, dict):
+            return cls(data.get("tokenType"), token.get("tokenIndex"), token.get("name", data.get("name")), token.get("meta"))
+        return cls(data.get("tokenType"), data.get("tokenIndex"), data.get("name"), data.get("meta"))
+
+
+class TransactionSummary(Record):
+    """Summary of a transaction, without its logs and messages."""
+
+    __slots__ = ("txhash", "height", "code", "timestamp", "msg_type", "memo")
+    FIELDS = (
+        ("txhash", "txhash"),
+        ("height", "height"),
+        ("code", "code"),
+        ("timestamp", "timestamp"),
+        ("msg_type", "msgType"),
+        ("memo", "memo"),
+    )
+
+    def __init__(self, txhash: str, height: int = None, code: int = None, timestamp: int = None,
+                 msg_type: str = None, memo: str = None):
+        """Initialize with txhash, height, result code, timestamp, type of the first message and memo."""
+        self.txhash = txhash
+        self.height = height
+        self.code = code
+        self.timestamp = timestamp
+        self.msg_type = _intern(msg_type)
+        self.memo = memo
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Return summary of given transaction record of a response."""
+        value = (data.get("tx") or {}).get("value") or {}
+        messages = value.get("msg") or []
+        msg_type = messages[0].get("type") if messages and isinstance(messages[0], dict) else None
+        return cls(data.get("txhash"), data.get("height"), data.get("code"), data.get("timestamp"), msg_type,
+                   value.get("memo") or None)
+
+
+# record type of responseData of each list endpoint.
+DEFAULT_RECORD_TYPES = {
+    "service_token_holders": Holder,
+    "fungible_token_holders": Holder,
+    "service_wallet_base_coin": Balance,
+    "service_wallet_service_tokens": Balance,
+    "service_wallet_fungible_tokens": Balance,
+    "user_base_coin": Balance,
+    "user_service_tokens": Balance,
+    "user_fungible_tokens": Balance,
+    "service_wallet_non_fungible_tokens": NonFungibleToken,
+    "service_wallet_non_fungible_token_type": NonFungibleToken,
+    "user_non_fungible_tokens": NonFungibleToken,
+    "user_non_fungible_token_type": NonFungibleToken,
+    "service_wallet_transactions": TransactionSummary,
+    "user_transactions": TransactionSummary,
+}
+
+
+def to_records(record_type, response_data):
+    """
+    Convert responseData of a response with given record type.
+
+    Args:
+        -record_type- Record subclass, or any callable taking a record dict
+        -response_data- list of records, a single record or None
+
+    Returns:
+        -records- list of records, a single record or None
+    """
+    convert = record_type.from_dict if isinstance(record_type, type) and issubclass(record_type, Record) else record_type
+    if isinstance(response_data, list):
+        return [convert(data) for data in response_data]
+    if isinstance(response_data, dict):
+        return convert(response_data)
+    return response_data
+
+
+class RecordMapper(EndpointLayer):
+    """This is to return responseData of list endpoints as compact records."""
+
+    def __init__(self, record_types: dict = None):
+        """
+        Initialize with record types of endpoints.
+
+        Args:
+            -record_types- dict of endpoint name to record type, DEFAULT_RECORD_TYPES by default
+        """
+        self.record_types = dict(DEFAULT_RECORD_TYPES if record_types is None else record_types)
+
+    def endpoint_names(self, api_client_class):
+        """Return names of the endpoints having a record type."""
+        methods = endpoint_methods(api_client_class)
+        return [name for name in self.record_types if name in methods]
+
+    def call(self, api_client_class, name, endpoint, args, kwargs):
+        """Call endpoint and convert responseData of a successful response."""
+        return self.__map(name, endpoint(*args, **kwargs))
+
+    async def acall(self, api_client_class, name, endpoint, args, kwargs):
+        """Await endpoint and convert responseData of a successful response."""
+        return self.__map(name, await endpoint(*args, **kwargs))
+
+    def __map(self, name, response):
+        if not isinstance(response, dict) or response.get("statusCode") != SUCCESS_STATUS_CODE:
+            return response
+        mapped = dict(response)
+        mapped["responseData"] = to_records(self.record_types[name], response.get("responseData"))
+        return mapped
@@ -4,6 +4,13 @@ This module implements flattening request.
 Author: Yoonyoul Yoo
 Date: 2021/01/09
 """
+import json
+from json.encoder import encode_basestring
+
+try:
+    from sdk import _speedups
+except ImportError:
+    _speedups = None
 
 
 class RequestBodyFlattener:
@@ -14,19 +21,20 @@ class RequestBodyFlattener:
             return f"{key}={value}"
 
         if (isinstance(value, list)):
-            l_key_value = {}
+            columns = {}
             for index, ele in enumerate(value):
-                for lkey in list(ele.keys() | l_key_value.keys()):
-                    if lkey in ele.keys():
-                        lvalue = ele[lkey]
-                    else:
-                        lvalue = ""
-
-                    if (lkey in l_key_value.keys()):
-                        l_key_value[lkey] = f"{l_key_value[lkey]},{lvalue}"
-                    else:
-                        l_key_value[lkey] = f"{',' * index}{lvalue}"
-            return "&".join("%s=%s" % (f"{key}.{lkey}", lvalue) for (lkey, lvalue) in sorted(l_key_value.items()))
+                for (lkey, lvalue) in ele.items():
+                    column = columns.get(lkey)
+                    if column is None:
+                        column = columns[lkey] = []
+                    if len(column) < index:
+                        column.extend([""] * (index - len(column)))
+                    column.append(str(lvalue))
+            size = len(value)
+            for column in columns.values():
+                if len(column) < size:
+                    column.extend([""] * (size - len(column)))
+            return "&".join(f"{key}.{lkey}={','.join(column)}" for (lkey, column) in sorted(columns.items()))
 
     def flatten(self, body: dict = {}):
         """
@@ -38,5 +46,66 @@ class RequestBodyFlattener:
         Returns:
             flatten request in inlined string.
         """
+        if _speedups is not None:
+            flattened = _speedups.flatten(body)
+            if flattened is not None:
+                return flattened
+
         sorted_body = sorted(body.items())
         return "&".join(self.__flatten_key_value(key, value) for (key, value) in sorted_body)
+
+    def __encode_value(self, value):
+        if isinstance(value, str):
+            return encode_basestring(value)
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+    def __flatten_and_encode_list(self, key, value, json_pieces):
+        columns = {}
+        for index, ele in enumerate(value):
+            json_pieces.append("{" if index == 0 else ",{")
+            for item_index, (lkey, lvalue) in enumerate(ele.items()):
+                json_pieces += ("," if item_index else "", encode_basestring(lkey), ":", self.__encode_value(lvalue))
+                column = columns.get(lkey)
+                if column is None:
+                    column = columns[lkey] = []
+                if len(column) < index:
+                    column.extend([""] * (index - len(column)))
+                column.append(str(lvalue))
+            json_pieces.append("}")
+        size = len(value)
+        for column in columns.values():
+            if len(column) < size:
+                column.extend([""] * (size - len(column)))
+        return "&".join(f"{key}.{lkey}={','.join(column)}" for (lkey, column) in sorted(columns.items()))
+
+    def flatten_and_encode(self, body: dict):
+        """
+        Flatten given body and encode it as JSON in a single pass.
+
+        Args:
+            body: request body object
+
+        Returns:
+            (flattened, encoded) the flatten request as flatten() returns it and the
+            compact UTF-8 JSON of body, or None when body has values flatten() does not support.
+        """
+        if _speedups is not None:
+            result = _speedups.flatten_and_encode(body)
+            if result is not None:
+                return result
+
+        pieces = []
+        json_pieces = ["{"]
+        for (index, (key, value)) in enumerate(sorted(body.items())):
+            json_pieces += ("," if index else "", encode_basestring(key), ":")
+            if isinstance(value, str):
+                pieces.append(f"{key}={value}")
+                json_pieces.append(encode_basestring(value))
+            elif isinstance(value, list) and all(isinstance(ele, dict) for ele in value):
+                json_pieces.append("[")
+                pieces.append(self.__flatten_and_encode_list(key, value, json_pieces))
+                json_pieces.append("]")
+            else:
+                return None
+        json_pieces.append("}")
+        return "&".join(pieces), "".join(json_pieces).encode("utf-8")
@@ -0,0 +1,180 @@
+"""
+This module implements retrying endpoint calls that failed transiently.
+
+RetryPolicy calls the endpoint again after connection errors, timeouts, and
+responses of a server error status, be it their http status or statusCode,
+sleeping between attempts with decorrelated jitter. Each attempt calls the
+endpoint anew, so ApiSignatureAuth signs it with a fresh Nonce and Timestamp.
+
+GET endpoints are retried automatically. POST, PUT and DELETE endpoints may
+have taken effect although the call failed, so they are retried only when
+listed in `safe_endpoints`. A retry budget shared by all calls of the client
+caps retries to a fraction of calls, so an outage of the api does not
+multiply the traffic sent to it.
+
+    retry_policy = RetryPolicy(safe_endpoints=("update_service_token_detail",))
+    api_client = ApiClient(base_url=api_base_url, auth=auth, layers=[retry_policy, limiter])
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+import requests
+from sdk.layers import EndpointLayer, endpoint_methods
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# 5xxx mirror http server errors, 4290 mirrors http 429 too many requests.
+RETRYABLE_STATUS_CODES = frozenset([4290]) | frozenset(range(5000, 6000))
+
+# http status of responses retried whatever their body, e.g. a 503 of a gateway.
+RETRYABLE_HTTP_STATUSES = frozenset([429]) | frozenset(range(500, 600))
+
+# decoding errors cover bodies that are not json, e.g. an error page of a gateway.
+RETRYABLE_EXCEPTIONS = (requests.ConnectionError, requests.Timeout, asyncio.TimeoutError, json.JSONDecodeError)
+if aiohttp is not None:
+    RETRYABLE_EXCEPTIONS += (aiohttp.ClientConnectionError, aiohttp.ContentTypeError)
+
+
+class RetryBudget:
+    """This is to allow retries only up to a fraction of calls."""
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10):
+        """
+        Initialize retry budget, full.
+
+        Args:
+            -ratio- retries earned by each call, e.g. 0.2 allows one retry per 5 calls
+            -capacity- most retries saved up for a burst of failures
+        """
+        self.ratio = ratio
+        self.capacity = capacity
+        self.__balance = capacity
+        self.__lock = threading.Lock()
+
+    def deposit(self):
+        """Earn retries for a call."""
+        with self.__lock:
+            self.__balance = min(self.capacity, self.__balance + self.ratio)
+
+    def withdraw(self):
+        """Spend a retry. Returns False when none is left."""
+        with self.__lock:
+            if self.__balance < 1:
+                return False
+            self.__balance -= 1
+            return True
+
+
+class RetryPolicy(EndpointLayer):
+    """This is to retry transient failures of endpoint calls with fresh signatures."""
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.1, max_delay: float = 5, safe_endpoints=(),
+                 retryable_status_codes=RETRYABLE_STATUS_CODES, budget: RetryBudget = None,
+                 retryable_http_statuses=RETRYABLE_HTTP_STATUSES):
+        """
+        Initialize retry policy.
+
+        Args:
+            -max_attempts- most attempts of a call, the first one included
+            -base_delay- shortest seconds slept before a retry
+            -max_delay- longest seconds slept before a retry
+            -safe_endpoints- names of POST, PUT or DELETE endpoints safe to call more than once
+            -retryable_status_codes- statusCode of responses retried
+            -budget- RetryBudget shared by calls, defaults to RetryBudget()
+            -retryable_http_statuses- http status of responses retried, known for sessions created by this sdk
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.safe_endpoints = frozenset(safe_endpoints)
+        self.retryable_status_codes = frozenset(retryable_status_codes)
+        self.budget = budget or RetryBudget()
+        self.retryable_http_statuses = frozenset(retryable_http_statuses)
+        self.retries = 0
+        self.exhausted = 0
+        self.__random = random.Random()
+        self.__lock = threading.Lock()
+
+    def endpoint_names(self, api_client_class):
+        """Return names of the GET endpoints and of the safe endpoints."""
+        return [name for (name, method) in endpoint_methods(api_client_class).items()
+                if method == "GET" or name in self.safe_endpoints]
+
+    def stats(self):
+        """Return number of retries made and of retries denied by the budget."""
+        with self.__lock:
+            return {"retries": self.retries, "exhausted": self.exhausted}
+
+    def __retryable(self, response, error):
+        if error is not None:
+            return isinstance(error, RETRYABLE_EXCEPTIONS)
+        if not isinstance(response, dict):
+            return False
+        return (response.get("statusCode") in self.retryable_status_codes
+                or getattr(response, "http_status", None) in self.retryable_http_statuses)
+
+    def __next_delay(self, name, attempt, delay, response, error):
+        """Return seconds to sleep before retrying, or None to give up."""
+        if attempt >= self.max_attempts or not self.__retryable(response, error):
+            return None
+        if not self.budget.withdraw():
+            with self.__lock:
+                self.exhausted += 1
+            return None
+        with self.__lock:
+            self.retries += 1
+        # decorrelated jitter: random between base and 3 times the previous delay.
+        delay = min(self.max_delay, self.__random.uniform(self.base_delay, delay * 3))
+        if error is not None:
+            self.__logger.info("retrying %s in %.3fs after attempt %s: %r", name, delay, attempt, error)
+        else:
+            self.__logger.info("retrying %s in %.3fs after attempt %s: http status %s, statusCode %s", name, delay,
+                               attempt, getattr(response, "http_status", None), response.get("statusCode"))
+        return delay
+
+    def call(self, api_client_class, name, endpoint, args, kwargs):
+        """Call endpoint, retrying transient failures."""
+        self.budget.deposit()
+        (attempt, delay) = (1, self.base_delay)
+        while True:
+            (response, error) = (None, None)
+            try:
+                response = endpoint(*args, **kwargs)
+            except Exception as raised:
+                error = raised
+            delay = self.__next_delay(name, attempt, delay, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            time.sleep(delay)
+            attempt += 1
+
+    async def acall(self, api_client_class, name, endpoint, args, kwargs):
+        """Await endpoint, retrying transient failures."""
+        self.budget.deposit()
+        (attempt, delay) = (1, self.base_delay)
+        while True:
+            (response, error) = (None, None)
+            try:
+                response = await endpoint(*args, **kwargs)
+            except Exception as raised:
+                error = raised
+            delay = self.__next_delay(name, attempt, delay, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
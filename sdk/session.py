@@ -0,0 +1,122 @@
+"""
+This module implements pooled, keep-alive http sessions for ApiClient.
+
+A session created here can be shared by many ApiClient instances, so the
+TCP and TLS handshakes are paid once per pooled connection, not per client.
+Sessions encode request bodies and decode responses with a JsonCodec.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from sdk.json_codec import JsonCodec, PreparedBody, default_json_codec
+from sdk.streaming import StreamingResponse, streaming_chunk_size
+
+
+class PoolConfig:
+    """This is to configure connection pooling and timeouts of the http session."""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        keep_alive_timeout: float = 30,
+        connect_timeout: float = 5,
+        read_timeout: float = 30
+    ):
+        """
+        Initialize pool configuration.
+
+        Args:
+            -max_connections- upper bound of pooled connections over all hosts
+            -max_connections_per_host- upper bound of pooled connections to a single host
+            -keep_alive_timeout- seconds an idle connection is kept before being discarded
+            -connect_timeout- seconds to wait for establishing a connection
+            -read_timeout- seconds to wait for the server to send a response
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keep_alive_timeout = keep_alive_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """Http adapter applying pool limits, idle timeout and default timeouts."""
+
+    def __init__(self, pool_config: PoolConfig):
+        """Initialize with pool_config."""
+        self.pool_config = pool_config
+        self.__lock = threading.Lock()
+        self.__last_used = time.monotonic()
+        per_host = max(1, pool_config.max_connections_per_host)
+        super().__init__(
+            pool_connections=max(1, pool_config.max_connections // per_host),
+            pool_maxsize=per_host,
+            pool_block=True)
+
+    def __discard_idle_connections(self):
+        # urllib3 has no idle timeout of its own, so connections left unused
+        # longer than keep_alive_timeout are dropped before the server does it.
+        with self.__lock:
+            now = time.monotonic()
+            if now - self.__last_used > self.pool_config.keep_alive_timeout:
+                self.poolmanager.clear()
+            self.__last_used = now
+
+    def send(self, request, timeout=None, **kwargs):
+        """Send request, applying configured timeouts when the caller gives none."""
+        self.__discard_idle_connections()
+        if timeout is None:
+            timeout = (self.pool_config.connect_timeout, self.pool_config.read_timeout)
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+class CodecSession(requests.Session):
+    """Requests session encoding json bodies and decoding responses with a JsonCodec."""
+
+    def __init__(self, json_codec: JsonCodec = None):
+        """Initialize with json_codec, defaults to default_json_codec()."""
+        super().__init__()
+        self.json_codec = json_codec or default_json_codec()
+
+    def request(self, method, url, data=None, headers=None, json=None, **kwargs):
+        """
+        Send request, encoding `json` with the codec, and return the response decoding with it.
+
+        Within sdk.streaming.streaming_responses, the body is left unread and
+        response.json() returns a StreamingResponse reading it chunk by chunk.
+        """
+        if json is not None and not data:
+            data = json.encoded if isinstance(json, PreparedBody) else self.json_codec.dumps(json)
+            headers = dict(headers or {})
+            headers.setdefault("Content-Type", "application/json")
+        chunk_size = streaming_chunk_size()
+        if chunk_size is not None:
+            response = super().request(method, url, data=data, headers=headers, stream=True, **kwargs)
+            response.json = lambda *args, **kwargs: StreamingResponse(
+                response.iter_content(chunk_size), self.json_codec, response.close)
+            return response
+        response = super().request(method, url, data=data, headers=headers, **kwargs)
+        return self.json_codec.bind(response, response.content)
+
+
+def create_pooled_session(pool_config: PoolConfig = None, json_codec: JsonCodec = None):
+    """
+    Create a requests session backed by a pooled, keep-alive adapter.
+
+    Args:
+        -pool_config- pooling configuration, defaults to PoolConfig()
+        -json_codec- JsonCodec of request bodies and responses, defaults to default_json_codec()
+
+    Returns:
+        -session- requests.Session to pass as `client` to one or more ApiClient
+    """
+    adapter = PooledHTTPAdapter(pool_config or PoolConfig())
+    session = CodecSession(json_codec)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
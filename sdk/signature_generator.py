@@ -23,22 +23,104 @@ import hashlib
 import base64
 import logging
 import sys
+from sdk.log_utils import debug_sampler, redact, redact_sign_target
 from sdk.request_flattener import RequestBodyFlattener
 
+try:
+    from sdk import _speedups
+except ImportError:
+    _speedups = None
+
+
+class KeyedSigner:
+    """This is to sign with HMAC-SHA512 key state prepared once for a secret."""
+
+    def __init__(self, secret: str):
+        """Initialize with secret, deriving inner and outer HMAC pads only once."""
+        self.__hmac = hmac.new(bytes(secret, 'utf-8'), digestmod=hashlib.sha512)
+
+    def sign(self, sign_target: bytes):
+        """
+        Sign given target with a copy of the prepared HMAC state.
+
+        Args:
+            -sign_target- utf-8 encoded flatten request to sign
+
+        Returns:
+            -signature- base64 encoded HMAC-SHA512 digest
+        """
+        raw_hmac = self.__hmac.copy()
+        raw_hmac.update(sign_target)
+        return base64.b64encode(raw_hmac.digest()).decode('utf-8')
+
 
 class SignatureGenerator:
     """This is to generate signature with flatten request."""
 
     __logger = logging.getLogger(__name__)
+    __body_flattener = RequestBodyFlattener()
 
-    def __createSignTarget(self, method, path, timestamp, nonce, parameters: dict = {}):
-        signTarget = f'{nonce}{str(timestamp)}{method}{path}'
-        if(len(parameters) > 0):
-            signTarget = signTarget + "?"
+    def __init__(self):
+        """Initialize with an empty signer cache keyed by secret."""
+        self.__signers = {}
 
-        return signTarget
+    def signer(self, secret: str):
+        """
+        Return the keyed signer for given secret, building it on first use.
 
-    def generate(self, secret: str, method: str, path: str, timestamp: int, nonce: str, query_params: dict = {}, body: dict = {}):
+        Args:
+            -secret- api-secret
+
+        Returns:
+            -signer- KeyedSigner holding prepared HMAC state of the secret
+        """
+        signer = self.__signers.get(secret)
+        if signer is None:
+            signer = KeyedSigner(secret)
+            self.__signers[secret] = signer
+        return signer
+
+    def build_sign_target(self, method: str, path: str, timestamp: int, nonce: str, query_params: dict = {}, body: dict = {}):
+        """
+        Build the sign target of a request in a single pass.
+
+        Nonce, timestamp, method, path, query and flattened body are collected
+        into one buffer which is joined and encoded exactly once.
+
+        Args:
+            -method- http method
+            -path- api path
+            -timestamp- Unix timestamp value
+            -nonce- random stirng with 8 length
+            -query_params- query paraemeters
+            -body- request body
+
+        Returns:
+            -sign_target- utf-8 encoded sign target, ready for HMAC
+        """
+        if _speedups is not None:
+            sign_target = _speedups.build_sign_target(method, path, timestamp, nonce, query_params, body)
+            if sign_target is not None:
+                return sign_target
+
+        flattened_body = self.__body_flattener.flatten(body) if body else None
+        return self.__join_sign_target(method, path, timestamp, nonce, query_params, flattened_body)
+
+    def __join_sign_target(self, method, path, timestamp, nonce, query_params, flattened_body):
+        buffer = [nonce, str(timestamp), method.upper(), path]
+        if query_params or flattened_body is not None:
+            buffer.append("?")
+            for (key, value) in query_params.items():
+                buffer += (str(key), "=", str(value), "&")
+            if flattened_body is not None:
+                buffer.append(flattened_body)
+            elif query_params:
+                buffer.pop()
+
+        return "".join(buffer).encode('utf-8')
+
+    def generate(self, secret: str, method: str, path: str, timestamp: int, nonce: str, query_params: dict = {}, body: dict = {},
+                 debug_sampled: bool = None):
         """
         Generate signature with given arguments.
 
@@ -50,30 +132,45 @@ class SignatureGenerator:
             -nonce- random stirng with 8 length
             -query_params- query paraemeters
             -body- request body
+            -debug_sampled- whether the request is sampled for DEBUG logging, decided here when omitted
 
         Returns:
             -signauture- generated signature
         """
-        body_flattener = RequestBodyFlattener()
-        all_parameters = {}
-        all_parameters.update(query_params)
-        all_parameters.update(body)
-
-        self.__logger.debug("query_params: " + str(query_params))
-
-        signTarget = self.__createSignTarget(method.upper(), path, timestamp, nonce, all_parameters)
-
-        if (len(query_params) > 0):
-            signTarget += '&'.join('%s=%s' % (key, value) for (key, value) in query_params.items())
+        signTarget = self.build_sign_target(method, path, timestamp, nonce, query_params, body)
+        return self.__sign(secret, query_params, signTarget, debug_sampled)
 
-        if (len(body) > 0):
-            if (len(query_params) > 0):
-                signTarget += "&" + body_flattener.flatten(body)
-            else:
-                signTarget += body_flattener.flatten(body)
+    def generate_with_body(self, secret: str, method: str, path: str, timestamp: int, nonce: str, query_params: dict = {}, body: dict = {},
+                           debug_sampled: bool = None):
+        """
+        Generate signature and encode body as JSON from a single traversal of body.
 
-        self.__logger.debug("signTarget: " + str(signTarget))
-        raw_hmac = hmac.new(bytes(secret, 'utf-8'), bytes(signTarget, 'utf-8'), hashlib.sha512)
-        result = base64.b64encode(raw_hmac.digest()).decode('utf-8')
+        Args:
+            -secret- api-secret
+            -method- http method
+            -path- api path
+            -timestamp- Unix timestamp value
+            -nonce- random stirng with 8 length
+            -query_params- query paraemeters
+            -body- request body
+            -debug_sampled- whether the request is sampled for DEBUG logging, decided here when omitted
 
-        return result
+        Returns:
+            -(signature, encoded_body)- generated signature and the UTF-8 JSON body to send,
+                                        encoded_body being None when body is empty or has to be encoded by the http client,
+                                        as it is without sdk._speedups
+        """
+        # The pure Python single pass is slower than flattening and encoding separately,
+        # so without the native module the body is left to the http client.
+        flattened_and_encoded = self.__body_flattener.flatten_and_encode(body) if body and _speedups is not None else None
+        if flattened_and_encoded is None:
+            return self.generate(secret, method, path, timestamp, nonce, query_params, body, debug_sampled), None
+        (flattened_body, encoded_body) = flattened_and_encoded
+        signTarget = self.__join_sign_target(method, path, timestamp, nonce, query_params, flattened_body)
+        return self.__sign(secret, query_params, signTarget, debug_sampled), encoded_body
+
+    def __sign(self, secret, query_params, signTarget, debug_sampled):
+        if debug_sampler.enabled_for(self.__logger, debug_sampled):
+            self.__logger.debug("query_params: %s", redact(query_params))
+            self.__logger.debug("signTarget: %s", redact_sign_target(signTarget))
+        return self.signer(secret).sign(signTarget)
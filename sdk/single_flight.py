@@ -0,0 +1,113 @@
+"""
+This module implements coalescing of concurrent identical GET requests.
+
+Under burst traffic many threads or tasks call e.g. `user_detail(user_id)`
+with the same arguments at the same instant. SingleFlight lets the first of
+them make the http call, and every identical call arriving while it is in
+flight waits for it and receives the same response, or the same error.
+
+    api_client = ApiClient(base_url=api_base_url, auth=auth, layers=[SingleFlight()])
+
+Waiters share one response object, so it must not be modified in place.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import asyncio
+import functools
+import threading
+from sdk.layers import EndpointLayer, bound_arguments, endpoint_methods
+
+
+class _Flight:
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class SingleFlight(EndpointLayer):
+    """This is to share one in-flight http call among concurrent identical GET calls."""
+
+    def __init__(self):
+        """Initialize with no call in flight."""
+        self.calls = 0
+        self.coalesced = 0
+        self.__flights = {}
+        self.__lock = threading.Lock()
+
+    def endpoint_names(self, api_client_class):
+        """Return names of the GET endpoints."""
+        return [name for (name, method) in endpoint_methods(api_client_class).items() if method == "GET"]
+
+    def stats(self):
+        """Return number of http calls made and of calls served by another one in flight."""
+        with self.__lock:
+            return {"calls": self.calls, "coalesced": self.coalesced}
+
+    def __key(self, api_client_class, name, args, kwargs):
+        key = (name, tuple(sorted(bound_arguments(api_client_class, name, args, kwargs).items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def call(self, api_client_class, name, endpoint, args, kwargs):
+        """Make the http call, or wait for an identical one in flight."""
+        key = self.__key(api_client_class, name, args, kwargs)
+        if key is None:
+            return endpoint(*args, **kwargs)
+        with self.__lock:
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[key] = _Flight()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+        try:
+            flight.response = endpoint(*args, **kwargs)
+            return flight.response
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+            flight.done.set()
+
+    async def acall(self, api_client_class, name, endpoint, args, kwargs):
+        """Await the http call, or an identical one in flight on the same event loop."""
+        key = self.__key(api_client_class, name, args, kwargs)
+        if key is None:
+            return await endpoint(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        with self.__lock:
+            task = self.__flights.get(key)
+            if task is not None:
+                self.coalesced += 1
+        if task is None:
+            # a task of its own, so the call outlives the caller that started it.
+            task = asyncio.ensure_future(endpoint(*args, **kwargs))
+            task.add_done_callback(functools.partial(self.__land, key))
+            with self.__lock:
+                self.__flights[key] = task
+                self.calls += 1
+        # shielded, so a cancelled caller, the first one included, does not cancel the call of the others.
+        return await asyncio.shield(task)
+
+    def __land(self, key, task):
+        with self.__lock:
+            del self.__flights[key]
+        if not task.cancelled():
+            # retrieved here, so an error nobody waited for is not reported as never retrieved.
+            task.exception()
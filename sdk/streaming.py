@@ -0,0 +1,309 @@
+"""
+This module implements streaming decoding of list responses.
+
+A page of e.g. `service_wallet_transactions` with a large `limit` is read
+whole and decoded before the first record is seen. Streamed calls instead
+decode records of the `responseData` array as the body arrives from the
+socket, holding one record and one chunk of the body at a time:
+
+    for transaction in api_client.stream("service_wallet_transactions", wallet_address, limit=1000):
+        ...
+
+    async for transaction in async_api_client.stream("user_transactions", user_id, limit=1000):
+        ...
+
+Streamed calls bypass layers of the client, as a response consumed
+incrementally can be neither cached, shared nor retried.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import codecs
+import contextlib
+import contextvars
+import json
+import re
+from sdk.exceptions import check_response
+from sdk.json_codec import JsonCodec, default_json_codec
+from sdk.records import to_records
+
+# bytes read from the socket at a time by streamed calls.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_RESPONSE_DATA_KEY = '"responseData"'
+_STRUCTURAL = re.compile(r'["{}\[\],:]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NON_SPACE = re.compile(r'[^ \t\r\n]')
+_NEED_MORE = object()
+
+_stream_chunk_size = contextvars.ContextVar("stream_chunk_size", default=None)
+
+
+@contextlib.contextmanager
+def streaming_responses(chunk_size: int = STREAM_CHUNK_SIZE):
+    """Make sessions of this sdk return StreamingResponse for requests sent within the context."""
+    token = _stream_chunk_size.set(chunk_size)
+    try:
+        yield
+    finally:
+        _stream_chunk_size.reset(token)
+
+
+def streaming_chunk_size():
+    """Return chunk size of streamed requests in the current context, None when not streaming."""
+    return _stream_chunk_size.get()
+
+
+class StreamingListDecoder:
+    """
+    Incremental decoder of records of the responseData array of a response.
+
+    Feed the body chunk by chunk and take the records completed so far
+    after each chunk, then close to get the rest of the response:
+
+        for chunk in chunks:
+            decoder.feed(chunk)
+            for record in decoder.records():
+                ...
+        response = decoder.close()  # {"statusCode": 1000, "responseData": [], ...}
+    """
+
+    def __init__(self, json_codec: JsonCodec = None):
+        """Initialize with json_codec decoding the rest of the response, defaults to default_json_codec()."""
+        self.json_codec = json_codec or default_json_codec()
+        self.__utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__position = 0
+        self.__depth = 0
+        self.__string_start = None
+        self.__last_string = None
+        self.__key = None
+        self.__in_records = False
+        self.__envelope = []
+        self.__envelope_start = 0
+
+    def feed(self, chunk: bytes):
+        """Append chunk of the body, records of the previous chunk having been taken."""
+        keep = self.__position if self.__string_start is None else self.__string_start
+        if not self.__in_records:
+            self.__envelope.append(self.__buffer[self.__envelope_start:keep])
+            self.__envelope_start = 0
+        if self.__string_start is not None:
+            self.__string_start -= keep
+        self.__position -= keep
+        self.__buffer = self.__buffer[keep:] + self.__utf8.decode(chunk)
+
+    def records(self):
+        """Return generator of the records completed by the chunks fed so far."""
+        while True:
+            record = self.__next_record()
+            if record is _NEED_MORE:
+                return
+            yield record
+
+    def close(self):
+        """
+        Return the response decoded without its records, once the whole body was fed.
+
+        Returns:
+            -response- decoded response, its responseData being [] when records were streamed
+
+        Raises:
+            -json.JSONDecodeError- when the body is not complete JSON
+        """
+        self.__buffer += self.__utf8.decode(b"", final=True)
+        if self.__in_records:
+            # a record left undecoded is either cut or invalid, raise its error.
+            match = _NON_SPACE.search(self.__buffer, self.__position)
+            index = match.start() if match is not None else self.__position
+            self.__decoder.raw_decode(self.__buffer, index)
+            raise json.JSONDecodeError("Unterminated responseData", self.__buffer, index)
+        self.__envelope.append(self.__buffer[self.__envelope_start:])
+        return self.json_codec.loads("".join(self.__envelope))
+
+    def __start_records(self, end):
+        self.__envelope.append(self.__buffer[self.__envelope_start:end])
+        self.__in_records = True
+
+    def __end_records(self, start):
+        self.__in_records = False
+        self.__depth -= 1
+        self.__envelope_start = start
+
+    def __next_record(self):
+        buffer = self.__buffer
+        position = self.__position
+        while True:
+            if self.__in_records:
+                match = _NON_SPACE.search(buffer, position)
+                if match is None:
+                    break
+                char = match.group()
+                if char == ",":
+                    position = match.end()
+                    continue
+                if char == "]":
+                    self.__end_records(match.start())
+                    position = match.end()
+                    continue
+                position = match.start()
+                try:
+                    (record, end) = self.__decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    break
+                # a number may go on in the next chunk, so a record is complete only once followed by , or ].
+                following = _NON_SPACE.search(buffer, end)
+                if following is None or following.group() not in ",]":
+                    break
+                self.__position = end
+                return record
+
+            if self.__string_start is not None:
+                match = _STRING_SPECIAL.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        position = match.start()
+                        break
+                    position = match.end() + 1
+                    continue
+                position = match.end()
+                if self.__depth == 1:
+                    self.__last_string = buffer[self.__string_start:position]
+                self.__string_start = None
+                continue
+
+            match = _STRUCTURAL.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+            char = match.group()
+            position = match.end()
+            if char == '"':
+                self.__string_start = match.start()
+            elif char in "{[":
+                self.__depth += 1
+                if char == "[" and self.__depth == 2 and self.__key == _RESPONSE_DATA_KEY:
+                    self.__start_records(position)
+            elif char in "}]":
+                self.__depth -= 1
+            elif self.__depth == 1:
+                # ':' ends a key of the response, ',' a value.
+                self.__key = self.__last_string if char == ":" else None
+        self.__position = position
+        return _NEED_MORE
+
+
+class StreamingResponse:
+    """Records of responseData of a list response, decoded as the body is read."""
+
+    def __init__(self, chunks, json_codec: JsonCodec = None, close=None):
+        """
+        Initialize with the body.
+
+        Args:
+            -chunks- iterable of bytes of the body
+            -json_codec- JsonCodec decoding the response without its records
+            -close- callable releasing the http response once iterated
+        """
+        self.__chunks = chunks
+        self.__close = close
+        self.json_codec = json_codec
+        self.response = None
+
+    def __iter__(self):
+        """
+        Iterate records, then check the response without them.
+
+        Raises:
+            -ApiResponseError- when statusCode is not SUCCESS_STATUS_CODE
+        """
+        decoder = StreamingListDecoder(self.json_codec)
+        try:
+            for chunk in self.__chunks:
+                decoder.feed(chunk)
+                yield from decoder.records()
+            self.response = check_response(decoder.close())
+        finally:
+            if self.__close is not None:
+                self.__close()
+
+
+class AsyncStreamingResponse:
+    """Records of responseData of a list response, decoded as the body is read by aiohttp."""
+
+    def __init__(self, chunks, json_codec: JsonCodec = None, close=None):
+        """
+        Initialize with the body.
+
+        Args:
+            -chunks- async iterable of bytes of the body
+            -json_codec- JsonCodec decoding the response without its records
+            -close- callable releasing the http response once iterated
+        """
+        self.__chunks = chunks
+        self.__close = close
+        self.json_codec = json_codec
+        self.response = None
+
+    async def __aiter__(self):
+        """
+        Iterate records, then check the response without them.
+
+        Raises:
+            -ApiResponseError- when statusCode is not SUCCESS_STATUS_CODE
+        """
+        decoder = StreamingListDecoder(self.json_codec)
+        try:
+            async for chunk in self.__chunks:
+                decoder.feed(chunk)
+                for record in decoder.records():
+                    yield record
+            self.response = check_response(decoder.close())
+        finally:
+            if self.__close is not None:
+                self.__close()
+
+
+def stream_records(endpoint, args, kwargs, record_type=None, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Call endpoint in streaming mode and iterate records of its responseData.
+
+    Args:
+        -endpoint- bound endpoint of ApiClient
+        -args- positional arguments of the endpoint
+        -kwargs- keyword arguments of the endpoint
+        -record_type- Record subclass of sdk.records, or callable taking a record dict, to yield instead of dicts
+        -chunk_size- bytes read from the socket at a time
+
+    Returns:
+        -records- generator of records, the request being sent on first iteration
+    """
+    with streaming_responses(chunk_size):
+        response = endpoint(*args, **kwargs)
+    # sessions not created by this sdk answer with the whole response.
+    records = response if isinstance(response, StreamingResponse) else check_response(response).get("responseData") or []
+    for record in records:
+        yield to_records(record_type, record) if record_type is not None else record
+
+
+async def astream_records(endpoint, args, kwargs, record_type=None, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Await endpoint of AsyncApiClient in streaming mode and iterate records of its responseData.
+
+    Same as stream_records, but `endpoint` returns a coroutine.
+
+    Returns:
+        -records- async generator of records
+    """
+    with streaming_responses(chunk_size):
+        response = await endpoint(*args, **kwargs)
+    if isinstance(response, AsyncStreamingResponse):
+        async for record in response:
+            yield to_records(record_type, record) if record_type is not None else record
+        return
+    for record in check_response(response).get("responseData") or []:
+        yield to_records(record_type, record) if record_type is not None else record
@@ -0,0 +1,187 @@
+"""
+This module implements waiting for confirmation of many transactions at once.
+
+Mutating endpoints such as `mint_service_token` or
+`multi_mint_non_fungible_token` return a `txHash`. TransactionPoller takes
+any number of pending hashes and polls `transaction_result` for all of them
+from one scheduler thread, with a shared cap on requests in flight and a
+backoff per transaction, resolving a Future as each one confirms or fails.
+
+    with TransactionPoller(api_client, max_concurrency=8) as poller:
+        futures = [poller.submit(tx_hash) for tx_hash in tx_hashes]
+        for future in concurrent.futures.as_completed(futures):
+            response = future.result()
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from sdk.exceptions import SUCCESS_STATUS_CODE, TransactionFailedError, TransactionTimeoutError
+
+NOT_FOUND_STATUS_CODE = 4040
+
+
+class _PendingTransaction:
+    __slots__ = ("tx_hash", "future", "delay", "deadline", "submitted_at")
+
+    def __init__(self, tx_hash, future, delay, deadline, submitted_at):
+        self.tx_hash = tx_hash
+        self.future = future
+        self.delay = delay
+        self.deadline = deadline
+        self.submitted_at = submitted_at
+
+
+class TransactionPoller:
+    """This is to poll transaction_result of many pending transactions from one scheduler."""
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        api_client,
+        max_concurrency: int = 8,
+        initial_delay: float = 0.5,
+        max_delay: float = 10,
+        multiplier: float = 1.5,
+        timeout: float = 120
+    ):
+        """
+        Initialize with api_client and polling policy.
+
+        Args:
+            -api_client- ApiClient to call transaction_result with
+            -max_concurrency- maximum number of transaction_result requests in flight
+            -initial_delay- lower bound of the delay before the first poll of a transaction
+            -max_delay- upper bound of the delay between polls of a transaction
+            -multiplier- growth of the delay after each poll finding the transaction pending
+            -timeout- seconds after which a pending transaction fails with TransactionTimeoutError
+        """
+        self.api_client = api_client
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.timeout = timeout
+        # moving average of observed confirmation time, used to schedule the
+        # first poll of new transactions close to when they usually confirm.
+        self.__expected_latency = initial_delay
+        self.__queue = []
+        self.__sequence = itertools.count()
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="transaction-poller")
+        self.__scheduler = threading.Thread(target=self.__run, name="transaction-poller-scheduler", daemon=True)
+        self.__scheduler.start()
+
+    def submit(self, tx_hash: str, callback=None):
+        """
+        Start waiting for confirmation of given transaction.
+
+        Args:
+            -tx_hash- hash of the pending transaction
+            -callback- optional callable called with the Future once it is resolved
+
+        Returns:
+            -future- Future resolved with the transaction_result response, or failed with
+                     TransactionFailedError or TransactionTimeoutError
+        """
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        now = time.monotonic()
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("TransactionPoller is closed")
+            delay = min(self.max_delay, max(self.initial_delay, self.__expected_latency))
+            pending = _PendingTransaction(tx_hash, future, delay, now + self.timeout, now)
+            self.__schedule(pending, now + delay)
+        return future
+
+    def pending_count(self):
+        """Return the number of transactions waiting for their next poll."""
+        with self.__condition:
+            return len(self.__queue)
+
+    def close(self):
+        """Stop polling, cancelling futures of transactions still pending."""
+        with self.__condition:
+            self.__closed = True
+            queue, self.__queue = self.__queue, []
+            self.__condition.notify()
+        for (_, _, pending) in queue:
+            pending.future.cancel()
+        self.__scheduler.join()
+        self.__executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Enter context."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the poller on leaving context."""
+        self.close()
+
+    def __schedule(self, pending, due):
+        heapq.heappush(self.__queue, (due, next(self.__sequence), pending))
+        self.__condition.notify()
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                while not self.__closed and (not self.__queue or self.__queue[0][0] > time.monotonic()):
+                    self.__condition.wait(None if not self.__queue else self.__queue[0][0] - time.monotonic())
+                if self.__closed:
+                    return
+                (_, _, pending) = heapq.heappop(self.__queue)
+            self.__executor.submit(self.__poll, pending)
+
+    def __poll(self, pending):
+        if pending.future.done():
+            return
+        try:
+            response = self.api_client.transaction_result(pending.tx_hash)
+        except Exception as error:
+            self.__logger.debug("polling %s failed: %s", pending.tx_hash, error)
+            response = None
+
+        if response is not None and response.get("statusCode") == SUCCESS_STATUS_CODE:
+            self.__observe_latency(time.monotonic() - pending.submitted_at)
+            if (response.get("responseData") or {}).get("code", 0) == 0:
+                self.__resolve(pending, response=response)
+            else:
+                self.__resolve(pending, error=TransactionFailedError(pending.tx_hash, response))
+            return
+        if response is not None and response.get("statusCode") != NOT_FOUND_STATUS_CODE:
+            self.__logger.debug("unexpected transaction_result of %s: %s", pending.tx_hash, response)
+
+        now = time.monotonic()
+        if now >= pending.deadline:
+            self.__resolve(pending, error=TransactionTimeoutError(pending.tx_hash))
+            return
+        pending.delay = min(self.max_delay, pending.delay * self.multiplier)
+        with self.__condition:
+            if self.__closed:
+                pending.future.cancel()
+                return
+            self.__schedule(pending, min(pending.deadline, now + pending.delay))
+
+    def __resolve(self, pending, response=None, error=None):
+        # the caller may have cancelled the future while it was polled.
+        if pending.future.done():
+            return
+        try:
+            if error is None:
+                pending.future.set_result(response)
+            else:
+                pending.future.set_exception(error)
+        except InvalidStateError:
+            pass
+
+    def __observe_latency(self, latency):
+        with self.__condition:
+            self.__expected_latency = 0.8 * self.__expected_latency + 0.2 * latency
@@ -0,0 +1,111 @@
+"""
+This module implements a persistent cache of immutable transaction data.
+
+Once a transaction is committed, `transaction_result(tx_hash)` and
+`get_memo(tx_hash)` never change. TransactionResultStore keeps those responses
+in SQLite keyed by tx hash, so warm lookups never touch the network, and the
+database can be shared by every worker process on a host.
+
+    store = TransactionResultStore("/var/cache/line-sdk/transactions.db")
+    api_client = ApiClient(base_url=api_base_url, auth=auth, layers=[store])
+
+Only successful responses are stored: a pending transaction answers with a
+not-found status and is fetched again on the next call.
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import json
+import os
+import sqlite3
+import threading
+from sdk.exceptions import SUCCESS_STATUS_CODE
+from sdk.layers import EndpointLayer, bound_arguments
+
+STORED_ENDPOINTS = ("transaction_result", "get_memo")
+
+
+class TransactionResultStore(EndpointLayer):
+    """This is to persist finalized transaction results and memos by tx hash."""
+
+    def __init__(self, path: str):
+        """Initialize with path of the SQLite database, created when missing."""
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__connection = None
+        self.__pid = None
+        with self.__lock:
+            self.__connect().execute(
+                "CREATE TABLE IF NOT EXISTS transaction_results "
+                "(endpoint TEXT NOT NULL, tx_hash TEXT NOT NULL, response TEXT NOT NULL, PRIMARY KEY (endpoint, tx_hash)) WITHOUT ROWID")
+
+    def __connect(self):
+        # a connection must not cross fork, each process opens its own.
+        if self.__connection is None or self.__pid != os.getpid():
+            self.__connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            self.__connection.execute("PRAGMA synchronous=NORMAL")
+            self.__pid = os.getpid()
+        return self.__connection
+
+    def endpoint_names(self, api_client_class):
+        """Return transaction_result and get_memo."""
+        return list(STORED_ENDPOINTS)
+
+    def get(self, endpoint: str, tx_hash: str):
+        """Return stored response of endpoint for tx_hash, or None."""
+        with self.__lock:
+            row = self.__connect().execute(
+                "SELECT response FROM transaction_results WHERE endpoint = ? AND tx_hash = ?",
+                (endpoint, tx_hash.upper())).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, endpoint: str, tx_hash: str, response: dict):
+        """Store response of endpoint for tx_hash when it is final. Returns True when stored."""
+        if not isinstance(response, dict) or response.get("statusCode") != SUCCESS_STATUS_CODE:
+            return False
+        encoded = json.dumps(response, separators=(",", ":"))
+        with self.__lock:
+            self.__connect().execute(
+                "INSERT OR IGNORE INTO transaction_results (endpoint, tx_hash, response) VALUES (?, ?, ?)",
+                (endpoint, tx_hash.upper(), encoded))
+        return True
+
+    def stats(self):
+        """Return hit and miss counters of this process."""
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        """Close the database connection of this process."""
+        with self.__lock:
+            if self.__connection is not None and self.__pid == os.getpid():
+                self.__connection.close()
+            self.__connection = None
+
+    def __tx_hash(self, api_client_class, name, args, kwargs):
+        return bound_arguments(api_client_class, name, args, kwargs)["tx_hash"]
+
+    def call(self, api_client_class, name, endpoint, args, kwargs):
+        """Answer from the store, fetching and storing final responses on a miss."""
+        tx_hash = self.__tx_hash(api_client_class, name, args, kwargs)
+        response = self.get(name, tx_hash)
+        if response is None:
+            response = endpoint(*args, **kwargs)
+            self.put(name, tx_hash, response)
+        return response
+
+    async def acall(self, api_client_class, name, endpoint, args, kwargs):
+        """Answer from the store, fetching and storing final responses on a miss."""
+        tx_hash = self.__tx_hash(api_client_class, name, args, kwargs)
+        response = self.get(name, tx_hash)
+        if response is None:
+            response = await endpoint(*args, **kwargs)
+            self.put(name, tx_hash, response)
+        return response
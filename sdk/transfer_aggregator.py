@@ -0,0 +1,181 @@
+"""
+This module implements coalescing single non-fungible item token transfers.
+
+Sending item tokens one by one through `service_wallet_transfer_nonfungible_token`
+or `transfer_user_non_fungible_token` costs a signed request and a transaction
+per token. TransferAggregator buffers transfers for a short window, groups them
+by source wallet or user, contract and transfer request (recipient and
+secrets), and sends each group with one call of
+`service_wallet_batch_transfer_nonfungible_token` or
+`batch_transfer_user_non_fungible_token`.
+
+    with TransferAggregator(api_client, window=0.05) as aggregator:
+        future = aggregator.transfer_from_wallet(wallet_address, contract_id, token_type, token_index,
+                                                 {"walletSecret": wallet_secret, "toAddress": to_address})
+        tx_hash = future.result()  # txHash of the batch transfer, shared by the transfers sent with it
+
+Author: Yoonyoul Yoo
+Date: 2026/10/18
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from sdk.exceptions import ACCEPTED_STATUS_CODE, ApiResponseError
+
+# largest transferList sent in one batch transfer.
+MAX_TRANSFER_LIST_SIZE = 50
+
+WALLET = "wallet"
+USER = "user"
+
+
+class _Batch:
+    __slots__ = ("kind", "source", "contract_id", "transfer_request", "token_ids", "futures", "deadline")
+
+    def __init__(self, kind, source, contract_id, transfer_request, deadline):
+        self.kind = kind
+        self.source = source
+        self.contract_id = contract_id
+        self.transfer_request = transfer_request
+        self.token_ids = []
+        self.futures = []
+        self.deadline = deadline
+
+
+class TransferAggregator:
+    """This is to send single non-fungible item token transfers as batch transfers."""
+
+    def __init__(self, api_client, window: float = 0.05, max_batch: int = MAX_TRANSFER_LIST_SIZE, max_concurrency: int = 4):
+        """
+        Initialize with api_client and batching policy.
+
+        Args:
+            -api_client- ApiClient to send batch transfers with
+            -window- seconds a transfer waits for others to join its batch
+            -max_batch- most item tokens in a batch, a full batch is sent at once
+            -max_concurrency- most batch transfer requests in flight
+        """
+        self.api_client = api_client
+        self.window = window
+        self.max_batch = min(max_batch, MAX_TRANSFER_LIST_SIZE)
+        self.__batches = {}
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="transfer-aggregator")
+        self.__scheduler = threading.Thread(target=self.__run, name="transfer-aggregator-scheduler", daemon=True)
+        self.__scheduler.start()
+
+    def transfer_from_wallet(self, wallet_address: str, contract_id: str, token_type: str, token_index: str,
+                             transfer_request: dict):
+        """
+        Transfer a non-fungible item token of a service wallet, in a batch.
+
+        Args:
+            -wallet_address- address of the service wallet holding the item token
+            -contract_id- contract of the item token
+            -token_type- token type of the item token
+            -token_index- token index of the item token
+            -transfer_request- body as for service_wallet_transfer_nonfungible_token
+
+        Returns:
+            -future- Future resolved with the txHash of the batch transfer, or failed with its error
+        """
+        return self.__add(WALLET, wallet_address, contract_id, token_type + token_index, transfer_request)
+
+    def transfer_from_user(self, user_id: str, contract_id: str, token_type: str, token_index: str,
+                           transfer_request: dict):
+        """
+        Transfer a delegated non-fungible item token of a user wallet, in a batch.
+
+        Args:
+            -user_id- user holding the item token
+            -contract_id- contract of the item token
+            -token_type- token type of the item token
+            -token_index- token index of the item token
+            -transfer_request- body as for transfer_user_non_fungible_token
+
+        Returns:
+            -future- Future resolved with the txHash of the batch transfer, or failed with its error
+        """
+        return self.__add(USER, user_id, contract_id, token_type + token_index, transfer_request)
+
+    def flush(self):
+        """Send every buffered transfer now, without waiting for the window."""
+        with self.__condition:
+            batches = list(self.__batches.values())
+            self.__batches.clear()
+        for batch in batches:
+            self.__executor.submit(self.__send, batch)
+
+    def close(self):
+        """Send every buffered transfer and wait until all batch transfers are answered."""
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+        self.__scheduler.join()
+        self.flush()
+        self.__executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Enter context."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the aggregator on leaving context."""
+        self.close()
+
+    def __add(self, kind, source, contract_id, token_id, transfer_request):
+        future = Future()
+        key = (kind, source, contract_id, tuple(sorted(transfer_request.items())))
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("TransferAggregator is closed")
+            batch = self.__batches.get(key)
+            if batch is None:
+                batch = self.__batches[key] = _Batch(
+                    kind, source, contract_id, dict(transfer_request), time.monotonic() + self.window)
+                self.__condition.notify()
+            batch.token_ids.append(token_id)
+            batch.futures.append(future)
+            full = len(batch.token_ids) >= self.max_batch
+            if full:
+                del self.__batches[key]
+        if full:
+            self.__executor.submit(self.__send, batch)
+        return future
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                while not self.__closed and not self.__batches:
+                    self.__condition.wait()
+                if self.__closed:
+                    return
+                now = time.monotonic()
+                due = [key for (key, batch) in self.__batches.items() if batch.deadline <= now]
+                if not due:
+                    self.__condition.wait(min(batch.deadline for batch in self.__batches.values()) - now)
+                    continue
+                batches = [self.__batches.pop(key) for key in due]
+            for batch in batches:
+                self.__executor.submit(self.__send, batch)
+
+    def __send(self, batch):
+        request_body = dict(batch.transfer_request)
+        request_body["transferList"] = [{"tokenId": token_id} for token_id in batch.token_ids]
+        try:
+            if batch.kind == WALLET:
+                response = self.api_client.service_wallet_batch_transfer_nonfungible_token(
+                    batch.source, batch.contract_id, request_body)
+            else:
+                response = self.api_client.batch_transfer_user_non_fungible_token(
+                    batch.source, batch.contract_id, request_body)
+            if not isinstance(response, dict) or response.get("statusCode") != ACCEPTED_STATUS_CODE:
+                raise ApiResponseError(response)
+            tx_hash = response["responseData"]["txHash"]
+        except Exception as error:
+            for future in batch.futures:
+                future.set_exception(error)
+            return
+        for future in batch.futures:
+            future.set_result(tx_hash)
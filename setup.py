@@ -1,5 +1,5 @@
 # Standard library imports
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 
 def read(filename):
@@ -8,9 +8,11 @@ def read(filename):
 
 
 install_requires = ["uplink>=0.9.3", "python-dotenv>=0.15.0"]
-extras_require = {}
+extras_require = {"aiohttp": ["aiohttp>=3.0"], "orjson": ["orjson>=3.0"]}
 setup_requires = ["pytest-runner"]
 tests_require = ["pytest==4.4.1"]
+# Native signing path; optional so installs without a C compiler fall back to pure Python.
+ext_modules = [Extension("sdk._speedups", sources=["sdk/_speedups.c"], optional=True)]
 
 setup(
     name="line-developers-sdk",
@@ -22,7 +24,9 @@ setup(
     long_description=read("README.md"),
     packages=find_packages(include=["sdk"], exclude=("tests", "tests.*")),
     version="0.0.1",
+    ext_modules=ext_modules,
     install_requires=install_requires,
+    extras_require=extras_require,
     setup_requires=setup_requires,
     tests_require=tests_require,
     test_suite="tests",
@@ -0,0 +1,70 @@
+"""Local HTTP/1.1 stub of developers api, used by tests and benchmarks."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded keep-alive server answering every request with `respond(method, path, query, body)`."""
+
+    daemon_threads = True
+
+    def __init__(self, respond=None, latency=0):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.respond = respond or (lambda method, path, query, body: {"statusCode": 1000, "responseData": {}})
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # buffer writes so headers and body leave in one segment, avoiding delayed-ack stalls
+    wbufsize = 1 << 16
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def handle_request(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        body = json.loads(raw_body) if raw_body else {}
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query))
+        with self.server.lock:
+            self.server.requests.append((self.command, url.path, query, dict(self.headers), raw_body))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        payload = self.server.respond(self.command, url.path, query, body)
+        status = 200
+        if isinstance(payload, tuple):
+            status, payload = payload
+        out = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.signature_generator import SignatureGenerator
+
+try:
+    from aiohttp import web
+    from sdk.async_api_client import AsyncApiClient, gather_bounded
+except ImportError:
+    web = None
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def handle(request):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                body = await request.json() if request.can_read_body else {}
+                self.requests.append((request.method, request.path, dict(request.query), dict(request.headers), body))
+                await asyncio.sleep(0.01)
+                return web.json_response({"statusCode": 1000, "responseData": {"path": request.path}})
+            finally:
+                self.in_flight -= 1
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.api_client = AsyncApiClient(
+            base_url=f"http://127.0.0.1:{port}",
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()))
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+        await self.runner.cleanup()
+
+    def test_exposes_every_endpoint_of_api_client(self):
+        endpoints = [name for name in dir(ApiClient) if not name.startswith("_") and callable(getattr(ApiClient, name))]
+        for name in endpoints:
+            self.assertTrue(hasattr(self.api_client, name), name)
+
+    async def test_get_is_signed_and_awaitable(self):
+        response = await self.api_client.user_detail("user-id")
+
+        self.assertEqual(1000, response["statusCode"])
+        method, path, query, headers, _ = self.requests[0]
+        self.assertEqual(("GET", "/v1/users/user-id"), (method, path))
+        for header in ("Nonce", "Timestamp", "Signature", "service-api-key"):
+            self.assertIn(header, headers)
+
+    async def test_query_and_signature_match_sync_signing(self):
+        await self.api_client.service_wallet_transactions("tlink1", limit=5)
+
+        _, path, query, headers, _ = self.requests[0]
+        self.assertEqual({"limit": "5", "page": "1", "order_by": "desc"}, query)
+        expected_signature = SignatureGenerator().generate(
+            "test-api-secret", "GET", path, headers["Timestamp"], headers["Nonce"], query)
+        self.assertEqual(expected_signature, headers["Signature"])
+
+    async def test_post_sends_json_body(self):
+        request_body = {"ownerAddress": "tlink1", "ownerSecret": "secret", "toAddress": "tlink2", "amount": "1"}
+        response = await self.api_client.mint_service_token("contract-id", request_body)
+
+        self.assertEqual(1000, response["statusCode"])
+        self.assertEqual(("POST", "/v1/service-tokens/contract-id/mint"), self.requests[0][:2])
+        self.assertEqual(request_body, self.requests[0][4])
+
+    async def test_gather_bounded_limits_concurrency_and_keeps_order(self):
+        user_ids = [f"user-{index}" for index in range(30)]
+        responses = await gather_bounded((self.api_client.user_base_coin(user_id) for user_id in user_ids), limit=4)
+
+        self.assertEqual([f"/v1/users/{user_id}/base-coin" for user_id in user_ids], [response["responseData"]["path"] for response in responses])
+        self.assertLessEqual(self.max_in_flight, 4)
+        self.assertGreater(self.max_in_flight, 1)
@@ -0,0 +1,76 @@
+import unittest
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.exceptions import ApiResponseError
+from sdk.session import PoolConfig
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+try:
+    from sdk.async_api_client import AsyncApiClient
+except ImportError:
+    AsyncApiClient = None
+
+
+def respond(method, path, query, body):
+    user_id = path.split("/")[3]
+    if user_id == "unknown":
+        return 404, {"statusCode": 4040, "statusMessage": "Not found", "responseData": None}
+    return {"statusCode": 1000, "responseData": {"path": path}}
+
+
+class TestBulkRead(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(respond, latency=0.01).__enter__()
+        self.api_client = ApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            pool_config=PoolConfig(max_connections_per_host=8))
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_returns_results_in_input_order_with_per_item_errors(self):
+        user_ids = [f"user-{index}" for index in range(20)]
+        user_ids.insert(5, "unknown")
+
+        results = self.api_client.bulk_read("user_base_coin", user_ids, max_workers=8)
+
+        self.assertEqual(user_ids, [result.key for result in results])
+        self.assertIsInstance(results[5].error, ApiResponseError)
+        self.assertEqual(4040, results[5].error.status_code)
+        for result in results[:5] + results[6:]:
+            self.assertIsNone(result.error)
+            self.assertEqual(f"/v1/users/{result.key}/base-coin", result.response["responseData"]["path"])
+
+    def test_tuple_keys_are_spread_as_arguments(self):
+        results = self.api_client.bulk_read("user_service_token", [("user-1", "contract-1"), ("user-2", "contract-2")])
+
+        self.assertEqual(
+            ["/v1/users/user-1/service-tokens/contract-1", "/v1/users/user-2/service-tokens/contract-2"],
+            [result.response["responseData"]["path"] for result in results])
+
+    def test_empty_keys(self):
+        self.assertEqual([], self.api_client.bulk_read("user_base_coin", []))
+
+
+@unittest.skipIf(AsyncApiClient is None, "aiohttp is not installed")
+class TestAsyncBulkRead(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = StubServer(respond, latency=0.01).__enter__()
+        self.api_client = AsyncApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()))
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    async def test_returns_results_in_input_order_with_per_item_errors(self):
+        user_ids = ["user-1", "unknown", "user-2"]
+
+        results = await self.api_client.bulk_read("user_base_coin", user_ids, max_workers=2)
+
+        self.assertEqual(user_ids, [result.key for result in results])
+        self.assertIsNone(results[0].error)
+        self.assertIsInstance(results[1].error, ApiResponseError)
+        self.assertEqual("/v1/users/user-2/base-coin", results[2].response["responseData"]["path"])
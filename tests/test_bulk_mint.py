@@ -0,0 +1,187 @@
+import itertools
+import threading
+import time
+import unittest
+from sdk.bulk_mint import BulkMinter, MintRecord
+from sdk.checkpoint import MemoryCheckpointStore
+from sdk.exceptions import ApiResponseError, ReconciliationRequiredError, TransactionFailedError
+from sdk.request_flattener import RequestBodyFlattener
+from sdk.transaction_poller import TransactionPoller
+
+
+class FakeMintApiClient:
+    def __init__(self, failing_recipients=(), rejected_recipients=(), timing_out_recipients=(), latency=0.0):
+        self.failing_recipients = set(failing_recipients)
+        self.rejected_recipients = set(rejected_recipients)
+        self.timing_out_recipients = set(timing_out_recipients)
+        self.committed = threading.Event()
+        self.committed.set()
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.sequence = itertools.count()
+        self.mints = []
+        self.recipients = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def multi_mint_non_fungible_token(self, contract_id, multi_mint_request):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+            recipient = multi_mint_request["toAddress"]
+            if recipient in self.rejected_recipients:
+                return {"statusCode": 4000, "statusMessage": "Bad request"}
+            if recipient in self.timing_out_recipients:
+                raise TimeoutError("read timed out")
+            self.mints.append(multi_mint_request)
+            tx_hash = f"TX{next(self.sequence)}"
+            self.recipients[tx_hash] = recipient
+        return {"statusCode": 1002, "responseData": {"txHash": tx_hash}}
+
+    def transaction_result(self, tx_hash):
+        if not self.committed.is_set():
+            return {"statusCode": 4040, "statusMessage": "Not found"}
+        code = 1 if self.recipients[tx_hash] in self.failing_recipients else 0
+        return {"statusCode": 1000, "responseData": {"txhash": tx_hash, "code": code}}
+
+
+def records(count, recipients):
+    return [MintRecord("10000001", f"item-{index}", f"meta-{index}", recipients[index % len(recipients)])
+            for index in range(count)]
+
+
+class TestBulkMinter(unittest.TestCase):
+    def setUp(self):
+        self.checkpoint_store = MemoryCheckpointStore()
+
+    def new_minter(self, api_client, **kwargs):
+        self.poller = TransactionPoller(api_client, initial_delay=0.01, max_delay=0.02)
+        self.addCleanup(self.poller.close)
+        return BulkMinter(api_client, "contract-id", "tlink1owner", "owner-secret", self.checkpoint_store,
+                          job_id="job", poller=self.poller, **kwargs)
+
+    def test_groups_records_per_recipient_into_chunks(self):
+        minter = self.new_minter(FakeMintApiClient(), chunk_size=3)
+        chunks = list(minter.chunks(records(8, ["tlink1a", "tlink1b"])))
+
+        self.assertEqual([(0, "tlink1a", 3), (1, "tlink1b", 3), (6, "tlink1a", 1), (7, "tlink1b", 1)],
+                         [(chunk_id, recipient, len(chunk)) for (chunk_id, recipient, chunk) in chunks])
+        self.assertEqual(["item-0", "item-2", "item-4"], [record.name for record in chunks[0][2]])
+
+    def test_bounds_records_held_in_partial_chunks(self):
+        minter = self.new_minter(FakeMintApiClient(), chunk_size=50, max_buffered=4)
+        chunks = list(minter.chunks(records(10, ["tlink1a", "tlink1b", "tlink1c"])))
+
+        self.assertEqual(10, sum(len(chunk) for (_, _, chunk) in chunks))
+        self.assertEqual(sorted(set(chunk_id for (chunk_id, _, _) in chunks)), sorted(chunk_id for (chunk_id, _, _) in chunks))
+
+    def test_mints_concurrently_and_confirms_every_chunk(self):
+        api_client = FakeMintApiClient(latency=0.02)
+        minter = self.new_minter(api_client, chunk_size=10, max_concurrency=4)
+        results = minter.run(records(200, ["tlink1a", "tlink1b", "tlink1c", "tlink1d"]))
+
+        self.assertEqual(20, len(results))
+        self.assertTrue(all(result.error is None for result in results))
+        self.assertEqual(200, sum(len(mint["mintList"]) for mint in api_client.mints))
+        self.assertIn({"tokenType": "10000001", "name": "item-0", "meta": "meta-0"},
+                      [mint["mintList"][0] for mint in api_client.mints])
+        self.assertLessEqual(api_client.max_in_flight, 4)
+        self.assertGreater(api_client.max_in_flight, 1)
+
+    def test_reports_rejected_and_failed_chunks(self):
+        api_client = FakeMintApiClient(failing_recipients=["tlink1b"], rejected_recipients=["tlink1c"])
+        results = self.new_minter(api_client, chunk_size=5).run(records(15, ["tlink1a", "tlink1b", "tlink1c"]))
+
+        errors = {result.recipient: result.error for result in results}
+        self.assertIsNone(errors["tlink1a"])
+        self.assertIsInstance(errors["tlink1b"], TransactionFailedError)
+        self.assertIsInstance(errors["tlink1c"], ApiResponseError)
+
+    def test_resumes_from_checkpoint(self):
+        stream = records(30, ["tlink1a", "tlink1b", "tlink1c"])
+        api_client = FakeMintApiClient(failing_recipients=["tlink1b"])
+        self.new_minter(api_client, chunk_size=5).run(stream)
+        self.assertEqual(6, len(api_client.mints))
+
+        api_client.failing_recipients.clear()
+        results = self.new_minter(api_client, chunk_size=5).run(stream)
+
+        # only the two chunks of the failed transactions are minted again.
+        self.assertEqual(8, len(api_client.mints))
+        self.assertTrue(all(result.error is None for result in results))
+
+    def test_polls_submitted_chunks_instead_of_minting_again(self):
+        stream = records(5, ["tlink1a"])
+        api_client = FakeMintApiClient()
+        api_client.recipients["TX-BEFORE-CRASH"] = "tlink1a"
+        self.checkpoint_store.set("mint:job:0", {"status": "submitted", "txHash": "TX-BEFORE-CRASH"})
+
+        results = self.new_minter(api_client, chunk_size=5).run(stream)
+
+        self.assertEqual(0, len(api_client.mints))
+        self.assertEqual("TX-BEFORE-CRASH", results[0].tx_hash)
+        self.assertEqual("confirmed", self.checkpoint_store.get("mint:job:0")["status"])
+
+    def test_reports_chunks_left_submitting_for_reconciliation(self):
+        stream = records(10, ["tlink1a", "tlink1b"])
+        api_client = FakeMintApiClient(timing_out_recipients=["tlink1b"])
+        results = self.new_minter(api_client, chunk_size=5).run(stream)
+        self.assertIsInstance(results[1].error, TimeoutError)
+        self.assertEqual("submitting", self.checkpoint_store.get("mint:job:1")["status"])
+
+        api_client.timing_out_recipients.clear()
+        results = self.new_minter(api_client, chunk_size=5).run(stream)
+
+        # the timed out mint may have been accepted, so it is not submitted again.
+        self.assertEqual(1, len(api_client.mints))
+        self.assertIsNone(results[0].error)
+        self.assertIsInstance(results[1].error, ReconciliationRequiredError)
+        self.assertEqual("mint:job:1", results[1].error.key)
+
+    def test_submits_rejected_chunks_again_on_resume(self):
+        stream = records(5, ["tlink1a"])
+        api_client = FakeMintApiClient(rejected_recipients=["tlink1a"])
+        self.new_minter(api_client, chunk_size=5).run(stream)
+        self.assertEqual("failed", self.checkpoint_store.get("mint:job:0")["status"])
+
+        api_client.rejected_recipients.clear()
+        results = self.new_minter(api_client, chunk_size=5).run(stream)
+
+        self.assertEqual(1, len(api_client.mints))
+        self.assertIsNone(results[0].error)
+
+    def test_submits_next_chunks_while_transactions_are_pending(self):
+        api_client = FakeMintApiClient()
+        api_client.committed.clear()
+        minter = self.new_minter(api_client, chunk_size=1, max_concurrency=1)
+        runner = threading.Thread(target=minter.run, args=(records(6, ["tlink1a"]),))
+        runner.start()
+        try:
+            deadline = time.monotonic() + 5
+            while len(api_client.mints) < 6 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(6, len(api_client.mints))
+        finally:
+            api_client.committed.set()
+            runner.join()
+
+    def test_leaves_out_missing_meta(self):
+        api_client = FakeMintApiClient()
+        self.new_minter(api_client, chunk_size=5).run(
+            [MintRecord("10000001", "item-0", None, "tlink1a"), MintRecord("10000001", "item-1", "meta-1", "tlink1a")])
+
+        request_body = api_client.mints[0]
+        self.assertEqual([{"tokenType": "10000001", "name": "item-0"},
+                          {"tokenType": "10000001", "name": "item-1", "meta": "meta-1"}], request_body["mintList"])
+        # signed the same as the JSON sent, an empty value standing for the missing meta.
+        self.assertIn("mintList.meta=,meta-1", RequestBodyFlattener().flatten(request_body))
+
+    def test_caps_rate_of_submissions(self):
+        minter = self.new_minter(FakeMintApiClient(), chunk_size=1, max_concurrency=4, rate=50)
+        started = time.monotonic()
+        minter.run(records(6, ["tlink1a"]))
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
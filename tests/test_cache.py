@@ -0,0 +1,111 @@
+import time
+import unittest
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.cache import ResponseCache
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+try:
+    from sdk.async_api_client import AsyncApiClient
+except ImportError:
+    AsyncApiClient = None
+
+
+def respond(method, path, query, body):
+    if path.endswith("/unknown"):
+        return 404, {"statusCode": 4040, "responseData": None}
+    return {"statusCode": 1000, "responseData": {"path": path}}
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(respond).__enter__()
+        self.cache = ResponseCache(max_entries=3)
+        self.api_client = ApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            layers=[self.cache])
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def upstream_calls(self):
+        return len(self.server.requests)
+
+    def test_answers_repeated_reads_from_cache(self):
+        first = self.api_client.service_token_detail("a48f097b")
+        second = self.api_client.service_token_detail(contract_id="a48f097b")
+
+        self.assertEqual(first, second)
+        self.assertEqual(1, self.upstream_calls())
+        self.assertEqual({"hits": 1, "misses": 1, "evictions": 0, "size": 1}, self.cache.stats())
+
+    def test_does_not_cache_failures_or_other_endpoints(self):
+        self.api_client.user_detail("unknown")
+        self.api_client.user_detail("unknown")
+        self.api_client.user_base_coin("user-id")
+        self.api_client.user_base_coin("user-id")
+
+        self.assertEqual(4, self.upstream_calls())
+
+    def test_expires_after_ttl(self):
+        self.cache.ttls["user_detail"] = 0.05
+        self.api_client.user_detail("user-id")
+        time.sleep(0.1)
+        self.api_client.user_detail("user-id")
+
+        self.assertEqual(2, self.upstream_calls())
+
+    def test_evicts_least_recently_used(self):
+        for contract_id in ("c1", "c2", "c3"):
+            self.api_client.service_token_detail(contract_id)
+        self.api_client.service_token_detail("c1")
+        self.api_client.service_token_detail("c4")
+        self.api_client.service_token_detail("c1")
+        self.api_client.service_token_detail("c2")
+
+        self.assertEqual(5, self.upstream_calls())
+        # c2 was evicted by c4, then c3 by refetching c2
+        self.assertEqual(2, self.cache.stats()["evictions"])
+
+    def test_mutating_call_evicts_matching_entries(self):
+        self.api_client.service_token_detail("c1")
+        self.api_client.service_token_detail("c2")
+        self.api_client.service_tokens()
+
+        self.api_client.update_service_token_detail("c1", {"ownerAddress": "tlink1", "ownerSecret": "secret", "name": "name"})
+        self.api_client.service_token_detail("c1")
+        self.api_client.service_token_detail("c2")
+        self.api_client.service_tokens()
+
+        # update, then refetch of c1 and of the token list; c2 stays cached
+        self.assertEqual(6, self.upstream_calls())
+
+    def test_explicit_invalidation(self):
+        self.api_client.fungible_token("c1", "10000001")
+        self.api_client.fungible_token("c1", "10000002")
+        self.cache.invalidate("fungible_token", token_type="10000001")
+        self.api_client.fungible_token("c1", "10000001")
+        self.api_client.fungible_token("c1", "10000002")
+        self.assertEqual(3, self.upstream_calls())
+
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
+
+
+@unittest.skipIf(AsyncApiClient is None, "aiohttp is not installed")
+class TestAsyncResponseCache(unittest.IsolatedAsyncioTestCase):
+    async def test_answers_repeated_reads_from_cache(self):
+        with StubServer(respond) as server:
+            cache = ResponseCache()
+            async with AsyncApiClient(
+                    base_url=server.base_url,
+                    auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+                    layers=[cache]) as api_client:
+                first = await api_client.user_detail("user-id")
+                second = await api_client.user_detail("user-id")
+                await api_client.update_fungible_token("c1", "10000001", {"ownerAddress": "tlink1"})
+
+        self.assertEqual(first, second)
+        self.assertEqual(2, len(server.requests))
+        self.assertEqual(1, cache.stats()["hits"])
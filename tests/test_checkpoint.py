@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from sdk.checkpoint import JsonFileCheckpointStore, MemoryCheckpointStore, SqliteCheckpointStore
+
+
+class CheckpointStoreContract:
+    def new_store(self):
+        raise NotImplementedError
+
+    def test_get_set_delete(self):
+        store = self.new_store()
+        self.assertIsNone(store.get("wallet:tlink1"))
+        self.assertEqual(0, store.get("wallet:tlink1", 0))
+
+        store.set("wallet:tlink1", {"timestamp": 1581850266351, "txhashes": ["A"]})
+        self.assertEqual({"timestamp": 1581850266351, "txhashes": ["A"]}, store.get("wallet:tlink1"))
+
+        store.delete("wallet:tlink1")
+        store.delete("wallet:tlink1")
+        self.assertIsNone(store.get("wallet:tlink1"))
+
+
+class TestMemoryCheckpointStore(CheckpointStoreContract, unittest.TestCase):
+    def new_store(self):
+        return MemoryCheckpointStore()
+
+
+class TestJsonFileCheckpointStore(CheckpointStoreContract, unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "checkpoints.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def new_store(self):
+        return JsonFileCheckpointStore(self.path)
+
+    def test_survives_reopen(self):
+        self.new_store().set("user:user-id", {"timestamp": 1, "txhashes": []})
+        self.assertEqual({"timestamp": 1, "txhashes": []}, self.new_store().get("user:user-id"))
+
+
+class TestSqliteCheckpointStore(CheckpointStoreContract, unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "checkpoints.db")
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        self.directory.cleanup()
+
+    def new_store(self):
+        store = SqliteCheckpointStore(self.path)
+        self.stores.append(store)
+        return store
+
+    def test_shared_between_connections(self):
+        first, second = self.new_store(), self.new_store()
+        first.set("user:user-id", {"timestamp": 1, "txhashes": []})
+        self.assertEqual({"timestamp": 1, "txhashes": []}, second.get("user:user-id"))
@@ -0,0 +1,73 @@
+import time
+import unittest
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.clock import CalibratedClock
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+SKEW_MS = 90000
+
+
+class FakeTimeApiClient:
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.calls = 0
+
+    def time(self):
+        # the server reads its clock halfway through the round trip,
+        # except that a slow request gets its reply delayed after that.
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        server_ms = int(time.time() * 1000) + SKEW_MS
+        time.sleep(delay)
+        return {"statusCode": 1000, "responseTime": server_ms}
+
+
+class TestCalibratedClock(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_estimates_skew(self):
+        clock = CalibratedClock(FakeTimeApiClient([0.0]))
+        self.assertEqual(0, clock.skew_ms)
+        self.assertIsNone(clock.rtt_ms)
+
+        clock.sample()
+
+        self.assertAlmostEqual(SKEW_MS, clock.skew_ms, delta=20)
+        self.assertAlmostEqual(time.time() * 1000 + SKEW_MS, clock.now_millis(), delta=20)
+
+    def test_trusts_sample_with_smallest_round_trip(self):
+        clock = CalibratedClock(FakeTimeApiClient([0.0, 0.2, 0.2]))
+        for _ in range(3):
+            clock.sample()
+
+        self.assertAlmostEqual(SKEW_MS, clock.skew_ms, delta=20)
+        self.assertLess(clock.rtt_ms, 100)
+
+    def test_resamples_periodically(self):
+        api_client = FakeTimeApiClient([0.0])
+        clock = CalibratedClock(api_client, resample_interval=0.02).start()
+        time.sleep(0.2)
+        clock.stop()
+
+        self.assertGreater(api_client.calls, 3)
+
+    def test_signs_requests_with_calibrated_timestamp(self):
+        server_ms = int(time.time() * 1000) + SKEW_MS
+
+        def respond(method, path, query, body):
+            return {"statusCode": 1000, "responseTime": server_ms}
+
+        with StubServer(respond) as server:
+            auth = ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator())
+            api_client = ApiClient(base_url=server.base_url, auth=auth)
+            auth.clock = CalibratedClock(api_client)
+            auth.clock.sample()
+            api_client.user_detail("user-id")
+
+            timestamp = int(server.requests[-1][3]["Timestamp"])
+        self.assertAlmostEqual(server_ms, timestamp, delta=1000)
@@ -0,0 +1,89 @@
+import inspect
+import unittest
+from uplink import Consumer, Path, Query
+from uplink.interfaces import RequestDefinitionBuilder
+from sdk import endpoints
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.endpoints import LazyEndpoint, get, returns
+from sdk.layers import bound_arguments, endpoint_methods
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+
+class TestLazyEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.built = []
+        original = endpoints.ConsumerMethod
+        test = self
+
+        class RecordingConsumerMethod(original):
+            def __init__(self, owner_name, attr_name, request_definition_builder):
+                test.built.append(attr_name)
+                super().__init__(owner_name, attr_name, request_definition_builder)
+
+        endpoints.ConsumerMethod = RecordingConsumerMethod
+        self.addCleanup(setattr, endpoints, "ConsumerMethod", original)
+
+        class Users(Consumer):
+            @returns.json
+            @get("/v1/users/{user_id}")
+            def user_detail(self, user_id: Path("user_id")):
+                """Retrieve a user."""
+
+            @returns.json
+            @get("/v1/users/{user_id}/transactions")
+            def user_transactions(self, user_id: Path("user_id"), limit: Query = 10):
+                """List transactions of a user."""
+
+        self.consumer_class = Users
+
+    def tearDown(self):
+        pass
+
+    def test_builds_definitions_on_first_access_only(self):
+        self.assertIsInstance(inspect.getattr_static(self.consumer_class, "user_detail"), LazyEndpoint)
+        self.assertEqual({"user_detail": "GET", "user_transactions": "GET"}, endpoint_methods(self.consumer_class))
+        self.assertEqual({"user_id": "user-id", "limit": 10},
+                         bound_arguments(self.consumer_class, "user_transactions", ("user-id",), {}))
+        self.assertEqual([], self.built)
+
+        consumer = self.consumer_class(base_url="http://127.0.0.1")
+        endpoint = consumer.user_detail
+        self.assertEqual(["user_detail"], self.built)
+        self.assertEqual("Retrieve a user.", endpoint.__doc__)
+
+        self.consumer_class(base_url="http://127.0.0.1").user_detail
+        self.assertEqual(["user_detail"], self.built)
+
+    def test_class_access_returns_definition_builder(self):
+        builder = self.consumer_class.user_transactions
+        self.assertIsInstance(builder, RequestDefinitionBuilder)
+        self.assertEqual("GET", builder.method.upper())
+
+
+class TestApiClientEndpoints(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_http_methods_match_built_definitions(self):
+        methods = endpoint_methods(ApiClient)
+        self.assertEqual(74, len(methods))
+        for (name, method) in methods.items():
+            self.assertEqual(method, getattr(ApiClient, name).method.upper(), name)
+
+    def test_session_changes_apply_after_first_call(self):
+        with StubServer() as server:
+            api_client = ApiClient(
+                base_url=server.base_url,
+                auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()))
+            api_client.time()
+            api_client.session.headers["X-Trace"] = "abc"
+            api_client.session.params["p"] = "1"
+            api_client.time()
+
+            (_, _, query, headers, _) = server.requests[1]
+            self.assertEqual("abc", headers.get("X-Trace"))
+            self.assertEqual("1", query.get("p"))
@@ -0,0 +1,125 @@
+import json
+import unittest
+from unittest import mock
+from sdk import json_codec
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.json_codec import OrjsonCodec, StdlibJsonCodec, default_json_codec
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+try:
+    from sdk import _speedups
+except ImportError:
+    _speedups = None
+
+try:
+    from sdk.async_api_client import AsyncApiClient
+except ImportError:
+    AsyncApiClient = None
+
+# signed bodies are encoded while signing with sdk._speedups, by the codec without it.
+SIGNED_BODY_DUMPS = 0 if _speedups is not None else 1
+
+CODECS = [StdlibJsonCodec] + ([OrjsonCodec] if json_codec.orjson is not None else [])
+
+PAGE = {
+    "statusCode": 1000,
+    "responseData": [{"txhash": f"TX{index}", "height": index, "memo": "한글 memo", "ok": True, "fee": None}
+                     for index in range(100)],
+}
+
+
+class CountingCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.dumped = 0
+        self.loaded = 0
+
+    def dumps(self, value):
+        self.dumped += 1
+        return super().dumps(value)
+
+    def loads(self, data):
+        self.loaded += 1
+        return super().loads(data)
+
+
+def respond(method, path, query, body):
+    if path.endswith("/broken"):
+        return 502, b"<html>Bad Gateway</html>"
+    return PAGE
+
+
+class TestJsonCodec(unittest.TestCase):
+    def test_codecs_round_trip(self):
+        for codec_class in CODECS:
+            codec = codec_class()
+            encoded = codec.dumps(PAGE)
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(PAGE, json.loads(encoded))
+            self.assertEqual(PAGE, codec.loads(encoded))
+            self.assertEqual(PAGE, codec.loads(encoded.decode("utf-8")))
+            self.assertRaises(json.JSONDecodeError, codec.loads, b"<html>")
+
+    def test_falls_back_to_stdlib_without_orjson(self):
+        with mock.patch.object(json_codec, "orjson", None):
+            self.assertIsInstance(default_json_codec(), StdlibJsonCodec)
+            self.assertRaises(ImportError, OrjsonCodec)
+
+    def test_api_client_encodes_and_decodes_with_codec(self):
+        codec = CountingCodec()
+        with StubServer(respond) as server:
+            api_client = ApiClient(
+                base_url=server.base_url,
+                auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+                json_codec=codec)
+            response = api_client.user_transactions("user-id")
+            api_client.update_fungible_token("c1", "10000001", {"ownerAddress": "tlink1", "name": "한글"})
+
+        self.assertEqual(PAGE, response)
+        self.assertEqual((SIGNED_BODY_DUMPS, 2), (codec.dumped, codec.loaded))
+        (_, _, _, headers, raw_body) = server.requests[1]
+        self.assertEqual({"ownerAddress": "tlink1", "name": "한글"}, json.loads(raw_body))
+        self.assertIn('"name":"한글"'.encode("utf-8"), raw_body)
+        self.assertEqual("application/json", headers["Content-Type"])
+
+    def test_codec_encodes_bodies_without_auth(self):
+        codec = CountingCodec()
+        with StubServer(respond) as server:
+            ApiClient(base_url=server.base_url, json_codec=codec).update_fungible_token(
+                "c1", "10000001", {"ownerAddress": "tlink1"})
+
+        self.assertEqual(1, codec.dumped)
+        self.assertEqual(b'{"ownerAddress":"tlink1"}', server.requests[0][4])
+
+    def test_invalid_json_raises_json_decode_error(self):
+        with StubServer(respond) as server:
+            api_client = ApiClient(
+                base_url=server.base_url,
+                auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()))
+            self.assertRaises(json.JSONDecodeError, api_client.user_detail, "broken")
+
+
+@unittest.skipIf(AsyncApiClient is None, "aiohttp is not installed")
+class TestAsyncJsonCodec(unittest.IsolatedAsyncioTestCase):
+    async def test_api_client_encodes_and_decodes_with_codec(self):
+        codec = CountingCodec()
+        with StubServer(respond) as server:
+            async with AsyncApiClient(
+                    base_url=server.base_url,
+                    auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+                    json_codec=codec) as api_client:
+                response = await api_client.user_transactions("user-id")
+                await api_client.update_fungible_token("c1", "10000001", {"ownerAddress": "tlink1"})
+
+        self.assertEqual(PAGE, response)
+        self.assertEqual((SIGNED_BODY_DUMPS, 2), (codec.dumped, codec.loaded))
+        self.assertEqual(b'{"ownerAddress":"tlink1"}', server.requests[1][4])
+
+    async def test_codec_encodes_bodies_without_auth(self):
+        codec = CountingCodec()
+        with StubServer(respond) as server:
+            async with AsyncApiClient(base_url=server.base_url, json_codec=codec) as api_client:
+                await api_client.update_fungible_token("c1", "10000001", {"ownerAddress": "tlink1"})
+
+        self.assertEqual(1, codec.dumped)
+        self.assertEqual(b'{"ownerAddress":"tlink1"}', server.requests[0][4])
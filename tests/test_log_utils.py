@@ -0,0 +1,87 @@
+import logging
+import types
+import unittest
+from unittest import mock
+from sdk import signature_generator
+from sdk.api_client import ApiSignatureAuth
+from sdk.log_utils import REDACTED, DebugLogSampler, debug_sampler, redact, redact_sign_target
+from sdk.signature_generator import SignatureGenerator
+
+REQUEST_BODY = {
+    "ownerAddress": "tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq",
+    "ownerSecret": "uhbdnNvIqQFnnIFDDG8EuVxtqkwsLtDR/owKInQIYmo=",
+    "transferList": [{"tokenId": "1000000100000001", "walletSecret": "PCSO7JBIH1gWPNNR5vT58Hr2SycFSUb9nzpNapNjJFU="}]
+}
+
+
+class TestLogUtils(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger("sdk.signature_generator")
+        self.level = self.logger.level
+
+    def tearDown(self):
+        self.logger.setLevel(self.level)
+
+    def test_redact_nested_secret_fields(self):
+        redacted = redact(REQUEST_BODY)
+
+        self.assertEqual(REDACTED, redacted["ownerSecret"])
+        self.assertEqual(REDACTED, redacted["transferList"][0]["walletSecret"])
+        self.assertEqual("1000000100000001", redacted["transferList"][0]["tokenId"])
+        self.assertEqual("uhbdnNvIqQFnnIFDDG8EuVxtqkwsLtDR/owKInQIYmo=", REQUEST_BODY["ownerSecret"])
+
+    def test_redact_sign_target(self):
+        sign_target = b"Bp0IqgXE1581850266351POST/v1/memos?memo=hi&walletAddress=tlink1&walletSecret=abc/def="
+
+        self.assertEqual(
+            "Bp0IqgXE1581850266351POST/v1/memos?memo=hi&walletAddress=tlink1&walletSecret=" + REDACTED,
+            redact_sign_target(sign_target))
+
+    def test_sampler_is_disabled_without_debug(self):
+        self.logger.setLevel(logging.INFO)
+        self.assertFalse(DebugLogSampler(1.0).enabled_for(self.logger))
+        self.logger.setLevel(logging.DEBUG)
+        self.assertTrue(DebugLogSampler(1.0).enabled_for(self.logger))
+        self.assertFalse(DebugLogSampler(0.0).enabled_for(self.logger))
+
+    def test_sampler_rate(self):
+        self.logger.setLevel(logging.DEBUG)
+        sampler = DebugLogSampler(0.25)
+        sampled = sum(sampler.enabled_for(self.logger) for _ in range(20000))
+        self.assertAlmostEqual(5000, sampled, delta=500)
+
+    def test_generate_does_not_format_when_debug_is_disabled(self):
+        self.logger.setLevel(logging.INFO)
+        with mock.patch.object(signature_generator, "redact_sign_target") as redact_target, mock.patch.object(self.logger, "debug") as debug:
+            SignatureGenerator().generate("secret", "POST", "/v1/memos", 1581850266351, "Bp0IqgXE", body=REQUEST_BODY)
+        redact_target.assert_not_called()
+        debug.assert_not_called()
+
+    def test_generate_logs_redacted_sign_target_when_debug_is_enabled(self):
+        self.logger.setLevel(logging.DEBUG)
+        with self.assertLogs(self.logger, logging.DEBUG) as logs:
+            SignatureGenerator().generate("secret", "POST", "/v1/memos", 1581850266351, "Bp0IqgXE", body=REQUEST_BODY)
+
+        output = "\n".join(logs.output)
+        self.assertIn("signTarget", output)
+        self.assertNotIn(REQUEST_BODY["ownerSecret"], output)
+        self.assertNotIn(REQUEST_BODY["transferList"][0]["walletSecret"], output)
+
+    def test_request_is_sampled_once_for_every_logger(self):
+        sdk_logger = logging.getLogger("sdk")
+        self.addCleanup(sdk_logger.setLevel, sdk_logger.level)
+        sdk_logger.setLevel(logging.DEBUG)
+        auth = ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator())
+        logged = set()
+        with mock.patch.object(debug_sampler, "rate", 0.5):
+            for _ in range(50):
+                request_builder = types.SimpleNamespace(
+                    method="POST", relative_url="/v1/memos", info={"headers": {}, "params": {}, "data": dict(REQUEST_BODY)})
+                with self.assertLogs(sdk_logger, logging.DEBUG) as logs:
+                    # logged, so that assertLogs does not fail for requests not sampled.
+                    sdk_logger.debug("request")
+                    auth(request_builder)
+                loggers = frozenset(record.name for record in logs.records[1:])
+                logged.add(loggers)
+
+        self.assertEqual({frozenset(), frozenset(["sdk.api_client", "sdk.signature_generator"])}, logged)
@@ -0,0 +1,86 @@
+import multiprocessing
+import os
+import threading
+import time
+import unittest
+from sdk.nonce import NONCE_ALPHABET, NonceProvider
+
+
+def take_nonces(provider, count, queue):
+    queue.put([provider.next() for _ in range(count)])
+
+
+class TestNonceProvider(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_nonce_format(self):
+        provider = NonceProvider(batch_size=16)
+        for _ in range(100):
+            nonce = provider.next()
+            self.assertEqual(8, len(nonce))
+            self.assertTrue(set(nonce) <= set(NONCE_ALPHABET))
+
+    def test_uses_whole_alphabet(self):
+        provider = NonceProvider()
+        used = set("".join(provider.next() for _ in range(2000)))
+        self.assertEqual(set(NONCE_ALPHABET), used)
+
+    def test_prefix(self):
+        provider = NonceProvider(prefix="W1")
+        self.assertTrue(provider.next().startswith("W1"))
+        with self.assertRaises(ValueError):
+            NonceProvider(prefix="-")
+        with self.assertRaises(ValueError):
+            NonceProvider(prefix="ABCDEFGH")
+
+    def test_no_reuse_within_window_even_with_tiny_nonce_space(self):
+        # only 62 nonces are possible with a seven character prefix
+        provider = NonceProvider(batch_size=8, window=60, prefix="ABCDEFG")
+        nonces = [provider.next() for _ in range(62)]
+        self.assertEqual(62, len(set(nonces)))
+
+    def test_nonces_are_reusable_after_window(self):
+        provider = NonceProvider(batch_size=8, window=0.05, prefix="ABCDEFG")
+        first = {provider.next() for _ in range(62)}
+        time.sleep(0.12)
+        provider.next()
+        time.sleep(0.06)
+        second = {provider.next() for _ in range(62)}
+        self.assertEqual(first, second)
+
+    def test_collision_stress_across_threads(self):
+        provider = NonceProvider(batch_size=256)
+        results = [None] * 16
+
+        def take(index):
+            results[index] = [provider.next() for _ in range(20000)]
+
+        threads = [threading.Thread(target=take, args=(index,)) for index in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        nonces = [nonce for result in results for nonce in result]
+        self.assertEqual(len(nonces), len(set(nonces)))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_forked_processes_do_not_reuse_buffered_nonces(self):
+        provider = NonceProvider(batch_size=1024)
+        parent = [provider.next()]
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        processes = [context.Process(target=take_nonces, args=(provider, 500, queue)) for _ in range(4)]
+        for process in processes:
+            process.start()
+        children = [queue.get(timeout=30) for _ in processes]
+        for process in processes:
+            process.join()
+        parent += [provider.next() for _ in range(500)]
+
+        nonces = parent + [nonce for child in children for nonce in child]
+        self.assertEqual(len(nonces), len(set(nonces)))
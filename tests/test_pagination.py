@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import unittest
+from sdk.exceptions import ApiResponseError
+from sdk.pagination import apaginate, paginate
+
+
+class FakeListEndpoint:
+    def __init__(self, total, status_code=1000):
+        self.total = total
+        self.status_code = status_code
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def page_of(self, contract_id, limit, page, order_by):
+        with self.lock:
+            self.calls.append((contract_id, limit, page, order_by))
+        start = (page - 1) * limit
+        records = [{"index": index} for index in range(start, min(start + limit, self.total))]
+        return {"statusCode": self.status_code, "responseData": records}
+
+    def __call__(self, contract_id, limit=10, page=1, order_by="desc"):
+        return self.page_of(contract_id, limit, page, order_by)
+
+
+class AsyncFakeListEndpoint(FakeListEndpoint):
+    async def __call__(self, contract_id, limit=10, page=1, order_by="desc"):
+        await asyncio.sleep(0)
+        return self.page_of(contract_id, limit, page, order_by)
+
+
+class TestPaginate(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_yields_all_records_and_stops_on_short_page(self):
+        endpoint = FakeListEndpoint(25)
+        records = list(paginate(endpoint, "contract-id", limit=10, order_by="asc"))
+
+        self.assertEqual(list(range(25)), [record["index"] for record in records])
+        self.assertEqual([("contract-id", 10, page, "asc") for page in (1, 2, 3)], endpoint.calls)
+
+    def test_stops_on_empty_page(self):
+        endpoint = FakeListEndpoint(20)
+        records = list(paginate(endpoint, "contract-id", limit=10))
+
+        self.assertEqual(20, len(records))
+        self.assertEqual([1, 2, 3], [call[2] for call in endpoint.calls])
+
+    def test_is_lazy_and_prefetches_next_page(self):
+        endpoint = FakeListEndpoint(100)
+        records = paginate(endpoint, "contract-id", limit=10)
+        self.assertEqual([], endpoint.calls)
+
+        next(records)
+        # the second page is requested while the first one is being consumed
+        for _ in range(100):
+            if len(endpoint.calls) == 2:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual([1, 2], [call[2] for call in endpoint.calls])
+        records.close()
+
+    def test_without_prefetch(self):
+        endpoint = FakeListEndpoint(15)
+        records = paginate(endpoint, "contract-id", limit=10, prefetch=False)
+        next(records)
+
+        self.assertEqual([1], [call[2] for call in endpoint.calls])
+        self.assertEqual(14, len(list(records)))
+
+    def test_raises_on_failed_page(self):
+        endpoint = FakeListEndpoint(5, status_code=4041)
+        with self.assertRaises(ApiResponseError) as context:
+            list(paginate(endpoint, "contract-id"))
+        self.assertEqual(4041, context.exception.status_code)
+
+
+class TestAsyncPaginate(unittest.IsolatedAsyncioTestCase):
+    async def test_yields_all_records_and_stops_on_short_page(self):
+        endpoint = AsyncFakeListEndpoint(25)
+        records = [record async for record in apaginate(endpoint, "contract-id", limit=10)]
+
+        self.assertEqual(list(range(25)), [record["index"] for record in records])
+        self.assertEqual([1, 2, 3], [call[2] for call in endpoint.calls])
+
+    async def test_prefetches_next_page(self):
+        endpoint = AsyncFakeListEndpoint(100)
+        records = apaginate(endpoint, "contract-id", limit=10)
+        await records.__anext__()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([1, 2], [call[2] for call in endpoint.calls])
+        await records.aclose()
+
+    async def test_without_prefetch(self):
+        endpoint = AsyncFakeListEndpoint(15)
+        records = apaginate(endpoint, "contract-id", limit=10, prefetch=False)
+        await records.__anext__()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([1], [call[2] for call in endpoint.calls])
+        self.assertEqual(14, len([record async for record in records]))
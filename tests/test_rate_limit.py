@@ -0,0 +1,117 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.rate_limit import RateLimiter, TokenBucket
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+def respond(method, path, query, body):
+    return {"statusCode": 1000, "responseData": {"path": path}}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def reserve_in_process(path, count, queue):
+    bucket = TokenBucket(rate=10, capacity=1, state_path=path)
+    queue.put([bucket.reserve() for _ in range(count)])
+    bucket.close()
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_reserves_burst_then_spaces_by_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+
+        self.assertEqual([0.0, 0.0], [bucket.reserve(), bucket.reserve()])
+        self.assertAlmostEqual(0.1, bucket.reserve())
+        self.assertAlmostEqual(0.2, bucket.reserve())
+
+        clock.now += 1
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertAlmostEqual(0.4, bucket.reserve(tokens=5))
+
+    def test_refills_no_more_than_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+        clock.now += 60
+
+        delays = [bucket.reserve() for _ in range(3)]
+        self.assertAlmostEqual(0.1, delays[-1])
+
+    @unittest.skipUnless(fcntl is not None and hasattr(os, "fork"), "requires fcntl and fork")
+    def test_shares_budget_across_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rate")
+            context = multiprocessing.get_context("fork")
+            queue = context.Queue()
+            processes = [context.Process(target=reserve_in_process, args=(path, 5, queue)) for _ in range(2)]
+            for process in processes:
+                process.start()
+            delays = sorted(queue.get(timeout=10) + queue.get(timeout=10))
+            for process in processes:
+                process.join()
+
+        # one bucket of 10 tokens per second serves 10 reservations over ~0.9 seconds, not 2 x 0.4.
+        self.assertGreater(delays[-1], 0.7)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(respond).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def api_client(self, limiter):
+        return ApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            layers=[limiter])
+
+    def test_holds_reads_to_rate(self):
+        limiter = RateLimiter(read_rate=20, write_rate=20, read_capacity=1)
+        api_client = self.api_client(limiter)
+
+        started = time.monotonic()
+        for _ in range(5):
+            api_client.user_detail("user-id")
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.18)
+        self.assertEqual(5, len(self.server.requests))
+        self.assertEqual(4, limiter.stats()["throttled"])
+
+    def test_reads_and_writes_have_separate_budgets(self):
+        limiter = RateLimiter(read_rate=1, write_rate=1)
+        api_client = self.api_client(limiter)
+
+        started = time.monotonic()
+        api_client.user_detail("user-id")
+        api_client.update_fungible_token("c1", "10000001", {"ownerAddress": "tlink1"})
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(0, limiter.stats()["throttled"])
+
+    def test_weighs_endpoints(self):
+        limiter = RateLimiter(read_rate=100, write_rate=100, weights={"user_detail": 110})
+        api_client = self.api_client(limiter)
+
+        api_client.user_base_coin("user-id")
+        api_client.user_detail("user-id")
+
+        self.assertEqual(1, limiter.stats()["throttled"])
+        self.assertAlmostEqual(0.11, limiter.stats()["waited"], delta=0.02)
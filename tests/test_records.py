@@ -0,0 +1,110 @@
+import pickle
+import unittest
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.pagination import paginate
+from sdk.records import Balance, Holder, NonFungibleToken, RecordMapper, TransactionSummary, to_records
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+TRANSACTION = {
+    "height": 1045,
+    "txhash": "22DF78611396824D293AF7ABA04A2A646B1E3055A19B32E731D8E03BAE743661",
+    "code": 0,
+    "index": 0,
+    "timestamp": 1581850266351,
+    "gasUsed": 38700,
+    "logs": [{"msgIndex": 0, "success": True, "log": "", "events": []}],
+    "tx": {
+        "type": "cosmos-sdk/StdTx",
+        "value": {
+            "msg": [{"type": "token/MsgMint", "value": {"amount": "1000"}}],
+            "memo": "mint memo"
+        }
+    }
+}
+
+
+def respond(method, path, query, body):
+    if path.endswith("/holders"):
+        return {"statusCode": 1000, "responseData": [{"address": "tlink1", "userId": "user-1", "amount": "31"}]}
+    if path.endswith("/transactions"):
+        return {"statusCode": 1000, "responseData": [TRANSACTION]}
+    return {"statusCode": 4040, "statusMessage": "Not found", "responseData": None}
+
+
+class TestRecords(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_holder_from_dict(self):
+        holder = Holder.from_dict({"address": "tlink1", "userId": "user-1", "amount": "31"})
+        self.assertEqual(Holder("tlink1", "user-1", "31"), holder)
+        self.assertEqual({"address": "tlink1", "userId": "user-1", "amount": "31"}, holder.to_dict())
+        self.assertFalse(hasattr(holder, "__dict__"))
+
+    def test_balance_interns_repeated_strings(self):
+        contract_ids = ["".join(["9636", "a07e"]), "".join(["963", "6a07e"])]
+        self.assertIsNot(contract_ids[0], contract_ids[1])
+        (first, second) = (Balance.from_dict({"contractId": contract_id, "name": "Token", "symbol": "TKN", "decimals": 6, "amount": "1"})
+                           for contract_id in contract_ids)
+        self.assertIs(first.contract_id, second.contract_id)
+        self.assertIsNone(first.token_type)
+
+    def test_non_fungible_token_from_nested_and_flat_records(self):
+        nested = NonFungibleToken.from_dict(
+            {"tokenType": "10000001", "name": "Type", "token": {"tokenIndex": "00000001", "name": "NFT", "meta": "m"}})
+        flat = NonFungibleToken.from_dict({"tokenType": "10000001", "tokenIndex": "00000001", "name": "NFT", "meta": "m"})
+        self.assertEqual(nested, flat)
+        self.assertEqual("1000000100000001", nested.token_id)
+
+    def test_transaction_summary_drops_logs_and_messages(self):
+        summary = TransactionSummary.from_dict(TRANSACTION)
+        self.assertEqual(
+            TransactionSummary(TRANSACTION["txhash"], 1045, 0, 1581850266351, "token/MsgMint", "mint memo"), summary)
+        self.assertEqual(summary, pickle.loads(pickle.dumps(summary)))
+
+    def test_to_records_accepts_callables_and_single_records(self):
+        self.assertEqual(["tlink1"], to_records(lambda data: data["address"], [{"address": "tlink1"}]))
+        self.assertEqual(Holder("tlink1"), to_records(Holder, {"address": "tlink1"}))
+        self.assertIsNone(to_records(Holder, None))
+
+    def test_paginate_with_record_type(self):
+        def endpoint(contract_id, limit, page, order_by):
+            return {"statusCode": 1000, "responseData": [{"address": f"tlink{page}"}] if page < 3 else []}
+
+        holders = list(paginate(endpoint, "contract-id", limit=1, record_type=Holder))
+        self.assertEqual([Holder("tlink1"), Holder("tlink2")], holders)
+
+
+class TestRecordMapper(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(respond).__enter__()
+        self.api_client = ApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            layers=[RecordMapper()])
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_maps_list_endpoints(self):
+        response = self.api_client.service_token_holders("contract-id")
+        self.assertEqual([Holder("tlink1", "user-1", "31")], response["responseData"])
+
+        response = self.api_client.user_transactions("user-id")
+        self.assertEqual([TransactionSummary.from_dict(TRANSACTION)], response["responseData"])
+
+    def test_layered_endpoints_see_session_changes(self):
+        self.api_client.service_token_holders("contract-id")
+        self.api_client.session.headers["X-Trace"] = "abc"
+        self.api_client.service_token_holders("contract-id")
+
+        (_, _, _, headers, _) = self.server.requests[-1]
+        self.assertEqual("abc", headers.get("X-Trace"))
+
+    def test_leaves_failed_responses_and_other_endpoints(self):
+        self.assertIsNone(self.api_client.user_service_tokens("user-id")["responseData"])
+        self.assertEqual(4040, self.api_client.user_detail("user-id")["statusCode"])
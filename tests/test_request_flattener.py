@@ -1,3 +1,4 @@
+import json
 import unittest
 from sdk.request_flattener import RequestBodyFlattener
 
@@ -32,3 +33,34 @@ class TestFlattenBody(unittest.TestCase):
 
         expected = "mintList.meta=,New nft 2 meta information&mintList.name=NewNFT,NewNFT2&mintList.tokenType=10000001,10000003&ownerAddress=tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq&ownerSecret=uhbdnNvIqQFnnIFDDG8EuVxtqkwsLtDR/owKInQIYmo=&toAddress=tlink18zxqds28mmg8mwduk32csx5xt6urw93ycf8jwp"
         self.assertEqual(expected,  RequestBodyFlattener().flatten(req_params))
+
+    def test_with_keys_missing_in_later_elements(self):
+        req_params = {
+            'transferList': [
+                {'tokenId': '1000000100000001', 'memo': 'first'},
+                {'tokenId': '1000000100000002'},
+                {'tokenId': '1000000100000003'}
+            ]
+        }
+
+        expected = "transferList.memo=first,,&transferList.tokenId=1000000100000001,1000000100000002,1000000100000003"
+        self.assertEqual(expected, RequestBodyFlattener().flatten(req_params))
+
+    def test_flatten_and_encode_matches_flatten_and_json(self):
+        req_params = {
+            'toAddress': 'tlink18zxqds28mmg8mwduk32csx5xt6urw93ycf8jwp',
+            'memo': 'quote " backslash \\ 한글\n',
+            'mintList': [
+                {'tokenType': '10000001', 'name': 'NewNFT'},
+                {'tokenType': '10000003', 'name': 'NewNFT2', 'meta': 'New nft 2 meta information'}
+            ]
+        }
+
+        (flattened, encoded) = RequestBodyFlattener().flatten_and_encode(req_params)
+        self.assertEqual(RequestBodyFlattener().flatten(req_params), flattened)
+        self.assertEqual(req_params, json.loads(encoded))
+        self.assertIn('한글'.encode('utf-8'), encoded)
+
+    def test_flatten_and_encode_declines_unsupported_bodies(self):
+        self.assertIsNone(RequestBodyFlattener().flatten_and_encode({'amount': 1}))
+        self.assertIsNone(RequestBodyFlattener().flatten_and_encode({'mintList': ['not-a-dict']}))
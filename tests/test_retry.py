@@ -0,0 +1,150 @@
+import itertools
+import unittest
+import requests
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.retry import RetryBudget, RetryPolicy
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+try:
+    from sdk.async_api_client import AsyncApiClient
+except ImportError:
+    AsyncApiClient = None
+
+
+def failing_first(failures, payload=(503, {"statusCode": 5030, "statusMessage": "Service unavailable"})):
+    counter = itertools.count()
+
+    def respond(method, path, query, body):
+        if next(counter) < failures:
+            return payload
+        return {"statusCode": 1000, "responseData": {"path": path}}
+
+    return respond
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def api_client(self, server, retry_policy):
+        return ApiClient(
+            base_url=server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            layers=[retry_policy])
+
+    def test_retries_reads_with_fresh_signatures(self):
+        retry_policy = RetryPolicy(base_delay=0.001)
+        with StubServer(failing_first(2)) as server:
+            response = self.api_client(server, retry_policy).user_detail("user-id")
+
+        self.assertEqual(1000, response["statusCode"])
+        self.assertEqual(3, len(server.requests))
+        nonces = {headers["Nonce"] for (_, _, _, headers, _) in server.requests}
+        signatures = {headers["Signature"] for (_, _, _, headers, _) in server.requests}
+        self.assertEqual(3, len(nonces))
+        self.assertEqual(3, len(signatures))
+        self.assertEqual({"retries": 2, "exhausted": 0}, retry_policy.stats())
+
+    def test_retries_bodies_which_are_not_json(self):
+        with StubServer(failing_first(1, (502, b"<html>Bad Gateway</html>"))) as server:
+            response = self.api_client(server, RetryPolicy(base_delay=0.001)).user_detail("user-id")
+
+        self.assertEqual(1000, response["statusCode"])
+        self.assertEqual(2, len(server.requests))
+
+    def test_retries_server_errors_without_status_code(self):
+        with StubServer(failing_first(1, (503, {"message": "upstream unavailable"}))) as server:
+            response = self.api_client(server, RetryPolicy(base_delay=0.001)).user_detail("user-id")
+
+        self.assertEqual(1000, response["statusCode"])
+        self.assertEqual(2, len(server.requests))
+
+    def test_returns_last_server_error_with_its_http_status(self):
+        with StubServer(failing_first(10, (429, {"message": "slow down"}))) as server:
+            response = self.api_client(server, RetryPolicy(max_attempts=2, base_delay=0.001)).user_detail("user-id")
+
+        self.assertEqual({"message": "slow down"}, response)
+        self.assertEqual(429, response.http_status)
+        self.assertEqual(2, len(server.requests))
+
+    def test_gives_up_after_max_attempts(self):
+        with StubServer(failing_first(10)) as server:
+            response = self.api_client(server, RetryPolicy(max_attempts=3, base_delay=0.001)).user_detail("user-id")
+
+        self.assertEqual(5030, response["statusCode"])
+        self.assertEqual(3, len(server.requests))
+
+    def test_does_not_retry_client_errors(self):
+        with StubServer(failing_first(1, (404, {"statusCode": 4040}))) as server:
+            response = self.api_client(server, RetryPolicy(base_delay=0.001)).user_detail("user-id")
+
+        self.assertEqual(4040, response["statusCode"])
+        self.assertEqual(1, len(server.requests))
+
+    def test_retries_writes_only_when_marked_safe(self):
+        with StubServer(failing_first(1)) as server:
+            self.api_client(server, RetryPolicy(base_delay=0.001)).update_fungible_token(
+                "c1", "10000001", {"ownerAddress": "tlink1"})
+        self.assertEqual(1, len(server.requests))
+
+        with StubServer(failing_first(1)) as server:
+            self.api_client(server, RetryPolicy(base_delay=0.001, safe_endpoints=["update_fungible_token"])).update_fungible_token(
+                "c1", "10000001", {"ownerAddress": "tlink1"})
+        self.assertEqual(2, len(server.requests))
+
+    def test_budget_caps_retries(self):
+        retry_policy = RetryPolicy(base_delay=0.001, budget=RetryBudget(ratio=0.1, capacity=2))
+        with StubServer(failing_first(100)) as server:
+            api_client = self.api_client(server, retry_policy)
+            for _ in range(5):
+                api_client.user_detail("user-id")
+
+        # 2 saved retries plus 0.1 earned per call.
+        self.assertEqual(2, retry_policy.stats()["retries"])
+        self.assertEqual(7, len(server.requests))
+
+    def test_retries_connection_errors(self):
+        attempts = []
+
+        def endpoint(user_id):
+            attempts.append(user_id)
+            if len(attempts) < 3:
+                raise requests.ConnectionError("reset")
+            return {"statusCode": 1000}
+
+        response = RetryPolicy(base_delay=0.001).call(ApiClient, "user_detail", endpoint, ("user-id",), {})
+        self.assertEqual({"statusCode": 1000}, response)
+        self.assertEqual(3, len(attempts))
+
+    def test_raises_other_errors_at_once(self):
+        attempts = []
+
+        def endpoint(user_id):
+            attempts.append(user_id)
+            raise TypeError("bad argument")
+
+        self.assertRaises(TypeError, RetryPolicy().call, ApiClient, "user_detail", endpoint, ("user-id",), {})
+        self.assertEqual(1, len(attempts))
+
+
+@unittest.skipIf(AsyncApiClient is None, "aiohttp is not installed")
+class TestAsyncRetryPolicy(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_reads(self):
+        with StubServer(failing_first(2)) as server:
+            async with AsyncApiClient(
+                    base_url=server.base_url,
+                    auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+                    layers=[RetryPolicy(base_delay=0.001)]) as api_client:
+                response = await api_client.user_detail("user-id")
+
+        self.assertEqual(1000, response["statusCode"])
+        self.assertEqual(3, len(server.requests))
+
+    async def test_retries_server_errors_without_status_code(self):
+        with StubServer(failing_first(1, (503, {"message": "upstream unavailable"}))) as server:
+            async with AsyncApiClient(
+                    base_url=server.base_url,
+                    auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+                    layers=[RetryPolicy(base_delay=0.001)]) as api_client:
+                response = await api_client.user_detail("user-id")
+
+        self.assertEqual(1000, response["statusCode"])
+        self.assertEqual(2, len(server.requests))
@@ -0,0 +1,71 @@
+import threading
+import time
+import unittest
+from unittest import mock
+import requests
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.session import PoolConfig, create_pooled_session
+from sdk.signature_generator import SignatureGenerator
+from tests.stub_server import StubServer
+
+
+class TestPooledSession(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def new_client(self, **kwargs):
+        return ApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            **kwargs)
+
+    def test_keeps_connection_alive_within_client(self):
+        api_client = self.new_client(pool_config=PoolConfig())
+        for _ in range(20):
+            self.assertEqual(1000, api_client.time()["statusCode"])
+
+        self.assertEqual(20, len(self.server.requests))
+        self.assertEqual(1, self.server.connections)
+
+    def test_shares_pooled_session_across_clients(self):
+        session = create_pooled_session(PoolConfig(max_connections_per_host=4))
+        api_clients = [self.new_client(client=session) for _ in range(8)]
+
+        def call(api_client):
+            for _ in range(10):
+                api_client.service_detail("service-id")
+
+        threads = [threading.Thread(target=call, args=(api_client,)) for api_client in api_clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(80, len(self.server.requests))
+        self.assertLessEqual(self.server.connections, 4)
+
+    def test_takes_client_positionally_as_uplink_consumer_does(self):
+        session = create_pooled_session()
+        with mock.patch.object(session, "request", wraps=session.request) as request:
+            ApiClient(self.server.base_url, session).time()
+
+        request.assert_called_once()
+        with self.assertRaises(TypeError):
+            ApiClient(self.server.base_url, session, (), None, (), PoolConfig())
+
+    def test_discards_connections_idle_longer_than_keep_alive_timeout(self):
+        api_client = self.new_client(pool_config=PoolConfig(keep_alive_timeout=0.05))
+        api_client.time()
+        time.sleep(0.1)
+        api_client.time()
+
+        self.assertEqual(2, self.server.connections)
+
+    def test_applies_read_timeout(self):
+        self.server.latency = 0.5
+        api_client = self.new_client(pool_config=PoolConfig(read_timeout=0.1))
+        with self.assertRaises(requests.exceptions.Timeout):
+            api_client.time()
@@ -1,5 +1,18 @@
 import unittest
-from sdk.signature_generator import SignatureGenerator
+import base64
+import hashlib
+import hmac
+import json
+import types
+from unittest import mock
+from sdk import signature_generator
+from sdk.api_client import ApiSignatureAuth
+from sdk.signature_generator import KeyedSigner, SignatureGenerator
+
+try:
+    from sdk import _speedups
+except ImportError:
+    _speedups = None
 
 
 class TestSignatureGenerator(unittest.TestCase):
@@ -33,3 +46,116 @@ class TestSignatureGenerator(unittest.TestCase):
         expected_sigature = "4L5BU0Ml/ejhzTg6Du12BDdElv8zoE7XD/iyOaZ2BHJIJG0SUOuCZWXu0YaF4i4C2CFJhjZoJFsje4CJn/wyyw=="
         actual_signature = SignatureGenerator().generate(secret, method, path, timestamp, nonce, body=request_body)
         self.assertEqual(expected_sigature, actual_signature)
+
+    def test_keyed_signer_matches_plain_hmac(self):
+        secret = "9256bf8a-2b86-42fe-b3e0-d3079d0141fe"
+        sign_target = b"Bp0IqgXE1581850266351GET/v1/wallets"
+        signer = KeyedSigner(secret)
+        expected = base64.b64encode(hmac.new(bytes(secret, 'utf-8'), sign_target, hashlib.sha512).digest()).decode('utf-8')
+        self.assertEqual(expected, signer.sign(sign_target))
+        # signing again must not be affected by the previous update
+        self.assertEqual(expected, signer.sign(sign_target))
+
+    def test_signer_is_built_once_per_secret(self):
+        signature_generator = SignatureGenerator()
+        signer = signature_generator.signer("secret-a")
+        self.assertIs(signer, signature_generator.signer("secret-a"))
+        self.assertIsNot(signer, signature_generator.signer("secret-b"))
+
+    def test_build_sign_target_with_documented_example(self):
+        expected = b"Bp0IqgXE1581850266351GET/v1/wallets/tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq/transactions?page=2&msgType=coin/MsgSend"
+        sign_target = SignatureGenerator().build_sign_target(
+            "get",
+            "/v1/wallets/tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq/transactions",
+            1581850266351,
+            "Bp0IqgXE",
+            {"page": 2, "msgType": "coin/MsgSend"})
+        self.assertEqual(expected, sign_target)
+
+    def test_generate_with_documented_example(self):
+        expected_sigature = "fasfnqKVVClFam+Dov+YN+rUfOo/PMZfgKx8E36YBtPh7gB2C+YJv4Hxl0Ey3g8lGD0ErEGnD0gqAt85iEhklQ=="
+        actual_signature = SignatureGenerator().generate(
+            "9256bf8a-2b86-42fe-b3e0-d3079d0141fe",
+            "GET",
+            "/v1/wallets/tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq/transactions",
+            1581850266351,
+            "Bp0IqgXE",
+            {"page": 2, "msgType": "coin/MsgSend"})
+        self.assertEqual(expected_sigature, actual_signature)
+
+    def test_build_sign_target_with_query_and_body(self):
+        expected = b"Bp0IqgXE1581850266351POST/v1/memos?page=1&memo=hello&walletAddress=tlink1"
+        sign_target = SignatureGenerator().build_sign_target(
+            "post", "/v1/memos", 1581850266351, "Bp0IqgXE", {"page": 1}, {"walletAddress": "tlink1", "memo": "hello"})
+        self.assertEqual(expected, sign_target)
+
+    def test_build_sign_target_without_parameters(self):
+        sign_target = SignatureGenerator().build_sign_target("GET", "/v1/wallets", 1581850266351, "Bp0IqgXE")
+        self.assertEqual(b"Bp0IqgXE1581850266351GET/v1/wallets", sign_target)
+
+    @unittest.skipIf(_speedups is None, "sdk._speedups is not built")
+    def test_generate_with_body_signs_and_encodes_in_one_pass(self):
+        secret = "9256bf8a-2b86-42fe-b3e0-d3079d0141fe"
+        request_body = {
+            "ownerAddress": "tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq",
+            "ownerSecret": "uhbdnNvIqQFnnIFDDG8EuVxtqkwsLtDR/owKInQIYmo=",
+            "name": "NewName"
+        }
+        (signature, encoded_body) = SignatureGenerator().generate_with_body(
+            secret, "put", "/v1/item-tokens/61e14383/non-fungibles/10000001/00000001", 1581850266351, "Bp0IqgXE",
+            body=request_body)
+
+        self.assertEqual("4L5BU0Ml/ejhzTg6Du12BDdElv8zoE7XD/iyOaZ2BHJIJG0SUOuCZWXu0YaF4i4C2CFJhjZoJFsje4CJn/wyyw==", signature)
+        self.assertEqual(request_body, json.loads(encoded_body))
+
+    def test_generate_with_body_leaves_bodies_to_client_without_speedups(self):
+        request_body = {"ownerAddress": "tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq", "name": "NewName"}
+        with mock.patch.object(signature_generator, "_speedups", None):
+            (signature, encoded_body) = SignatureGenerator().generate_with_body(
+                "9256bf8a-2b86-42fe-b3e0-d3079d0141fe", "PUT", "/v1/item-tokens/61e14383", 1581850266351, "Bp0IqgXE",
+                body=request_body)
+        self.assertEqual(SignatureGenerator().generate(
+            "9256bf8a-2b86-42fe-b3e0-d3079d0141fe", "PUT", "/v1/item-tokens/61e14383", 1581850266351, "Bp0IqgXE",
+            body=request_body), signature)
+        self.assertIsNone(encoded_body)
+
+    def test_generate_with_body_leaves_empty_bodies_to_client(self):
+        (signature, encoded_body) = SignatureGenerator().generate_with_body(
+            "9256bf8a-2b86-42fe-b3e0-d3079d0141fe",
+            "GET",
+            "/v1/wallets/tlink1fr9mpexk5yq3hu6jc0npajfsa0x7tl427fuveq/transactions",
+            1581850266351,
+            "Bp0IqgXE",
+            {"page": 2, "msgType": "coin/MsgSend"})
+        self.assertEqual("fasfnqKVVClFam+Dov+YN+rUfOo/PMZfgKx8E36YBtPh7gB2C+YJv4Hxl0Ey3g8lGD0ErEGnD0gqAt85iEhklQ==", signature)
+        self.assertIsNone(encoded_body)
+
+
+class GenerateOnlySignatureGenerator:
+    def __init__(self):
+        self.calls = []
+
+    def generate(self, secret, method, path, timestamp, nonce, query_params={}, body={}):
+        self.calls.append((secret, method, path, query_params, body))
+        return "signature"
+
+
+class TestApiSignatureAuth(unittest.TestCase):
+    def request_builder(self, body):
+        return types.SimpleNamespace(method="PUT", relative_url="/v1/item-tokens/61e14383",
+                                     info={"headers": {}, "params": {}, "data": body})
+
+    def test_signs_with_generators_implementing_only_generate(self):
+        signature_generator = GenerateOnlySignatureGenerator()
+        request_builder = self.request_builder({"name": "NewName"})
+        ApiSignatureAuth("test-api-key", "test-api-secret", signature_generator)(request_builder)
+
+        self.assertEqual([("test-api-secret", "PUT", "/v1/item-tokens/61e14383", {}, {"name": "NewName"})],
+                         signature_generator.calls)
+        self.assertEqual("signature", request_builder.info["headers"]["Signature"])
+        self.assertEqual({"name": "NewName"}, request_builder.info["data"])
+
+    def test_builds_signer_on_first_request(self):
+        auth = ApiSignatureAuth("test-api-key", None, SignatureGenerator())
+        with self.assertRaises(TypeError):
+            auth(self.request_builder({}))
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.signature_generator import SignatureGenerator
+from sdk.single_flight import SingleFlight
+from tests.stub_server import StubServer
+
+try:
+    from sdk.async_api_client import AsyncApiClient
+except ImportError:
+    AsyncApiClient = None
+
+
+def respond(method, path, query, body):
+    return {"statusCode": 1000, "responseData": {"path": path}}
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(respond, latency=0.2).__enter__()
+        self.single_flight = SingleFlight()
+        self.api_client = ApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            layers=[self.single_flight])
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_coalesces_concurrent_identical_reads(self):
+        barrier = threading.Barrier(20)
+
+        def read(index):
+            barrier.wait()
+            if index % 2:
+                return self.api_client.user_detail("user-id")
+            return self.api_client.user_detail(user_id="user-id")
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            responses = list(executor.map(read, range(20)))
+
+        self.assertEqual(1, len(self.server.requests))
+        self.assertTrue(all(response == responses[0] for response in responses))
+        self.assertEqual({"calls": 1, "coalesced": 19}, self.single_flight.stats())
+
+    def test_does_not_coalesce_different_arguments_or_sequential_calls(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(self.api_client.user_detail, ["user-1", "user-2"]))
+        self.api_client.user_detail("user-1")
+
+        self.assertEqual(3, len(self.server.requests))
+
+    def test_does_not_coalesce_writes(self):
+        self.assertNotIn("update_fungible_token", self.single_flight.endpoint_names(ApiClient))
+        self.assertIn("service_token_detail", self.single_flight.endpoint_names(ApiClient))
+
+    def test_shares_errors_with_waiters(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing_endpoint(user_id):
+            started.set()
+            release.wait()
+            raise ConnectionError("reset")
+
+        def read():
+            return self.single_flight.call(ApiClient, "user_detail", failing_endpoint, ("user-id",), {})
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(read)
+            started.wait()
+            waiter = executor.submit(read)
+            while self.single_flight.stats()["coalesced"] == 0:
+                pass
+            release.set()
+            self.assertRaises(ConnectionError, leader.result)
+            self.assertRaises(ConnectionError, waiter.result)
+
+
+@unittest.skipIf(AsyncApiClient is None, "aiohttp is not installed")
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_coalesces_concurrent_identical_reads(self):
+        with StubServer(respond, latency=0.2) as server:
+            single_flight = SingleFlight()
+            async with AsyncApiClient(
+                    base_url=server.base_url,
+                    auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+                    layers=[single_flight]) as api_client:
+                responses = await asyncio.gather(*(api_client.service_token_detail("a48f097b") for _ in range(20)))
+
+        self.assertEqual(1, len(server.requests))
+        self.assertTrue(all(response == responses[0] for response in responses))
+        self.assertEqual({"calls": 1, "coalesced": 19}, single_flight.stats())
+
+    async def test_cancelled_first_caller_does_not_fail_the_others(self):
+        with StubServer(respond, latency=0.2) as server:
+            single_flight = SingleFlight()
+            async with AsyncApiClient(
+                    base_url=server.base_url,
+                    auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+                    layers=[single_flight]) as api_client:
+                first = asyncio.ensure_future(asyncio.wait_for(api_client.service_token_detail("a48f097b"), 0.05))
+                await asyncio.sleep(0.01)
+                second = asyncio.ensure_future(api_client.service_token_detail("a48f097b"))
+                with self.assertRaises(asyncio.TimeoutError):
+                    await first
+                response = await second
+
+        self.assertEqual(1, len(server.requests))
+        self.assertEqual({"path": "/v1/service-tokens/a48f097b"}, response["responseData"])
+        self.assertEqual({"calls": 1, "coalesced": 1}, single_flight.stats())
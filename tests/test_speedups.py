@@ -0,0 +1,100 @@
+import json
+import random
+import string
+import unittest
+from unittest import mock
+from sdk import request_flattener, signature_generator
+from sdk.request_flattener import RequestBodyFlattener
+from sdk.signature_generator import SignatureGenerator
+
+try:
+    from sdk import _speedups
+except ImportError:
+    _speedups = None
+
+
+def random_text(rng, max_length=12):
+    alphabet = string.ascii_letters + string.digits + "/=+-_ .,&?é한"
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length)))
+
+
+def random_body(rng):
+    body = {}
+    for _ in range(rng.randint(0, 6)):
+        body[random_text(rng, 8) or "key"] = random_text(rng, 40)
+    for list_key in rng.sample(["mintList", "transferList", "itemList"], rng.randint(0, 2)):
+        lkeys = ["tokenType", "name", "meta", "tokenId", random_text(rng, 5) or "x"]
+        body[list_key] = [
+            {lkey: rng.choice([random_text(rng), rng.randint(0, 10 ** 6)]) for lkey in lkeys if rng.random() < 0.6}
+            for _ in range(rng.randint(0, 20))
+        ]
+    return body
+
+
+def random_query(rng):
+    return {random_text(rng, 8) or "page": rng.choice([random_text(rng), rng.randint(0, 100)]) for _ in range(rng.randint(0, 4))}
+
+
+@unittest.skipIf(_speedups is None, "sdk._speedups is not built")
+class TestSpeedupsParity(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(20210109)
+
+    def tearDown(self):
+        pass
+
+    def python_flatten(self, body):
+        with mock.patch.object(request_flattener, "_speedups", None):
+            return RequestBodyFlattener().flatten(body)
+
+    def python_sign_target(self, *args):
+        with mock.patch.object(request_flattener, "_speedups", None), mock.patch.object(signature_generator, "_speedups", None):
+            return SignatureGenerator().build_sign_target(*args)
+
+    def test_flatten_parity_with_random_bodies(self):
+        for _ in range(2000):
+            body = random_body(self.rng)
+            self.assertEqual(self.python_flatten(body), _speedups.flatten(body), body)
+
+    def test_build_sign_target_parity_with_random_requests(self):
+        for _ in range(2000):
+            args = (
+                self.rng.choice(["get", "POST", "put"]),
+                "/v1/" + random_text(self.rng, 20),
+                self.rng.randint(0, 10 ** 13),
+                random_text(self.rng, 8),
+                random_query(self.rng),
+                random_body(self.rng)
+            )
+            self.assertEqual(self.python_sign_target(*args), _speedups.build_sign_target(*args), args)
+
+    def test_flatten_and_encode_parity_with_random_bodies(self):
+        for _ in range(2000):
+            body = random_body(self.rng)
+            with mock.patch.object(request_flattener, "_speedups", None):
+                python = RequestBodyFlattener().flatten_and_encode(body)
+            native = _speedups.flatten_and_encode(body)
+            if native is None:
+                # list values other than str are left to the Python path.
+                self.assertTrue(any(not isinstance(value, str)
+                                    for ele in body.values() if isinstance(ele, list) for item in ele for value in item.values()))
+                continue
+            self.assertEqual(python, native, body)
+            self.assertEqual(self.python_flatten(body), native[0])
+            self.assertEqual(body, json.loads(native[1]))
+
+    def test_unsupported_bodies_fall_back_to_python(self):
+        self.assertIsNone(_speedups.flatten({"amount": 1}))
+        self.assertIsNone(_speedups.flatten({"mintList": ["not-a-dict"]}))
+        self.assertIsNone(_speedups.flatten({1: "numeric-key"}))
+        with self.assertRaises(TypeError):
+            RequestBodyFlattener().flatten({"amount": 1})
+
+    def test_signature_is_same_with_and_without_native_path(self):
+        secret = "9256bf8a-2b86-42fe-b3e0-d3079d0141fe"
+        for _ in range(200):
+            args = ("post", "/v1/memos", self.rng.randint(0, 10 ** 13), random_text(self.rng, 8), random_query(self.rng), random_body(self.rng))
+            native = SignatureGenerator().generate(secret, *args)
+            with mock.patch.object(request_flattener, "_speedups", None), mock.patch.object(signature_generator, "_speedups", None):
+                python = SignatureGenerator().generate(secret, *args)
+            self.assertEqual(python, native)
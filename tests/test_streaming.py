@@ -0,0 +1,137 @@
+import json
+import unittest
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.exceptions import ApiResponseError
+from sdk.records import TransactionSummary
+from sdk.retry import RetryPolicy
+from sdk.signature_generator import SignatureGenerator
+from sdk.streaming import StreamingListDecoder
+from tests.stub_server import StubServer
+
+try:
+    from aiohttp import web
+    from sdk.async_api_client import AsyncApiClient
+except ImportError:
+    web = None
+
+BODY = {
+    "statusCode": 1000,
+    "statusMessage": "Success",
+    "responseData": [{"txhash": f"TX{index}", "height": index, "tx": {"value": {"msg": [], "memo": "quote \" ] } 한글"}}}
+                     for index in range(200)]
+}
+
+
+def respond(method, path, query, body):
+    if path.startswith("/v1/users/missing"):
+        return {"statusCode": 4040, "statusMessage": "Not found", "responseData": None}
+    return BODY
+
+
+class TestStreamingListDecoder(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def decode(self, raw, chunk_size):
+        decoder = StreamingListDecoder()
+        records = []
+        for start in range(0, len(raw), chunk_size):
+            decoder.feed(raw[start:start + chunk_size])
+            records += decoder.records()
+        return records, decoder.close()
+
+    def test_decodes_records_split_at_any_byte(self):
+        body = dict(BODY, responseData=BODY["responseData"][:20] + [1, "s", None, 2.5, -1e5], after={"list": [1, 2]})
+        raw = json.dumps(body, ensure_ascii=False, indent=1).encode("utf-8")
+        for chunk_size in (1, 2, 3, 7, 64, len(raw)):
+            (records, response) = self.decode(raw, chunk_size)
+            self.assertEqual(body["responseData"], records, chunk_size)
+            self.assertEqual(dict(body, responseData=[]), response)
+
+    def test_yields_records_before_the_body_is_complete(self):
+        decoder = StreamingListDecoder()
+        decoder.feed(b'{"statusCode":1000,"responseData":[{"txhash":"TX0"},{"txha')
+        self.assertEqual([{"txhash": "TX0"}], list(decoder.records()))
+
+    def test_keeps_non_list_response_data(self):
+        (records, response) = self.decode(b'{"statusCode":4040,"responseData":null}', 5)
+        self.assertEqual([], records)
+        self.assertEqual({"statusCode": 4040, "responseData": None}, response)
+
+    def test_raises_on_cut_body(self):
+        decoder = StreamingListDecoder()
+        decoder.feed(b'{"statusCode":1000,"responseData":[{"txhash":"TX0"},{"txha')
+        list(decoder.records())
+        with self.assertRaises(json.JSONDecodeError):
+            decoder.close()
+
+
+class TestStream(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(respond).__enter__()
+        self.retry_policy = RetryPolicy()
+        self.api_client = ApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            layers=[self.retry_policy])
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_streams_records(self):
+        records = self.api_client.stream("user_transactions", "user-id", limit=200, chunk_size=256)
+        self.assertEqual([], self.server.requests)
+
+        self.assertEqual(BODY["responseData"], list(records))
+        (method, path, query, headers, _) = self.server.requests[0]
+        self.assertEqual(("GET", "/v1/users/user-id/transactions", "200"), (method, path, query["limit"]))
+        self.assertIn("Signature", headers)
+
+    def test_streams_record_types(self):
+        records = list(self.api_client.stream("user_transactions", "user-id", record_type=TransactionSummary))
+        self.assertEqual(TransactionSummary("TX1", 1, memo="quote \" ] } 한글"), records[1])
+
+    def test_raises_after_records_of_failed_response(self):
+        with self.assertRaises(ApiResponseError) as context:
+            list(self.api_client.stream("user_transactions", "missing"))
+        self.assertEqual(4040, context.exception.status_code)
+
+    def test_session_is_reusable_after_stopping_early(self):
+        records = self.api_client.stream("user_transactions", "user-id", chunk_size=256)
+        next(records)
+        records.close()
+        self.assertEqual(BODY, self.api_client.user_transactions("user-id"))
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncStream(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        async def handle(request):
+            return web.json_response(respond(request.method, request.path, dict(request.query), None))
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.api_client = AsyncApiClient(
+            base_url=f"http://127.0.0.1:{port}",
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()))
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+        await self.runner.cleanup()
+
+    async def test_streams_records(self):
+        records = [record async for record in self.api_client.stream("user_transactions", "user-id", chunk_size=256)]
+        self.assertEqual(BODY["responseData"], records)
+        self.assertEqual(BODY, await self.api_client.user_transactions("user-id"))
+
+    async def test_raises_after_records_of_failed_response(self):
+        with self.assertRaises(ApiResponseError):
+            [record async for record in self.api_client.stream("user_transactions", "missing")]
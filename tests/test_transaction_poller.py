@@ -0,0 +1,119 @@
+import threading
+import time
+import unittest
+from concurrent.futures import wait
+from sdk.exceptions import TransactionFailedError, TransactionTimeoutError
+from sdk.transaction_poller import TransactionPoller
+
+
+class FakeTransactionApiClient:
+    def __init__(self, polls_until_committed, code=0, latency=0.0):
+        self.polls_until_committed = polls_until_committed
+        self.code = code
+        self.latency = latency
+        self.polls = {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def transaction_result(self, tx_hash):
+        with self.lock:
+            self.polls[tx_hash] = self.polls.get(tx_hash, 0) + 1
+            polls = self.polls[tx_hash]
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+        if polls == 1 and tx_hash == "FLAKY":
+            raise ConnectionError("connection reset")
+        if polls < self.polls_until_committed:
+            return {"statusCode": 4040, "statusMessage": "Transaction not found", "responseData": None}
+        return {"statusCode": 1000, "responseData": {"txhash": tx_hash, "code": self.code}}
+
+
+class TestTransactionPoller(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def new_poller(self, api_client, **kwargs):
+        options = dict(initial_delay=0.01, max_delay=0.05, multiplier=2, timeout=5)
+        options.update(kwargs)
+        return TransactionPoller(api_client, **options)
+
+    def test_resolves_many_transactions_with_shared_concurrency_cap(self):
+        api_client = FakeTransactionApiClient(polls_until_committed=3, latency=0.005)
+        with self.new_poller(api_client, max_concurrency=4) as poller:
+            futures = [poller.submit(f"TX{index}") for index in range(50)]
+            done, not_done = wait(futures, timeout=10)
+
+        self.assertEqual(set(), not_done)
+        for index, future in enumerate(futures):
+            self.assertEqual(f"TX{index}", future.result()["responseData"]["txhash"])
+        self.assertEqual({3}, set(api_client.polls.values()))
+        self.assertLessEqual(api_client.max_in_flight, 4)
+
+    def test_does_not_use_a_thread_per_pending_transaction(self):
+        api_client = FakeTransactionApiClient(polls_until_committed=10 ** 6)
+        threads_before = threading.active_count()
+        with self.new_poller(api_client, max_concurrency=2, max_delay=1) as poller:
+            for index in range(200):
+                poller.submit(f"TX{index}")
+            time.sleep(0.2)
+            self.assertLessEqual(threading.active_count() - threads_before, 3)
+
+    def test_fails_future_of_failed_transaction_and_calls_callback(self):
+        api_client = FakeTransactionApiClient(polls_until_committed=1, code=5)
+        resolved = threading.Event()
+        with self.new_poller(api_client) as poller:
+            future = poller.submit("TX", callback=lambda future: resolved.set())
+            self.assertTrue(resolved.wait(5))
+
+        with self.assertRaises(TransactionFailedError) as context:
+            future.result()
+        self.assertEqual(5, context.exception.code)
+
+    def test_keeps_polling_after_transient_error(self):
+        api_client = FakeTransactionApiClient(polls_until_committed=2)
+        with self.new_poller(api_client) as poller:
+            self.assertEqual(1000, poller.submit("FLAKY").result(timeout=5)["statusCode"])
+
+    def test_times_out_pending_transaction(self):
+        api_client = FakeTransactionApiClient(polls_until_committed=10 ** 6)
+        with self.new_poller(api_client, timeout=0.1) as poller:
+            future = poller.submit("TX")
+            with self.assertRaises(TransactionTimeoutError):
+                future.result(timeout=5)
+
+    def test_backs_off_between_polls(self):
+        api_client = FakeTransactionApiClient(polls_until_committed=10 ** 6)
+        with self.new_poller(api_client, initial_delay=0.01, max_delay=0.16, timeout=0.5) as poller:
+            with self.assertRaises(TransactionTimeoutError):
+                poller.submit("TX").result(timeout=5)
+        # 0.01 + 0.02 + 0.04 + 0.08 + 0.16 * n, instead of 50 polls at a fixed 10ms
+        self.assertLess(api_client.polls["TX"], 10)
+
+    def test_cancelling_a_future_mid_poll_leaves_others_resolving(self):
+        api_client = FakeTransactionApiClient(polls_until_committed=1, latency=0.1)
+        with self.new_poller(api_client, initial_delay=0.01) as poller:
+            cancelled = poller.submit("TX-CANCELLED")
+            while "TX-CANCELLED" not in api_client.polls:
+                time.sleep(0.005)
+            self.assertTrue(cancelled.cancel())
+            other = poller.submit("TX-OTHER")
+
+            self.assertEqual(1000, other.result(timeout=5)["statusCode"])
+        self.assertTrue(cancelled.cancelled())
+
+    def test_close_cancels_pending_transactions(self):
+        api_client = FakeTransactionApiClient(polls_until_committed=10 ** 6)
+        poller = self.new_poller(api_client, initial_delay=10, max_delay=10)
+        future = poller.submit("TX")
+        poller.close()
+
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(RuntimeError):
+            poller.submit("TX")
@@ -0,0 +1,83 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from sdk.api_client import ApiClient, ApiSignatureAuth
+from sdk.signature_generator import SignatureGenerator
+from sdk.transaction_store import TransactionResultStore
+from tests.stub_server import StubServer
+
+TX_HASH = "61AB8A054D47CA05E4ABE591B929282CBCD7DACD5A4C8259020C566F0EC186BE"
+
+
+def respond(method, path, query, body):
+    if path.endswith("/PENDING"):
+        return 404, {"statusCode": 4040, "statusMessage": "Transaction not found", "responseData": None}
+    if path.startswith("/v1/memos/"):
+        return {"statusCode": 1000, "responseData": {"memo": "hello"}}
+    return {"statusCode": 1000, "responseData": {"txhash": path.rsplit("/", 1)[1], "code": 0}}
+
+
+def store_in_process(path, tx_hashes):
+    store = TransactionResultStore(path)
+    for tx_hash in tx_hashes:
+        store.put("transaction_result", tx_hash, {"statusCode": 1000, "responseData": {"txhash": tx_hash}})
+    store.close()
+
+
+class TestTransactionResultStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "transactions.db")
+        self.server = StubServer(respond).__enter__()
+        self.store = TransactionResultStore(self.path)
+        self.api_client = ApiClient(
+            base_url=self.server.base_url,
+            auth=ApiSignatureAuth("test-api-key", "test-api-secret", SignatureGenerator()),
+            layers=[self.store])
+
+    def tearDown(self):
+        self.store.close()
+        self.server.__exit__(None, None, None)
+        self.directory.cleanup()
+
+    def test_warm_lookups_do_not_touch_network(self):
+        first = self.api_client.transaction_result(TX_HASH)
+        memo = self.api_client.get_memo(TX_HASH)
+        self.assertEqual(2, len(self.server.requests))
+
+        self.assertEqual(first, self.api_client.transaction_result(TX_HASH))
+        self.assertEqual(first, self.api_client.transaction_result(TX_HASH.lower()))
+        self.assertEqual(memo, self.api_client.get_memo(tx_hash=TX_HASH))
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual({"hits": 3, "misses": 2}, self.store.stats())
+
+    def test_pending_transactions_are_not_stored(self):
+        self.api_client.transaction_result("PENDING")
+        self.api_client.transaction_result("PENDING")
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_survives_reopen(self):
+        self.api_client.transaction_result(TX_HASH)
+        reopened = TransactionResultStore(self.path)
+        self.assertEqual(TX_HASH, reopened.get("transaction_result", TX_HASH)["responseData"]["txhash"])
+        reopened.close()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_shared_by_worker_processes(self):
+        self.api_client.transaction_result(TX_HASH)
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=store_in_process, args=(self.path, [f"TX{worker}-{index}" for index in range(50)]))
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(0, process.exitcode)
+
+        for worker in range(4):
+            for index in range(50):
+                self.assertIsNotNone(self.store.get("transaction_result", f"TX{worker}-{index}"))
+        self.assertIsNotNone(self.store.get("transaction_result", TX_HASH))
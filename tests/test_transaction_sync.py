@@ -0,0 +1,68 @@
+import unittest
+from sdk.checkpoint import MemoryCheckpointStore
+from sdk.transaction_sync import TransactionSyncer
+
+
+class FakeTransactionsApiClient:
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.calls = []
+
+    def __page(self, owner, limit, page, order_by, after):
+        self.calls.append((owner, limit, page, order_by, after))
+        matched = sorted((tx for tx in self.transactions if after is None or tx["timestamp"] > after), key=lambda tx: tx["timestamp"])
+        start = (page - 1) * limit
+        return {"statusCode": 1000, "responseData": matched[start:start + limit]}
+
+    def service_wallet_transactions(self, wallet_address, limit=10, page=1, order_by="desc", before=None, after=None):
+        return self.__page(wallet_address, limit, page, order_by, after)
+
+    def user_transactions(self, user_id, limit=10, page=1, order_by="desc", before=None, after=None):
+        return self.__page(user_id, limit, page, order_by, after)
+
+
+def transaction(txhash, timestamp):
+    return {"txhash": txhash, "timestamp": timestamp}
+
+
+class TestTransactionSyncer(unittest.TestCase):
+    def setUp(self):
+        self.api_client = FakeTransactionsApiClient([transaction(f"TX{index}", 1000 + index) for index in range(25)])
+        self.syncer = TransactionSyncer(self.api_client, MemoryCheckpointStore(), limit=10, checkpoint_every=7)
+
+    def tearDown(self):
+        pass
+
+    def test_first_sync_emits_full_history_oldest_first(self):
+        synced = [tx["txhash"] for tx in self.syncer.sync_wallet("tlink1")]
+
+        self.assertEqual([f"TX{index}" for index in range(25)], synced)
+        self.assertEqual({"timestamp": 1024, "txhashes": ["TX24"]}, self.syncer.checkpoint("wallet:tlink1"))
+        self.assertEqual(("tlink1", 10, 1, "asc", None), self.api_client.calls[0])
+
+    def test_next_sync_fetches_only_newer_transactions(self):
+        list(self.syncer.sync_user("user-id"))
+        self.api_client.transactions += [transaction("TX25", 1024), transaction("TX26", 1030)]
+        self.api_client.calls.clear()
+
+        synced = [tx["txhash"] for tx in self.syncer.sync_user("user-id")]
+
+        self.assertEqual(["TX25", "TX26"], synced)
+        self.assertEqual(1023, self.api_client.calls[0][4])
+        self.assertEqual([], list(self.syncer.sync_user("user-id")))
+
+    def test_stopped_sync_resumes_from_last_processed_transaction(self):
+        stream = self.syncer.sync_wallet("tlink1")
+        for _ in range(12):
+            next(stream)
+        stream.close()
+
+        # the twelfth transaction was handed out but not yet processed
+        self.assertEqual({"timestamp": 1010, "txhashes": ["TX10"]}, self.syncer.checkpoint("wallet:tlink1"))
+        synced = [tx["txhash"] for tx in self.syncer.sync_wallet("tlink1")]
+        self.assertEqual([f"TX{index}" for index in range(11, 25)], synced)
+
+    def test_wallets_and_users_have_separate_checkpoints(self):
+        list(self.syncer.sync_wallet("tlink1"))
+        self.assertIsNone(self.syncer.checkpoint("user:tlink1"))
+        self.assertEqual(25, len(list(self.syncer.sync_user("tlink1"))))
@@ -0,0 +1,105 @@
+import itertools
+import threading
+import time
+import unittest
+from sdk.exceptions import ApiResponseError
+from sdk.transfer_aggregator import TransferAggregator
+
+
+class FakeTransferApiClient:
+    def __init__(self, status_code=1002):
+        self.status_code = status_code
+        self.lock = threading.Lock()
+        self.sequence = itertools.count()
+        self.calls = []
+
+    def __batch_transfer(self, kind, source, contract_id, transfer_request):
+        with self.lock:
+            self.calls.append((kind, source, contract_id, transfer_request))
+            tx_hash = f"TX{next(self.sequence)}"
+        if self.status_code != 1002:
+            return {"statusCode": self.status_code, "statusMessage": "Bad request"}
+        return {"statusCode": 1002, "responseData": {"txHash": tx_hash}}
+
+    def service_wallet_batch_transfer_nonfungible_token(self, wallet_address, contract_id, transfer_request):
+        return self.__batch_transfer("wallet", wallet_address, contract_id, transfer_request)
+
+    def batch_transfer_user_non_fungible_token(self, user_id, contract_id, transfer_request):
+        return self.__batch_transfer("user", user_id, contract_id, transfer_request)
+
+
+WALLET_REQUEST = {"walletSecret": "wallet-secret", "toAddress": "tlink1recipient"}
+
+
+class TestTransferAggregator(unittest.TestCase):
+    def test_coalesces_transfers_of_a_window_into_one_batch(self):
+        api_client = FakeTransferApiClient()
+        with TransferAggregator(api_client, window=0.05) as aggregator:
+            futures = [
+                aggregator.transfer_from_wallet("tlink1wallet", "contract-id", "10000001", f"{index:08x}", WALLET_REQUEST)
+                for index in range(1, 11)
+            ]
+            tx_hashes = {future.result(timeout=5) for future in futures}
+
+        self.assertEqual({"TX0"}, tx_hashes)
+        self.assertEqual(1, len(api_client.calls))
+        (kind, source, contract_id, transfer_request) = api_client.calls[0]
+        self.assertEqual(("wallet", "tlink1wallet", "contract-id"), (kind, source, contract_id))
+        self.assertEqual("wallet-secret", transfer_request["walletSecret"])
+        self.assertEqual({"tokenId": "1000000100000001"}, transfer_request["transferList"][0])
+        self.assertEqual(10, len(transfer_request["transferList"]))
+
+    def test_groups_by_source_contract_and_recipient(self):
+        api_client = FakeTransferApiClient()
+        other_recipient = {"walletSecret": "wallet-secret", "toUserId": "user-id"}
+        user_request = {"ownerAddress": "tlink1owner", "ownerSecret": "owner-secret", "toAddress": "tlink1recipient"}
+        with TransferAggregator(api_client, window=0.05) as aggregator:
+            futures = [
+                aggregator.transfer_from_wallet("tlink1wallet", "contract-id", "10000001", "00000001", WALLET_REQUEST),
+                aggregator.transfer_from_wallet("tlink1wallet", "contract-id", "10000001", "00000002", other_recipient),
+                aggregator.transfer_from_wallet("tlink1wallet", "other-contract", "10000001", "00000003", WALLET_REQUEST),
+                aggregator.transfer_from_wallet("tlink1other", "contract-id", "10000001", "00000004", WALLET_REQUEST),
+                aggregator.transfer_from_user("user-id", "contract-id", "10000001", "00000005", user_request),
+                aggregator.transfer_from_user("user-id", "contract-id", "10000001", "00000006", user_request),
+            ]
+            tx_hashes = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(5, len(api_client.calls))
+        self.assertEqual(5, len(set(tx_hashes)))
+        self.assertEqual(tx_hashes[4], tx_hashes[5])
+        user_calls = [call for call in api_client.calls if call[0] == "user"]
+        self.assertEqual(2, len(user_calls[0][3]["transferList"]))
+
+    def test_sends_full_batches_without_waiting(self):
+        api_client = FakeTransferApiClient()
+        aggregator = TransferAggregator(api_client, window=10, max_batch=3)
+        started = time.monotonic()
+        futures = [
+            aggregator.transfer_from_wallet("tlink1wallet", "contract-id", "10000001", f"{index:08x}", WALLET_REQUEST)
+            for index in range(3)
+        ]
+        for future in futures:
+            future.result(timeout=5)
+
+        self.assertLess(time.monotonic() - started, 1)
+        aggregator.close()
+        self.assertEqual(1, len(api_client.calls))
+
+    def test_close_sends_buffered_transfers(self):
+        api_client = FakeTransferApiClient()
+        aggregator = TransferAggregator(api_client, window=10)
+        future = aggregator.transfer_from_wallet("tlink1wallet", "contract-id", "10000001", "00000001", WALLET_REQUEST)
+        aggregator.close()
+
+        self.assertEqual("TX0", future.result(timeout=0))
+        self.assertRaises(RuntimeError, aggregator.transfer_from_wallet,
+                          "tlink1wallet", "contract-id", "10000001", "00000002", WALLET_REQUEST)
+
+    def test_fails_every_transfer_of_a_rejected_batch(self):
+        with TransferAggregator(FakeTransferApiClient(status_code=4000), window=0.01) as aggregator:
+            futures = [
+                aggregator.transfer_from_wallet("tlink1wallet", "contract-id", "10000001", f"{index:08x}", WALLET_REQUEST)
+                for index in range(2)
+            ]
+            for future in futures:
+                self.assertRaises(ApiResponseError, future.result, 5)